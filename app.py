@@ -26,9 +26,9 @@ SCRIPT_V7 = PROJECT_DIR / "v6-v10" / "source_eval_v7.py"
 # Detect if running on Vercel (serverless) vs local/Railway (server)
 IS_VERCEL = os.environ.get("VERCEL", "") == "1"
 
-# On Vercel, only /tmp is writable; locally use project dir
+# On Vercel, only /tmp is writable; locally use project dir.
+# v6 and v7 share one cache, so a URL fetched by either pipeline is reused by the other.
 CACHE_DIR = Path("/tmp/.cache_web_eval") if IS_VERCEL else PROJECT_DIR / ".cache_web_eval"
-CACHE_DIR_V7 = Path("/tmp/.cache_narrative") if IS_VERCEL else PROJECT_DIR / ".cache_narrative"
 
 # Find Python: use local venv if available, otherwise system python
 _venv_python = PROJECT_DIR / ".venv312" / "bin" / "python3"
@@ -37,6 +37,17 @@ PYTHON = str(_venv_python) if _venv_python.exists() else sys.executable
 # Max URLs per request on Vercel (must complete within function timeout)
 VERCEL_MAX_URLS = 10
 
+# Parallel fetch workers passed to the evaluator subprocesses
+FETCH_CONCURRENCY = "4" if IS_VERCEL else "8"
+
+# LRU eviction threshold for the shared cache (Vercel's /tmp is small)
+CACHE_MAX_BYTES = str(200 * 1024 * 1024) if IS_VERCEL else str(2 * 1024 * 1024 * 1024)
+
+# Per-job LLM spend ceilings passed to the evaluator subprocesses ("" = no ceiling);
+# past them the evaluators fall back to heuristics
+MAX_LLM_TOKENS = os.environ.get("MAX_LLM_TOKENS", "")
+MAX_LLM_COST = os.environ.get("MAX_LLM_COST", "")  # USD
+
 # ── In-memory job store (only used for local/Railway async mode) ──
 jobs: dict = {}
 
@@ -63,6 +74,25 @@ async def legacy_index():
 # v7 Narrative Map API
 # =============================================================================
 
+def _llm_budget_args(usage_json: str = "") -> list:
+    """--max-llm-tokens / --max-llm-cost, and --usage-json for live per-stage spend."""
+    args = ["--usage-json", usage_json] if usage_json else []
+    if MAX_LLM_TOKENS:
+        args.extend(["--max-llm-tokens", MAX_LLM_TOKENS])
+    if MAX_LLM_COST:
+        args.extend(["--max-llm-cost", MAX_LLM_COST])
+    return args
+
+
+def _read_llm_usage(usage_json: str):
+    """Per-stage LLM spend written by the evaluator, or None before its first request."""
+    try:
+        with open(usage_json, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
 def _extract_urls_from_text(text: str) -> list:
     """Extract URLs from works-cited text or plain URL list."""
     urls = []
@@ -99,12 +129,14 @@ def _run_narrative_sync(source_text: str, country: str) -> dict:
         cmd = [
             str(PYTHON), str(SCRIPT_V7),
             "--works-cited", tmp.name,
-            "--cache-dir", str(CACHE_DIR_V7),
+            "--cache-dir", str(CACHE_DIR),
             "--out-json", out_json,
             "--out-md", out_md,
             "--sleep-s", sleep_s,
             "--timeout-s", timeout_s,
-        ]
+            "--concurrency", FETCH_CONCURRENCY,
+            "--cache-max-bytes", CACHE_MAX_BYTES,
+        ] + _llm_budget_args()  # v7 reports its spend in the output JSON
         if country:
             cmd.extend(["--country", country])
 
@@ -170,14 +202,22 @@ async def narrative_map(
 # v6 Legacy Source Evaluator API (kept for backwards compatibility)
 # =============================================================================
 
-def _run_evaluation_sync(urls: list, intended_use: str, use_llm: bool) -> dict:
+INTENDED_USES = ("A", "B", "C", "ALL")  # ALL: one pass, per-use permission triplet
+
+
+def _run_evaluation_sync(urls: list, intended_use: str, use_llm: bool, usage_json: str = "") -> dict:
     """
     Run source evaluation synchronously via subprocess.
-    Returns dict with 'results' or 'error'.
+    Returns dict with 'results' or 'error', and 'llm_usage' (spend per stage).
+    The evaluator keeps `usage_json` up to date while it runs; the caller
+    removes it.
     """
     tmp = None
     out_json = None
     out_md = None
+    own_usage_json = not usage_json
+    if own_usage_json:
+        usage_json = tempfile.mktemp(suffix=".usage.json")
     try:
         # Write URLs to a temp file
         tmp = tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False)
@@ -204,7 +244,9 @@ def _run_evaluation_sync(urls: list, intended_use: str, use_llm: bool) -> dict:
             "--sleep-s", sleep_s,
             "--timeout-s", timeout_s,
             "--max-aux-pages", max_aux,
-        ]
+            "--concurrency", FETCH_CONCURRENCY,
+            "--cache-max-bytes", CACHE_MAX_BYTES,
+        ] + _llm_budget_args(usage_json)
         if not use_llm:
             cmd.append("--no-llm")
 
@@ -224,7 +266,7 @@ def _run_evaluation_sync(urls: list, intended_use: str, use_llm: bool) -> dict:
         if os.path.exists(out_json):
             with open(out_json, "r") as f:
                 result_dicts = json.load(f)
-            return {"results": result_dicts, "error": None}
+            return {"results": result_dicts, "error": None, "llm_usage": _read_llm_usage(usage_json)}
         else:
             stderr = result.stderr[:2000] if result.stderr else "No output produced"
             stdout = result.stdout[:2000] if result.stdout else ""
@@ -238,7 +280,7 @@ def _run_evaluation_sync(urls: list, intended_use: str, use_llm: bool) -> dict:
     except Exception as e:
         return {"results": [], "error": str(e)}
     finally:
-        for f in [tmp.name if tmp else None, out_json, out_md]:
+        for f in [tmp.name if tmp else None, out_json, out_md, usage_json if own_usage_json else None]:
             if f:
                 try:
                     os.unlink(f)
@@ -258,6 +300,8 @@ async def evaluate(
 
     if not url_list:
         return JSONResponse({"error": "No valid URLs provided"}, status_code=400)
+    if intended_use.upper() not in INTENDED_USES:
+        return JSONResponse({"error": "intended_use must be A, B, C or all"}, status_code=400)
 
     max_urls = VERCEL_MAX_URLS if IS_VERCEL else 200
     if len(url_list) > max_urls:
@@ -286,6 +330,7 @@ async def evaluate(
         "total": len(url_list),
         "completed": len(result["results"]),
         "results": result["results"],
+        "llm_usage": result.get("llm_usage"),
         "error": None,
     }
 
@@ -303,6 +348,8 @@ async def start_evaluation_async(
 
     if not url_list:
         return JSONResponse({"error": "No valid URLs provided"}, status_code=400)
+    if intended_use.upper() not in INTENDED_USES:
+        return JSONResponse({"error": "intended_use must be A, B, C or all"}, status_code=400)
     if len(url_list) > 200:
         return JSONResponse({"error": "Maximum 200 URLs per batch"}, status_code=400)
 
@@ -313,6 +360,8 @@ async def start_evaluation_async(
         "completed": 0,
         "results": [],
         "started_at": time.time(),
+        "usage_json": tempfile.mktemp(suffix=".usage.json"),
+        "llm_usage": None,
         "error": None,
     }
 
@@ -324,7 +373,13 @@ async def start_evaluation_async(
 
 
 def _run_evaluation_job(job_id: str, urls: list, intended_use: str, use_llm: bool):
-    result = _run_evaluation_sync(urls, intended_use, use_llm)
+    usage_json = jobs[job_id]["usage_json"]
+    result = _run_evaluation_sync(urls, intended_use, use_llm, usage_json)
+    jobs[job_id]["llm_usage"] = _read_llm_usage(usage_json)
+    try:
+        os.unlink(usage_json)
+    except OSError:
+        pass
     if result["error"]:
         jobs[job_id]["status"] = "error"
         jobs[job_id]["error"] = result["error"]
@@ -339,10 +394,13 @@ async def job_status(job_id: str):
     job = jobs.get(job_id)
     if not job:
         return JSONResponse({"error": "Job not found"}, status_code=404)
+    # Live LLM spend while the evaluator runs, final totals afterwards
+    llm_usage = job["llm_usage"] if job["status"] != "running" else _read_llm_usage(job["usage_json"])
     return {
         "status": job["status"],
         "total": job["total"],
         "completed": job["completed"],
+        "llm_usage": llm_usage,
         "error": job["error"],
     }
 
@@ -357,6 +415,7 @@ async def job_results(job_id: str):
         "total": job["total"],
         "completed": job["completed"],
         "results": job["results"],
+        "llm_usage": job["llm_usage"],
         "error": job["error"],
     }
 
@@ -25,19 +25,30 @@ Output labels:
 
 from __future__ import annotations
 
+import abc
 import argparse
+import asyncio
+import contextlib
 import dataclasses
+import gzip
 import hashlib
+import io
+import itertools
 import json
 import logging
 import os
+import random
 import re
+import sqlite3
 import sys
+import threading
 import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from urllib.parse import urljoin, urlparse
 
 import requests
@@ -50,6 +61,12 @@ try:
 except ImportError:
     HAS_TLDEXTRACT = False
 
+try:
+    import lxml.html
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
 try:
     from readability import Document
     HAS_READABILITY = True
@@ -62,6 +79,24 @@ try:
 except ImportError:
     HAS_PDFMINER = False
 
+try:
+    import zstandard
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
+
+try:
+    import httpx
+    HAS_HTTPX = True
+except ImportError:
+    HAS_HTTPX = False
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
 try:
     from openai import OpenAI
     HAS_OPENAI = True
@@ -69,6 +104,7 @@ except ImportError:
     HAS_OPENAI = False
 
 try:
+    import anthropic
     from anthropic import Anthropic
     HAS_ANTHROPIC = True
 except ImportError:
@@ -89,6 +125,24 @@ except Exception:
 # -----------------------------------------------------------------------------
 DEFAULT_TIMEOUT_S = 25
 DEFAULT_SLEEP_S = 0.8
+DEFAULT_CONCURRENCY = 1  # Parallel fetch workers (1 = legacy sequential run)
+DEFAULT_PUBLISHER_MAX_AGE_S = 30 * 24 * 3600  # Publisher profiles change slowly
+DEFAULT_DOMAIN_VERDICT_MAX_AGE_S = 30 * 24 * 3600  # Outlet-level LLM verdicts (satire, source type)
+DOMAIN_VERDICT_MIN_CONFIDENCE = 0.5  # agreeing / (all votes + 1): one vote suffices, a dissent needs a re-ask
+DEFAULT_CACHE_DIR = ".cache_hrf_eval"  # Shared by the v6 evaluator and the v7 narrative map
+
+# Cache TTLs per fetch outcome (seconds). Negative entries expire quickly so
+# transient failures get retried; expensive successes are kept longest.
+# "ok" is overridden by --cache-max-age-s.
+CACHE_TTLS = {
+    "ok": 7 * 24 * 3600,
+    "pdf": 30 * 24 * 3600,
+    "not_found": 3 * 24 * 3600,  # 404 / 410
+    "http_error": 6 * 3600,       # Other 4xx (bot blocks, paywalls)
+    "server_error": 15 * 60,      # 5xx
+    "timeout": 15 * 60,
+    "error": 60 * 60,             # DNS, TLS, redirect loops
+}
 
 # Realistic browser User-Agent to avoid bot-blocking (403s)
 USER_AGENT = (
@@ -202,6 +256,34 @@ SATIRE_KEYWORDS = [
     "satire", "parody", "humor", "humour", "comedy site",
     "satirical", "fake news comedy", "not real news", "comedic",
 ]
+# Site-level labels (meta description / og tags) that mean the site itself is satire
+SATIRE_SELF_IDENTIFY_PATTERNS = [
+    "satire site", "satirical news", "satirical website", "satire publication",
+    "parody news", "parody site", "fake news site", "comedy news",
+    "humor site", "humour site", "satirical publication", "not real news",
+    "all stories are fiction", "fictional news", "entertainment purposes only",
+]
+# Body/footer phrases a satire site uses about itself (heuristic-only runs)
+BODY_SATIRE_PATTERNS = [
+    "this is a satirical", "this is satire", "satirical news",
+    "all stories are fictional", "all articles are satire",
+    "entertainment purposes only", "parody site", "humor publication",
+    "satirical publication", "a satirical", "is satirical",
+    "satire and parody", "humor and satire", "comedic purpose",
+    "fictional and satirical", "satirical commentary",
+    "internet tendency",  # McSweeney's Internet Tendency
+    "not intended as factual", "purely fictional",
+    "humor column", "humor piece", "satire column",
+]
+
+# Hosting platforms whose registrable domain spans many unrelated publishers:
+# outlet-level LLM verdicts are never memoized per domain for these
+MULTI_PUBLISHER_DOMAINS = {
+    "facebook.com", "instagram.com", "x.com", "twitter.com", "threads.net", "tiktok.com",
+    "youtube.com", "linkedin.com", "medium.com", "substack.com", "blogspot.com",
+    "wordpress.com", "tumblr.com", "github.io", "github.com", "archive.org", "archive.ph",
+    "google.com", "scribd.com", "issuu.com", "telegram.me", "t.me",
+}
 
 # Known satire accounts on social media platforms (case-insensitive patterns in URL path)
 KNOWN_SATIRE_ACCOUNTS = [
@@ -247,6 +329,16 @@ PRIMARY_ANCHOR_KEYWORDS = [
     "official record", "transcript", "dataset", "document", "decree",
     "resolution", "statute", "ordinance",
 ]
+# Attribution patterns that make a text secondary reporting (evidence MEDIUM)
+ATTRIBUTION_PATTERNS = [
+    re.compile(r"according to [A-Z]"),
+    re.compile(r"[A-Z][a-z]+ (said|told|reported|stated)"),
+    re.compile(r"sources? (said|told|confirmed)"),
+    re.compile(r"citing [a-z]"),
+    re.compile(r"documents? (show|reveal|indicate)"),
+]
+# Attribution phrases quoted for secondary reporting
+ATTRIBUTION_KEYWORDS = ["according to", "said", "told", "reported", "citing"]
 
 # Severity coding (for systematic/widespread claims)
 SYSTEMATIC_CLAIM_KEYWORDS = [
@@ -269,6 +361,65 @@ INSTITUTIONALIZATION_HINTS = [
     "official", "government", "party", "state",
 ]
 
+# Publisher signals (about/policy pages)
+OWNERSHIP_KEYWORDS = [
+    "owned by", "ownership", "board of directors", "governance", "nonprofit",
+    "non-profit", "funded by", "funding",
+]
+CORRECTIONS_KEYWORDS = [
+    "correction", "retraction", "we correct", "clarification", "erratum", "updated",
+]
+STANDARDS_KEYWORDS = [
+    "editorial standards", "editorial policy", "code of ethics", "methodology",
+    "fact-check", "verification",
+]
+
+# Named lists served by KEYWORD_SCANNER
+KEYWORD_LISTS = {
+    "paywall": PAYWALL_HINTS,
+    "botblock": BOTBLOCK_HINTS,
+    "satire": SATIRE_KEYWORDS,
+    "satire_self_identify": SATIRE_SELF_IDENTIFY_PATTERNS,
+    "body_satire": BODY_SATIRE_PATTERNS,
+    "attribution": ATTRIBUTION_KEYWORDS,
+    "systematic_claim": SYSTEMATIC_CLAIM_KEYWORDS,
+    "extent": EXTENT_HINTS,
+    "systematicity": SYSTEMATICITY_HINTS,
+    "institutionalization": INSTITUTIONALIZATION_HINTS,
+    "ownership": OWNERSHIP_KEYWORDS,
+    "corrections": CORRECTIONS_KEYWORDS,
+    "standards": STANDARDS_KEYWORDS,
+}
+
+# Specificity anchors (who/when/where/how much), compiled once for extract_specificity_features
+SPEC_YEAR_RE = re.compile(r"\b(19\d\d|20\d\d)\b")
+SPEC_FULL_DATE_RE = re.compile(
+    r"\b(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s*\d{4}\b",
+    re.I,
+)
+SPEC_NUMERIC_DATE_RE = re.compile(r"\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b")
+SPEC_LOCATION_CONTEXT_RE = re.compile(
+    r"\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s*(?:Province|City|District|Region|County|State|Ministry|Bureau|Court|Parliament|Congress|Hall)\b"
+)
+SPEC_IN_PLACE_RE = re.compile(r"\bin\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\b")
+SPEC_PEOPLE_RE = re.compile(
+    r"\b\d{1,3}(?:,\d{3})*(?:\.\d+)?\s*(?:people|persons|individuals|members|delegates|votes?|cases|incidents|deaths|victims|detainees|prisoners|percent|%)\b",
+    re.I,
+)
+SPEC_MONEY_RE = re.compile(
+    r"\b(?:\$|€|£|¥)?\d{1,3}(?:,\d{3})*(?:\.\d+)?\s*(?:billion|million|trillion|yuan|dollars?|euros?|pounds?)\b",
+    re.I,
+)
+SPEC_RATIO_RE = re.compile(r"\b\d+\s*(?:to|vs\.?|against)\s*\d+\b", re.I)
+SPEC_SPEAKER_RE = re.compile(r"\b([A-Z][a-z]+\s+[A-Z][a-z]+)\s*(?:,|said|told|stated|added|noted|warned|announced)")
+SPEC_QUOTE_ATTRIBUTION_RE = re.compile(r'"\s*(?:said|told|according to)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)')
+SPEC_TITLE_WORDS = r"(?:president|minister|director|chief|head|leader|spokesman|spokesperson|secretary|chairman|official)"
+SPEC_TITLED_NAME_RE = re.compile(r"\b([A-Z][a-z]+\s+[A-Z][a-z]+),?\s+(?:the\s+)?" + SPEC_TITLE_WORDS, re.I)
+# Cheap necessary conditions: when one fails, the patterns it guards cannot match
+SPEC_DIGIT_RE = re.compile(r"\d")
+SPEC_TITLE_WORD_RE = re.compile(r"\s" + SPEC_TITLE_WORDS, re.I)  # titles always follow whitespace
+SPEC_LOCATION_WORD_RE = re.compile(r"Province|City|District|Region|County|State|Ministry|Bureau|Court|Parliament|Congress|Hall")
+
 
 # -----------------------------------------------------------------------------
 # Enums and Data Models
@@ -338,6 +489,9 @@ class FetchedDoc:
     published: str = ""
     meta: Dict[str, str] = field(default_factory=dict)
     warnings: List[str] = field(default_factory=list)
+    etag: str = ""           # Validators for conditional revalidation
+    last_modified: str = ""
+    body_hash: str = ""      # Content address of the stored raw body
 
 
 @dataclass
@@ -374,6 +528,95 @@ class ContentAnalysis:
     analyzed: bool = False
 
 
+@dataclass
+class SpecificityFeatures:
+    """Who/when/where/how-much anchor counts extracted from one text."""
+    years: int = 0              # distinct years
+    full_dates: int = 0         # "March 3, 2024"
+    numeric_dates: int = 0      # "3/4/2024"
+    location_context: int = 0   # "Xinjiang Province", "Supreme Court"
+    in_places: int = 0          # "in Hong Kong"
+    quantities_people: int = 0
+    quantities_money: int = 0
+    quantities_ratio: int = 0
+    named_actors: int = 0       # distinct names across speaker/attribution/title patterns
+
+    @property
+    def total_dates(self) -> int:
+        return self.years + self.full_dates + self.numeric_dates
+
+    @property
+    def total_quantities(self) -> int:
+        return self.quantities_people + self.quantities_money + self.quantities_ratio
+
+    def anchors(self, rules: Optional[HeuristicRules] = None) -> List[str]:
+        """Anchor types strong enough to count toward specificity."""
+        rules = rules or HEURISTIC_RULES
+        anchors = []
+        if self.total_dates >= rules.min_dates:
+            anchors.append(f"dates/times ({self.total_dates} found)")
+        if self.location_context or self.in_places >= rules.min_in_places:
+            anchors.append(f"locations ({self.location_context + min(self.in_places, 5)} found)")
+        if self.total_quantities >= rules.min_quantities:
+            anchors.append(f"quantities ({self.total_quantities} found)")
+        if self.named_actors >= rules.min_named_actors:
+            anchors.append(f"named actors ({self.named_actors} found)")
+        return anchors
+
+
+@dataclass
+class HeuristicRules:
+    """Tunable thresholds of the heuristic checks and permission rules.
+
+    HEURISTIC_RULES drives evaluate_source (--rules overrides it); --rescore
+    applies two configurations to the cached corpus and diffs the outcomes.
+    """
+    # Check 3: completeness (min_text_chars also gates checks 4 and 5)
+    min_text_chars: int = 100
+    limited_text_chars: int = 300
+    paywall_partial_chars: int = 800
+    complete_text_chars: int = 2000
+    # Check 4: evidence strength
+    strong_primary_anchors: int = 2
+    primary_anchor_keywords: List[str] = field(default_factory=lambda: list(PRIMARY_ANCHOR_KEYWORDS))
+    # Check 5: specificity
+    min_dates: int = 2
+    min_in_places: int = 3
+    min_quantities: int = 2
+    min_named_actors: int = 2
+    min_anchor_types: int = 2
+    # Permission: single-source runs cap strong evidence at A_SAFEGUARDS
+    single_source_caps_a: bool = True
+
+
+HEURISTIC_RULES = HeuristicRules()
+
+
+def load_heuristic_rules(path: str) -> HeuristicRules:
+    """HeuristicRules from JSON; omitted keys keep their defaults."""
+    with open(path, "r", encoding="utf-8") as f:
+        config = json.load(f)
+    defaults = HeuristicRules()
+    bad = []
+    for key, value in config.items():
+        default = getattr(defaults, key, None)
+        if default is None:
+            bad.append(f"{key} (unknown)")
+        elif isinstance(default, bool):
+            if not isinstance(value, bool):
+                bad.append(f"{key} (expected true/false)")
+        elif isinstance(default, int):
+            if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+                bad.append(f"{key} (expected a non-negative integer)")
+        elif not isinstance(value, list) or not all(isinstance(v, str) and v.strip() for v in value):
+            bad.append(f"{key} (expected a list of keywords)")
+        else:
+            config[key] = [normalize(v) for v in value]
+    if bad:
+        raise ValueError(f"Invalid rule(s) in {path}: {', '.join(bad)}")
+    return HeuristicRules(**config)
+
+
 @dataclass
 class CoreChecks:
     """Core checks (Part 1 of HRF rubric) - always required."""
@@ -399,6 +642,7 @@ class CoreChecks:
     has_specificity: bool = False
     specificity_reason: str = ""
     specificity_anchors: List[str] = field(default_factory=list)  # who/what/when/where/how much
+    specificity_features: Dict[str, int] = field(default_factory=dict)  # SpecificityFeatures counts
 
     # 6) Corroboration
     corroboration: CorroborationStatus = CorroborationStatus.NOT_ASSESSED
@@ -415,6 +659,20 @@ class CoreChecks:
     content_analysis_reason: str = ""
 
 
+@dataclass
+class LLMUsage:
+    """Anthropic API usage for one source: round trips, wall time and tokens.
+
+    `input_tokens` are uncached; prompt-cache reads and writes are counted apart.
+    """
+    calls: int = 0
+    latency_s: float = 0.0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
+
+
 @dataclass
 class EvalResult:
     """Complete evaluation result."""
@@ -446,6 +704,18 @@ class EvalResult:
     llm_used: bool = False
     llm_error: str = ""
     llm_decisions: List[str] = field(default_factory=list)  # Which checks used LLM
+    llm_usage: LLMUsage = field(default_factory=LLMUsage)
+
+    # Inputs to determine_use_permission not captured by the checks (for --rejudge)
+    single_source: bool = False
+    auto_rejected: bool = False
+    llm_enabled: bool = False
+    final_review: str = ""  # LLM C -> A review: "" (not run), "kept" or "upgraded"
+    final_review_reason: str = ""
+
+    # --intended-use all: {"A": {"permission": ..., "reason": ...}, "B": ..., "C": ...}
+    # (use_permission / permission_reason then mirror A)
+    use_permissions: Dict[str, Dict[str, str]] = field(default_factory=dict)
 
 
 # -----------------------------------------------------------------------------
@@ -470,7 +740,7 @@ def normalize(s: str) -> str:
     s = s.replace("\u2019", "'").replace("\u2018", "'")
     s = s.replace("\u201c", '"').replace("\u201d", '"')
     s = s.replace("\u00a0", " ")
-    s = re.sub(r"\s+", " ", s).strip()
+    s = " ".join(s.split())  # same whitespace class as \s, without the regex pass
     return s.casefold()
 
 
@@ -525,14 +795,23 @@ def registrable_domain(url: str) -> str:
         return ""
 
 
-def find_quotes(text: str, keywords: List[str], max_quotes: int = 2, context_chars: int = 100) -> List[str]:
-    """Find evidence quotes around keywords."""
+def find_quotes(
+    text: str,
+    keywords: List[str],
+    max_quotes: int = 2,
+    context_chars: int = 100,
+    hits: Optional["KeywordHits"] = None,
+) -> List[str]:
+    """Find evidence quotes around keywords.
+
+    `hits` (a KeywordHits over text.lower()) reuses offsets already found by the checks.
+    """
     if not text:
         return []
     quotes = []
-    low = text.lower()
+    low = text.lower() if hits is None else ""
     for kw in keywords:
-        idx = low.find(kw.lower())
+        idx = low.find(kw.lower()) if hits is None else hits.offset(kw.lower())
         if idx == -1:
             continue
         start = max(0, idx - context_chars)
@@ -547,95 +826,120 @@ def find_quotes(text: str, keywords: List[str], max_quotes: int = 2, context_cha
     return quotes
 
 
-# -----------------------------------------------------------------------------
-# LLM Augmentation
-# -----------------------------------------------------------------------------
-DEFAULT_LLM_MODEL = "claude-3-haiku-20240307"
-CONTENT_ANALYSIS_MODEL = "claude-sonnet-4-20250514"
-LLM_MAX_TEXT_CHARS = 4000  # Truncate text sent to LLM for quick checks
-CONTENT_ANALYSIS_MAX_CHARS = 12000  # Longer context for deep content analysis
+class KeywordHits:
+    """Per-list keyword hit map over one lowered/normalized document.
 
+    Offsets are looked up on first use and memoized, so a keyword shared by
+    several lists (or quoted by find_quotes afterwards) is searched once, and
+    any() still stops at the first hit.
+    """
 
-def get_anthropic_client() -> Optional[Any]:
-    """Get Anthropic client if available and API key is set."""
-    if not HAS_ANTHROPIC:
-        return None
-    api_key = os.environ.get("ANTHROPIC_API_KEY")
-    if not api_key:
-        return None
-    try:
-        return Anthropic(api_key=api_key)
-    except Exception:
-        return None
+    def __init__(self, lists: Dict[str, Tuple[str, ...]], text_low: str):
+        self.lists = lists
+        self.text_low = text_low
+        self.offsets: Dict[str, int] = {}
 
+    def offset(self, kw: str) -> int:
+        """First offset of `kw` in the text, or -1."""
+        idx = self.offsets.get(kw)
+        if idx is None:
+            idx = self.offsets[kw] = self.text_low.find(kw)
+        return idx
 
-def llm_review(client: Any, prompt: str, model: str = DEFAULT_LLM_MODEL) -> Optional[Dict[str, Any]]:
-    """Call Claude API for review. Returns parsed JSON or None on error."""
-    if not client:
-        return None
-    try:
-        response = client.messages.create(
-            model=model,
-            max_tokens=500,
-            messages=[{"role": "user", "content": prompt}]
-        )
-        text = response.content[0].text.strip()
-        # Extract JSON from response (handle markdown code blocks)
-        if "```json" in text:
-            text = text.split("```json")[1].split("```")[0].strip()
-        elif "```" in text:
-            text = text.split("```")[1].split("```")[0].strip()
-        return json.loads(text)
-    except Exception as e:
-        logging.debug(f"LLM review error: {e}")
-        return None
+    def __getitem__(self, name: str) -> Dict[str, int]:
+        """Matched keywords of list `name` (in list order) mapped to their offsets."""
+        return {kw: idx for kw in self.lists[name] if (idx := self.offset(kw)) != -1}
 
+    def any(self, name: str) -> bool:
+        return any(self.offset(kw) != -1 for kw in self.lists[name])
 
-def llm_assess_evidence_strength(
-    client: Any,
-    text: str,
-    heuristic_strength: str,
-    model: str = DEFAULT_LLM_MODEL
-) -> Optional[Tuple[str, str]]:
-    """LLM review of evidence strength. Returns (strength, reason) or None."""
-    truncated = text[:LLM_MAX_TEXT_CHARS] if len(text) > LLM_MAX_TEXT_CHARS else text
-    prompt = f"""Analyze this source text for evidence strength.
 
-TEXT:
-{truncated}
+class KeywordScanner:
+    """Substring matcher shared by the heuristic checks.
 
-HEURISTIC ASSESSMENT: {heuristic_strength}
+    Keywords are normalized once at construction; scan() wraps a document in
+    a KeywordHits that every check (and find_quotes) then reads from. Plain
+    C-level str.find per keyword measured about twice as fast as a combined
+    trie regex, which has to step the regex engine through every offset.
+    """
 
-Evaluate whether this text contains:
-1. Primary evidence (legal documents, court records, official filings, datasets)?
-2. Clear attribution to named sources ("according to X", direct quotes)?
-3. Verifiable claims with specific details (dates, names, quantities)?
+    def __init__(self, lists: Dict[str, List[str]]):
+        self.lists = {name: tuple(dict.fromkeys(normalize(kw) for kw in kws)) for name, kws in lists.items()}
 
-Respond ONLY with JSON:
-{{"strength": "strong|medium|weak", "reason": "brief 10-word explanation"}}"""
+    def scan(self, text_low: str) -> KeywordHits:
+        """Hit map for already-lowered (or normalize()d) text."""
+        return KeywordHits(self.lists, text_low)
 
-    result = llm_review(client, prompt, model)
-    if result and "strength" in result:
-        return result["strength"], result.get("reason", "LLM assessment")
-    return None
 
+KEYWORD_SCANNER = KeywordScanner(KEYWORD_LISTS)
 
-def llm_assess_self_interest(
-    client: Any,
-    url: str,
-    text: str,
-    model: str = DEFAULT_LLM_MODEL
-) -> Optional[Tuple[bool, str]]:
-    """LLM review for self-interest. Returns (is_self_interest, reason) or None."""
-    truncated = text[:LLM_MAX_TEXT_CHARS] if len(text) > LLM_MAX_TEXT_CHARS else text
-    prompt = f"""Determine if this source has a self-interest conflict for evidentiary purposes.
 
-URL: {url}
+def scan_article_keywords(text: str) -> KeywordHits:
+    """Shared hit map for the article-text checks."""
+    return KEYWORD_SCANNER.scan((text or "").lower())
 
-TEXT EXCERPT:
-{truncated}
 
-CRITICAL: You must identify the SOURCE (who published this), not the SUBJECT (what it's about).
+# -----------------------------------------------------------------------------
+# LLM Augmentation
+# -----------------------------------------------------------------------------
+DEFAULT_LLM_MODEL = "claude-3-haiku-20240307"
+CONTENT_ANALYSIS_MODEL = "claude-sonnet-4-20250514"
+LLM_MAX_TEXT_CHARS = 4000  # Truncate text sent to LLM for quick checks
+CONTENT_ANALYSIS_MAX_CHARS = 12000  # Longer context for deep content analysis
+
+# Response cache for llm_call (records in the fetch cache backend)
+LLM_CACHE_NAMESPACE = "llm-responses"
+LLM_CACHE_DIR = ""  # Set from --cache-dir by apply_llm_args; "" disables the cache
+LLM_CACHE_MAX_AGE_S = 30 * 24 * 3600  # --llm-cache-max-age-s, negative = never expires
+LLM_CACHE_MAX_BYTES = 64 * 1024 * 1024  # --llm-cache-max-bytes, 0 = unbounded
+_llm_cache_writes = itertools.count(1)
+
+# Pacing and retries for llm_call (the SDK's own retries are disabled)
+LLM_RPM = 0  # --llm-rpm: requests/minute per model, 0 = unlimited
+LLM_ITPM = 0  # --llm-itpm: input tokens/minute per model, 0 = unlimited
+LLM_TIMEOUT_S = 180.0  # --llm-timeout-s, per request
+LLM_MAX_RETRIES = 5  # --llm-max-retries
+LLM_BACKOFF_BASE_S = 2.0
+LLM_BACKOFF_MAX_S = 60.0
+LLM_RETRY_STATUS = {429, 529}  # Rate limited, overloaded (timeouts and dropped connections retry too)
+
+# Provider-side prompt caching of the static system prompt (LLM_REVIEW_SYSTEM)
+LLM_PROMPT_CACHE = True  # --no-llm-prompt-cache disables cache_control
+PROMPT_CACHE_READ_COST = 0.1  # Price of a cached input token relative to an uncached one
+PROMPT_CACHE_WRITE_COST = 1.25  # ... and of writing it to the 5-minute cache
+
+# Per-job spend (see LLMBudget): USD per million input / output tokens, by model id prefix
+LLM_PRICES = {
+    "claude-3-haiku": (0.25, 1.25),
+    "claude-haiku-4-5": (1.0, 5.0),
+    "claude-sonnet-4": (3.0, 15.0),
+}
+LLM_DEFAULT_PRICE = (3.0, 15.0)  # Unknown models are priced like Sonnet
+LLM_BATCH_DISCOUNT = 0.5  # Message batches bill half price
+
+# --llm-batch: cache misses are deferred and sent as message batches (see run_llm_batched)
+LLM_BATCH_NAMESPACE = "llm-batches"  # Checkpoints: request set -> batch id
+LLM_BATCH_POLL_S = 60.0  # --llm-batch-poll-s
+LLM_BATCH_MAX_ROUNDS = 4  # Follow-up batches for requests that depend on earlier answers
+LLM_BATCH_MAX_REQUESTS = 100_000  # API limits per batch: 100,000 requests, 256 MB
+LLM_BATCH_MAX_BYTES = 200 * 1024 * 1024
+LLM_BATCH: Optional["LLMBatchCollector"] = None  # Set while run_llm_batched collects requests
+
+# Review instructions, shared by the per-check prompts and the consolidated review
+
+CONTENT_ANALYSIS_ROLE = """You are a research credibility analyst. Read this article carefully and
+evaluate the factual claims it makes. Your job is NOT to judge the source —
+it is to judge whether the CONTENT is well-sourced, internally consistent,
+and factually accurate based on your knowledge."""
+
+EVIDENCE_STRENGTH_GUIDE = """Evaluate whether this text contains:
+1. Primary evidence (legal documents, court records, official filings, datasets)?
+2. Clear attribution to named sources ("according to X", direct quotes)?
+3. Verifiable claims with specific details (dates, names, quantities)?"""
+
+EVIDENCE_STRENGTH_SCHEMA = """{"strength": "strong|medium|weak", "reason": "brief 10-word explanation"}"""
+
+SELF_INTEREST_GUIDE = """CRITICAL: You must identify the SOURCE (who published this), not the SUBJECT (what it's about).
 
 MARK AS SELF-INTEREST (is_self_interest: true) ONLY IF:
 - The SOURCE ORGANIZATION is making claims ABOUT ITSELF
@@ -656,35 +960,11 @@ KEY DISTINCTION - SOURCE vs SUBJECT:
 - CTA website promoting CTA's legitimacy = SELF-INTEREST (CTA is both SOURCE and SUBJECT)
 - Freedom House report on China = NOT self-interest (Freedom House reporting on external actor)
 
-QUESTION: Is the PUBLISHING ORGANIZATION (the SOURCE) making claims about ITSELF?
-
-Respond ONLY with JSON:
-{{"is_self_interest": true|false, "reason": "brief 10-word explanation"}}"""
-
-    result = llm_review(client, prompt, model)
-    if result and "is_self_interest" in result:
-        return result["is_self_interest"], result.get("reason", "LLM assessment")
-    return None
-
-
-def llm_assess_satire(
-    client: Any,
-    title: str,
-    text: str,
-    domain: str = "",
-    model: str = DEFAULT_LLM_MODEL
-) -> Optional[Tuple[bool, str]]:
-    """LLM review for satire/parody. Returns (is_satire, reason) or None."""
-    truncated = text[:3000] if len(text) > 3000 else text
-    prompt = f"""Determine if this source is satire, parody, or humor that should NEVER be cited as fact.
-
-SOURCE DOMAIN: {domain}
-ARTICLE TITLE: {title}
+QUESTION: Is the PUBLISHING ORGANIZATION (the SOURCE) making claims about ITSELF?"""
 
-TEXT EXCERPT:
-{truncated}
+SELF_INTEREST_SCHEMA = """{"is_self_interest": true|false, "reason": "brief 10-word explanation"}"""
 
-You must answer TWO questions:
+SATIRE_GUIDE = """You must answer TWO questions:
 1. Is the DOMAIN itself a known satire/humor/parody publication?
 2. Is the CONTENT itself clearly satirical, absurdist, or fabricated for comedic effect?
 
@@ -717,71 +997,18 @@ ANSWER "is_satire": false ONLY IF:
 - The content is ABOUT satire but is itself serious analysis/journalism
 - The content is opinion/editorial but not comedic fabrication
 
-CRITICAL: A source from an UNKNOWN domain can still be satire if the content is clearly fabricated comedy. Judge the CONTENT, not just the domain name.
-
-Respond ONLY with JSON:
-{{"is_satire": true|false, "reason": "brief explanation"}}"""
-
-    result = llm_review(client, prompt, model)
-    if result and "is_satire" in result:
-        return result["is_satire"], result.get("reason", "LLM assessment")
-    return None
-
-
-def llm_assess_severity_support(
-    client: Any,
-    text: str,
-    missing_elements: List[str],
-    model: str = DEFAULT_LLM_MODEL
-) -> Optional[Tuple[str, str, List[str]]]:
-    """LLM review for severity claim support. Returns (status, reason, still_missing) or None."""
-    truncated = text[:LLM_MAX_TEXT_CHARS] if len(text) > LLM_MAX_TEXT_CHARS else text
-    prompt = f"""Analyze if this text supports claims of systematic/widespread human rights violations.
-
-TEXT:
-{truncated}
+CRITICAL: A source from an UNKNOWN domain can still be satire if the content is clearly fabricated comedy. Judge the CONTENT, not just the domain name."""
 
-HEURISTICS FOUND MISSING: {', '.join(missing_elements)}
+SATIRE_SCHEMA = """{"is_satire": true|false, "reason": "brief explanation"}"""
 
-For systematic abuse claims, check for evidence of:
+SEVERITY_SUPPORT_GUIDE = """For systematic abuse claims, check for evidence of:
 1. EXTENT: Scale/severity of harm (deaths, detentions, injuries, numbers affected)
 2. SYSTEMATICITY: Pattern/frequency (ongoing, routine, widespread, over time)
-3. INSTITUTIONALIZATION: State apparatus involvement (laws, policies, agencies, officials)
+3. INSTITUTIONALIZATION: State apparatus involvement (laws, policies, agencies, officials)"""
 
-Respond ONLY with JSON:
-{{"status": "supported|partial|not_supported", "reason": "brief explanation", "still_missing": ["list", "of", "missing"]}}"""
+SEVERITY_SUPPORT_SCHEMA = """{"status": "supported|partial|not_supported", "reason": "brief explanation", "still_missing": ["list", "of", "missing"]}"""
 
-    result = llm_review(client, prompt, model)
-    if result and "status" in result:
-        return (
-            result["status"],
-            result.get("reason", "LLM assessment"),
-            result.get("still_missing", [])
-        )
-    return None
-
-
-def llm_assess_source_type(
-    client: Any,
-    url: str,
-    domain: str,
-    text: str,
-    model: str = DEFAULT_LLM_MODEL
-) -> Optional[Dict[str, Any]]:
-    """
-    Comprehensive source type assessment for nuanced evidentiary handling.
-    Returns dict with source_type, evidence_level, and reasoning.
-    """
-    truncated = text[:LLM_MAX_TEXT_CHARS] if len(text) > LLM_MAX_TEXT_CHARS else text
-    prompt = f"""Analyze this source to determine its type and appropriate evidentiary use.
-
-URL: {url}
-DOMAIN: {domain}
-
-TEXT EXCERPT:
-{truncated}
-
-Classify the SOURCE TYPE (pick ONE):
+SOURCE_TYPE_GUIDE = """Classify the SOURCE TYPE (pick ONE):
 1. "international_ngo" - Established international NGO/watchdog (Amnesty, HRW, Freedom House, CPJ, CIVICUS, etc.) reporting on EXTERNAL issues
 2. "advocacy_org" - Organization advocating for its OWN cause (ONLY if the specific content is self-promotional)
 3. "established_news" - Major news media with editorial standards (BBC, Reuters, AP, NYT, Guardian, Economist, Wired, Mother Jones, Coda Story, etc.)
@@ -812,77 +1039,17 @@ KEY PRINCIPLES:
 - Government on ITSELF = narrative only (self-interest)
 - Government on OTHER government = consider bilateral relations and potential bias
 - State-affiliated think tanks = treat like state media (narrative only)
-- News media: check if they have known bias for/against the country being covered
-
-Respond ONLY with JSON:
-{{"source_type": "type_from_list", "evidence_level": "strong|medium|narrative_only|context_only", "bias_concern": true|false, "reason": "brief explanation"}}"""
-
-    result = llm_review(client, prompt, model)
-    if result and "source_type" in result:
-        return result
-    return None
+- News media: check if they have known bias for/against the country being covered"""
 
+SOURCE_TYPE_SCHEMA = """{"source_type": "type_from_list", "evidence_level": "strong|medium|narrative_only|context_only", "bias_concern": true|false, "reason": "brief explanation"}"""
 
-def llm_final_review(
-    client: Any,
-    text: str,
-    heuristic_permission: str,
-    core_checks_summary: str,
-    model: str = DEFAULT_LLM_MODEL
-) -> Optional[Tuple[str, str]]:
-    """LLM final review for C: Context-only results. Returns (permission, reason) or None."""
-    truncated = text[:LLM_MAX_TEXT_CHARS] if len(text) > LLM_MAX_TEXT_CHARS else text
-    prompt = f"""Review this source evaluation for potential upgrade.
-
-TEXT EXCERPT:
-{truncated}
-
-HEURISTIC RESULT: {heuristic_permission}
-CHECKS SUMMARY: {core_checks_summary}
-
-The heuristics rated this as "Context-only". Review if it could be upgraded to:
+FINAL_REVIEW_GUIDE = """The heuristics rated this as "Context-only". Review if it could be upgraded to:
 - "A: Usable with safeguards" (has attribution, some verifiable claims)
-- Keep as "C: Context-only" (opinion, analysis without strong evidence)
-
-Respond ONLY with JSON:
-{{"permission": "A_SAFEGUARDS|C_CONTEXT", "reason": "brief explanation"}}"""
-
-    result = llm_review(client, prompt, model)
-    if result and "permission" in result:
-        return result["permission"], result.get("reason", "LLM assessment")
-    return None
-
-
-def llm_content_analysis(
-    client: Any,
-    text: str,
-    title: str,
-    url: str,
-    model: str = CONTENT_ANALYSIS_MODEL,
-) -> Optional[ContentAnalysis]:
-    """
-    Deep content analysis using Claude Sonnet.
-    Extracts claims, checks plausibility, flags contradictions.
-    Returns a ContentAnalysis dataclass or None on error.
-    """
-    if not client or not text:
-        return None
-
-    truncated = text[:CONTENT_ANALYSIS_MAX_CHARS]
-    was_truncated = len(text) > CONTENT_ANALYSIS_MAX_CHARS
+- Keep as "C: Context-only" (opinion, analysis without strong evidence)"""
 
-    prompt = f"""You are a research credibility analyst. Read this article carefully and
-evaluate the factual claims it makes. Your job is NOT to judge the source —
-it is to judge whether the CONTENT is well-sourced, internally consistent,
-and factually accurate based on your knowledge.
-
-ARTICLE TITLE: {title}
-URL: {url}
-
-FULL TEXT:
-{truncated}
+FINAL_REVIEW_SCHEMA = """{"permission": "A_SAFEGUARDS|C_CONTEXT", "reason": "brief explanation"}"""
 
-Perform these analyses:
+CONTENT_ANALYSIS_GUIDE = """Perform these analyses:
 
 1. CLAIM EXTRACTION: Identify the 3-5 most significant FACTUAL claims
    (not opinions, not quotes from others, not background context).
@@ -910,100 +1077,1918 @@ Perform these analyses:
 4. OVERALL CONFIDENCE: How well-sourced and reliable are this article's claims overall?
    - "high": Most claims are attributed, specific, and consistent
    - "medium": Some claims are well-sourced but others lack attribution or specificity
-   - "low": Most claims are unattributed, vague, or contain red flags/contradictions
+   - "low": Most claims are unattributed, vague, or contain red flags/contradictions"""
 
-Respond ONLY with JSON:
-{{
+CONTENT_ANALYSIS_SCHEMA = """{
   "claims": [
-    {{
+    {
       "text": "the verbatim or paraphrased claim",
       "has_attribution": true or false,
       "attribution_detail": "who/what is cited, or 'none'",
       "specificity": "high" or "medium" or "low",
       "plausibility": "solid" or "plausible" or "questionable" or "implausible",
       "red_flags": ["list of specific concerns, empty if none"]
-    }}
+    }
   ],
   "contradictions": ["list of specific factual errors found, empty if none"],
   "confidence_level": "high" or "medium" or "low",
   "confidence_summary": "2-3 sentence explanation of overall claim quality and sourcing"
-}}"""
+}"""
 
-    try:
-        response = client.messages.create(
-            model=model,
-            max_tokens=1500,
-            messages=[{"role": "user", "content": prompt}],
-        )
-        resp_text = response.content[0].text.strip()
-
-        # Extract JSON from response
-        if "```json" in resp_text:
-            resp_text = resp_text.split("```json")[1].split("```")[0].strip()
-        elif "```" in resp_text:
-            resp_text = resp_text.split("```")[1].split("```")[0].strip()
-
-        data = json.loads(resp_text)
-
-        result = ContentAnalysis(
-            claims=data.get("claims", []),
-            contradiction_flags=data.get("contradictions", []),
-            confidence_level=data.get("confidence_level", "not_assessed"),
-            confidence_summary=data.get("confidence_summary", ""),
-            analysis_truncated=was_truncated,
-            analyzed=True,
-        )
-        return result
 
-    except Exception as e:
-        logging.debug(f"Content analysis error: {e}")
+def get_anthropic_client() -> Optional[Any]:
+    """Get Anthropic client if available and API key is set."""
+    if not HAS_ANTHROPIC:
+        return None
+    api_key = os.environ.get("ANTHROPIC_API_KEY")
+    if not api_key:
+        return None
+    try:
+        # llm_call owns retries (shared backoff and rate limits); the client
+        # honours ANTHROPIC_BASE_URL, e.g. a local stub server
+        return Anthropic(api_key=api_key, max_retries=0)
+    except Exception:
         return None
 
 
-# -----------------------------------------------------------------------------
+class MeteredClient:
+    """Anthropic client proxy that tallies every messages.create into an LLMUsage.
+
+    Wrap the shared client once per source; the llm_* functions use it as-is.
+    """
+
+    def __init__(self, client: Any, usage: LLMUsage):
+        self._client = client
+        self.usage = usage
+        self.messages = self  # client.messages.create(...) lands on self.create
+
+    def create(self, **kwargs: Any) -> Any:
+        started = time.monotonic()
+        try:
+            response = self._client.messages.create(**kwargs)
+        finally:
+            self.usage.calls += 1
+            self.usage.latency_s += time.monotonic() - started
+        usage = getattr(response, "usage", None)
+        if usage is not None:
+            self.usage.input_tokens += getattr(usage, "input_tokens", 0) or 0
+            self.usage.output_tokens += getattr(usage, "output_tokens", 0) or 0
+            self.usage.cache_read_tokens += getattr(usage, "cache_read_input_tokens", 0) or 0
+            self.usage.cache_write_tokens += getattr(usage, "cache_creation_input_tokens", 0) or 0
+        return response
+
+
+class TokenBucket:
+    """Token bucket in virtual-scheduling form (GCRA) with no burst allowance.
+
+    Each reservation pushes `next_free` forward by amount / rate, so requests
+    are spaced evenly; the API may enforce a per-minute limit over shorter
+    intervals, and an up-front burst would trip it.
+    """
+
+    def __init__(self, per_minute: int):
+        self.per_minute = per_minute
+        self.rate = per_minute / 60.0
+        self.next_free = 0.0
+
+    def reserve(self, amount: float, start: float) -> None:
+        self.next_free = max(self.next_free, start) + amount / self.rate
+
+
+class LLMRateLimiter:
+    """Requests/minute and input-tokens/minute buckets per model, shared by all threads.
+
+    A 429/529 pauses the model for every caller, not just the one that saw it.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buckets: Dict[Tuple[str, str], TokenBucket] = {}
+        self._paused_until: Dict[str, float] = {}
+
+    def _bucket(self, model: str, kind: str, per_minute: int) -> Optional[TokenBucket]:
+        if per_minute <= 0:
+            return None
+        bucket = self._buckets.get((model, kind))
+        if bucket is None or bucket.per_minute != per_minute:
+            bucket = self._buckets[(model, kind)] = TokenBucket(per_minute)
+        return bucket
+
+    def acquire(self, model: str, input_tokens: int) -> None:
+        """Block until `model` has room for one request of `input_tokens`."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                charges = [(self._bucket(model, "requests", LLM_RPM), 1),
+                           (self._bucket(model, "input_tokens", LLM_ITPM), input_tokens)]
+                start = max([now, self._paused_until.get(model, 0.0)]
+                            + [bucket.next_free for bucket, _ in charges if bucket])
+                for bucket, amount in charges:
+                    if bucket:
+                        bucket.reserve(amount, start)
+            if start > now:
+                time.sleep(start - now)
+            # A 429 seen by another thread while we slept: take a new slot after
+            # the pause instead of waking up together with every other waiter
+            with self._lock:
+                if self._paused_until.get(model, 0.0) <= time.monotonic():
+                    return
+
+    def settle(self, model: str, estimated: int, actual: int) -> None:
+        """Charge the input-token bucket the reported usage instead of the estimate."""
+        with self._lock:
+            bucket = self._buckets.get((model, "input_tokens"))
+            if bucket:
+                bucket.next_free += (actual - estimated) / bucket.rate
+
+    def pause(self, model: str, seconds: float) -> None:
+        with self._lock:
+            self._paused_until[model] = max(self._paused_until.get(model, 0.0), time.monotonic() + seconds)
+
+
+LLM_LIMITER = LLMRateLimiter()
+
+
+class LLMBudgetExceeded(Exception):
+    """Raised by llm_call instead of an API request once the job's LLM budget is spent."""
+
+
+def llm_price(model: str) -> Tuple[float, float]:
+    for prefix, price in LLM_PRICES.items():
+        if model.startswith(prefix):
+            return price
+    return LLM_DEFAULT_PRICE
+
+
+def llm_cost(model: str, input_tokens: int, output_tokens: int = 0, cache_read_tokens: int = 0,
+             cache_write_tokens: int = 0, batch: bool = False) -> float:
+    """USD for one request's usage."""
+    price_in, price_out = llm_price(model)
+    cost = (input_tokens * price_in + cache_read_tokens * price_in * PROMPT_CACHE_READ_COST
+            + cache_write_tokens * price_in * PROMPT_CACHE_WRITE_COST + output_tokens * price_out) / 1e6
+    return cost * LLM_BATCH_DISCOUNT if batch else cost
+
+
+class LLMBudget:
+    """Per-job LLM spend by call site (stage), with optional token and cost ceilings.
+
+    Before every API request llm_call reserves the request's worst case
+    (estimated input plus max_tokens of output). After it, the reservation
+    is replaced by the reported usage. In-flight requests count against the
+    ceilings, so concurrent workers cannot all pass against the same spend
+    and overshoot together. A request that does not fit raises
+    LLMBudgetExceeded and its caller falls back to heuristics. Cached
+    answers stay free. With `usage_path` set, totals are rewritten to that
+    JSON file after every request so a caller can follow a running job.
+    """
+
+    FIELDS = ("calls", "input_tokens", "output_tokens", "cache_read_tokens", "cache_write_tokens", "refused")
+
+    def __init__(self, max_tokens: int = 0, max_cost: float = 0.0, usage_path: str = ""):
+        self._lock = threading.Lock()
+        self.configure(max_tokens, max_cost, usage_path)
+
+    def configure(self, max_tokens: int = 0, max_cost: float = 0.0, usage_path: str = "") -> None:
+        self.max_tokens, self.max_cost, self.usage_path = max_tokens, max_cost, usage_path
+        self.stages: Dict[str, Dict[str, Any]] = {}
+        self._held: Tuple[int, float] = (0, 0.0)  # Reserved by in-flight requests
+
+    def _stage(self, stage: str) -> Dict[str, Any]:
+        if stage not in self.stages:
+            self.stages[stage] = {**{f: 0 for f in self.FIELDS}, "cost_usd": 0.0}
+        return self.stages[stage]
+
+    def _spent(self) -> Tuple[int, float]:
+        tokens = sum(s["input_tokens"] + s["output_tokens"] + s["cache_read_tokens"] + s["cache_write_tokens"]
+                     for s in self.stages.values())
+        return tokens, sum(s["cost_usd"] for s in self.stages.values())
+
+    def _fits(self, tokens: int, cost: float) -> bool:
+        spent_tokens, spent_cost = self._spent()
+        return ((not self.max_tokens or spent_tokens + self._held[0] + tokens <= self.max_tokens)
+                and (not self.max_cost or spent_cost + self._held[1] + cost <= self.max_cost))
+
+    def reserve(self, stage: str, model: str, input_tokens: int, max_output: int,
+                system_tokens: int = 0) -> Tuple[int, float]:
+        """Hold a request's worst case against the ceilings, or raise LLMBudgetExceeded.
+
+        The system prompt is priced as a prompt-cache write, its most expensive
+        outcome. Returns the hold, to be passed to record() or release().
+        """
+        if not self.max_tokens and not self.max_cost:
+            return 0, 0.0
+        hold = (input_tokens + system_tokens + max_output,
+                llm_cost(model, input_tokens, max_output, cache_write_tokens=system_tokens))
+        with self._lock:
+            if self._fits(*hold):
+                self._held = (self._held[0] + hold[0], self._held[1] + hold[1])
+                return hold
+            self._stage(stage)["refused"] += 1
+            first = sum(s["refused"] for s in self.stages.values()) == 1
+        if first:
+            logging.warning(f"LLM budget reached ({self.summary()}); requests that do not fit "
+                            f"fall back to heuristics")
+        self.write()
+        raise LLMBudgetExceeded(f"LLM budget reached before {stage}")
+
+    def admit(self, requests_: List[Dict[str, Any]], stages: Dict[str, str]) -> List[Dict[str, Any]]:
+        """The leading message batch requests whose estimated cost fits the remaining budget."""
+        admitted: List[Dict[str, Any]] = []
+        held_tokens, held_cost = 0, 0.0
+        with self._lock:
+            for req in requests_:
+                params = req["params"]
+                tokens = (len(params["messages"][0]["content"])
+                          + sum(len(b["text"]) for b in params.get("system", []))) // 4 + 1
+                cost = llm_cost(params["model"], tokens, params["max_tokens"], batch=True)
+                tokens += params["max_tokens"]
+                if (self.max_tokens or self.max_cost) and not self._fits(held_tokens + tokens, held_cost + cost):
+                    self._stage(stages.get(req["custom_id"], "other"))["refused"] += 1
+                    continue
+                held_tokens, held_cost = held_tokens + tokens, held_cost + cost
+                admitted.append(req)
+        if len(admitted) < len(requests_):
+            logging.warning(f"LLM budget admits {len(admitted)} of {len(requests_)} batched requests; "
+                            f"the rest fall back to heuristics")
+        return admitted
+
+    def release(self, hold: Tuple[int, float]) -> None:
+        """Drop a reservation whose request failed or reported no usage."""
+        with self._lock:
+            self._held = (self._held[0] - hold[0], self._held[1] - hold[1])
+
+    def record(self, stage: str, model: str, usage: Any, batch: bool = False,
+               hold: Tuple[int, float] = (0, 0.0)) -> None:
+        """Add a request's reported usage, replacing its reservation."""
+        counts = {f: getattr(usage, attr, 0) or 0 for f, attr in (
+            ("input_tokens", "input_tokens"), ("output_tokens", "output_tokens"),
+            ("cache_read_tokens", "cache_read_input_tokens"), ("cache_write_tokens", "cache_creation_input_tokens"),
+        )}
+        with self._lock:
+            self._held = (self._held[0] - hold[0], self._held[1] - hold[1])
+            entry = self._stage(stage)
+            entry["calls"] += 1
+            for f, n in counts.items():
+                entry[f] += n
+            entry["cost_usd"] += llm_cost(model, batch=batch, **counts)
+        self.write()
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            stages = {name: {**s, "cost_usd": round(s["cost_usd"], 6)} for name, s in sorted(self.stages.items())}
+            tokens, cost = self._spent()
+        total = {f: sum(s[f] for s in stages.values()) for f in self.FIELDS}
+        return {
+            "stages": stages,
+            "total": {**total, "tokens": tokens, "cost_usd": round(cost, 6)},
+            "max_tokens": self.max_tokens,
+            "max_cost_usd": self.max_cost,
+            "exhausted": total["refused"] > 0,
+        }
+
+    def summary(self) -> str:
+        tokens, cost = self._spent()
+        line = f"{tokens} tokens, ${cost:.4f}"
+        limits = [f"{self.max_tokens} tokens" if self.max_tokens else "", f"${self.max_cost:g}" if self.max_cost else ""]
+        if any(limits):
+            line += f" of {' / '.join(l for l in limits if l)}"
+        held_tokens, held_cost = self._held
+        if held_tokens:
+            line += f" (+{held_tokens} tokens, ${held_cost:.4f} reserved by requests in flight)"
+        return line
+
+    def write(self) -> None:
+        """Rewrite usage_path (atomically) with the current totals."""
+        if not self.usage_path:
+            return
+        data = self.to_dict()
+        tmp = f"{self.usage_path}.tmp{threading.get_ident()}"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp, self.usage_path)
+        except OSError as e:
+            # The request is already paid for: its answer must still be used and cached
+            logging.warning(f"Could not write LLM usage to {self.usage_path}: {e}")
+
+
+LLM_BUDGET = LLMBudget()
+
+
+def _llm_retry_after(e: Exception) -> float:
+    """Server-suggested wait (retry-after header) in seconds, 0 if absent."""
+    headers = getattr(getattr(e, "response", None), "headers", None) or {}
+    try:
+        return max(0.0, float(headers.get("retry-after", 0)))
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _llm_retryable(e: Exception) -> bool:
+    if getattr(e, "status_code", None) in LLM_RETRY_STATUS:
+        return True
+    if HAS_ANTHROPIC and isinstance(e, (anthropic.APITimeoutError, anthropic.APIConnectionError)):
+        return True
+    return isinstance(e, (TimeoutError, ConnectionError))
+
+
+def llm_request(prompt: str, model: str, max_tokens: int, system: str = "") -> Dict[str, Any]:
+    """messages.create parameters; a `system` prompt is marked for prompt caching."""
+    params: Dict[str, Any] = {
+        "model": model,
+        "max_tokens": max_tokens,
+        "messages": [{"role": "user", "content": prompt}],
+    }
+    if system:
+        block: Dict[str, Any] = {"type": "text", "text": system}
+        if LLM_PROMPT_CACHE:
+            block["cache_control"] = {"type": "ephemeral"}
+        params["system"] = [block]
+    return params
+
+
+def llm_create(client: Any, prompt: str, model: str, max_tokens: int, system: str = "") -> Any:
+    """messages.create paced by LLM_LIMITER, with a per-request timeout and
+    jittered exponential backoff on 429/529, timeouts and dropped connections."""
+    estimate = (len(system) + len(prompt)) // 4 + 1
+    params = llm_request(prompt, model, max_tokens, system)
+    for attempt in range(LLM_MAX_RETRIES + 1):
+        LLM_LIMITER.acquire(model, estimate)
+        try:
+            response = client.messages.create(**params, timeout=LLM_TIMEOUT_S)
+        except Exception as e:
+            if attempt >= LLM_MAX_RETRIES or not _llm_retryable(e):
+                raise
+            backoff = min(LLM_BACKOFF_MAX_S, LLM_BACKOFF_BASE_S * 2 ** attempt)
+            delay = max(_llm_retry_after(e), random.uniform(backoff / 2, backoff))
+            LLM_STATS.incr("retries")
+            if getattr(e, "status_code", None) in LLM_RETRY_STATUS:
+                LLM_STATS.incr("rate_limited")
+                LLM_LIMITER.pause(model, delay)
+            logging.debug(f"LLM request failed ({e}); retry {attempt + 1} in {delay:.1f}s")
+            time.sleep(delay)
+            continue
+        usage = getattr(response, "usage", None)
+        if usage is not None and getattr(usage, "input_tokens", None):
+            # Cache reads do not count towards the input-token limit; cache writes do
+            actual = usage.input_tokens + (getattr(usage, "cache_creation_input_tokens", 0) or 0)
+            LLM_LIMITER.settle(model, estimate, actual)
+        return response
+
+
+def llm_cache_key(model: str, prompt: str, max_tokens: int, system: str = "") -> str:
+    if system:
+        return sha256_hex(f"{model}\n{max_tokens}\n{sha256_hex(system)}\n{sha256_hex(prompt)}")
+    return sha256_hex(f"{model}\n{max_tokens}\n{sha256_hex(prompt)}")
+
+
+def enforce_llm_cache_limit() -> int:
+    """Evict least-recently-used LLM responses once they exceed LLM_CACHE_MAX_BYTES."""
+    if not LLM_CACHE_DIR or LLM_CACHE_MAX_BYTES <= 0:
+        return 0
+    backend = get_cache_backend(LLM_CACHE_DIR)
+    if backend.record_usage(LLM_CACHE_NAMESPACE) <= LLM_CACHE_MAX_BYTES:
+        return 0
+    removed = backend.evict_records(LLM_CACHE_NAMESPACE, int(LLM_CACHE_MAX_BYTES * CACHE_LOW_WATER))
+    LLM_STATS.incr("evicted", removed)
+    return removed
+
+
+class LLMDeferred(Exception):
+    """Raised by llm_call for a cache miss while a --llm-batch pass collects requests."""
+
+
+class LLMBatchCollector:
+    """Requests that missed the LLM cache during one run_llm_batched pass.
+
+    Keys in `submitted` went out in an earlier round; asking for them again
+    (errored, expired or unparseable answer) does not queue them twice.
+    """
+
+    def __init__(self, submitted: set):
+        self._lock = threading.Lock()
+        self.submitted = submitted
+        self.requests: Dict[str, Dict[str, Any]] = {}
+        self.stages: Dict[str, str] = {}
+
+    def defer(self, key: str, prompt: str, model: str, max_tokens: int, system: str = "", stage: str = "") -> None:
+        if key in self.submitted:
+            return
+        with self._lock:
+            self.requests[key] = {"custom_id": key, "params": llm_request(prompt, model, max_tokens, system)}
+            self.stages[key] = stage or "other"
+
+
+def llm_call(
+    client: Any,
+    prompt: str,
+    model: str,
+    max_tokens: int,
+    parse: Optional[Callable[[str], Any]] = None,
+    system: str = "",
+    stage: str = "",
+) -> Any:
+    """Single-turn Anthropic request; every LLM call site in v6 and v7 goes through here.
+
+    Returns `parse(text)` (or the text). A `system` prompt is the static,
+    provider-cached prefix; `prompt` is the per-source part. Requests go
+    through llm_create (rate limits, timeout, retries). With LLM_CACHE_DIR
+    set, the reply is cached by (model, prompt hashes, max_tokens) for
+    LLM_CACHE_MAX_AGE_S, so a rerun over unchanged pages makes no API calls.
+    Replies that `parse` rejects are not cached. Usage is charged to LLM_BUDGET
+    under `stage`. API and parse errors propagate to the caller, as does
+    LLMBudgetExceeded; during a --llm-batch collection pass a cache miss
+    raises LLMDeferred.
+    """
+    parse = parse or (lambda text: text)
+    key = llm_cache_key(model, prompt, max_tokens, system)
+    backend = get_cache_backend(LLM_CACHE_DIR) if LLM_CACHE_DIR else None
+    if backend:
+        record = backend.get_record(LLM_CACHE_NAMESPACE, key)
+        if record and (LLM_CACHE_MAX_AGE_S < 0 or time.time() - record[1] <= LLM_CACHE_MAX_AGE_S):
+            try:
+                value = parse(record[0]["text"])
+                LLM_STATS.incr("hits")
+                return value
+            except Exception:
+                pass  # Unusable entry (e.g. parser changed): ask again and overwrite it
+    collector = LLM_BATCH
+    if collector is not None:
+        collector.defer(key, prompt, model, max_tokens, system, stage)
+        raise LLMDeferred(key)
+    hold = LLM_BUDGET.reserve(stage or "other", model, len(prompt) // 4 + 1, max_tokens, len(system) // 4)
+    LLM_STATS.incr("misses")
+    try:
+        response = llm_create(client, prompt, model, max_tokens, system)
+    except BaseException:
+        LLM_BUDGET.release(hold)
+        raise
+    if getattr(response, "usage", None) is not None:
+        LLM_BUDGET.record(stage or "other", model, response.usage, hold=hold)
+    else:
+        LLM_BUDGET.release(hold)
+    text = response.content[0].text
+    value = parse(text)
+    if backend:
+        backend.put_record(LLM_CACHE_NAMESPACE, key, {"model": model, "max_tokens": max_tokens, "text": text})
+        if LLM_CACHE_MAX_BYTES > 0 and next(_llm_cache_writes) % CACHE_CHECK_EVERY == 0:
+            enforce_llm_cache_limit()
+    return value
+
+
+def _llm_batch_chunks(requests_: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+    """Split requests into batches within LLM_BATCH_MAX_REQUESTS / LLM_BATCH_MAX_BYTES."""
+    chunks: List[List[Dict[str, Any]]] = [[]]
+    size = 0
+    for req in requests_:
+        n = len(json.dumps(req))
+        if chunks[-1] and (len(chunks[-1]) >= LLM_BATCH_MAX_REQUESTS or size + n > LLM_BATCH_MAX_BYTES):
+            chunks.append([])
+            size = 0
+        chunks[-1].append(req)
+        size += n
+    return chunks
+
+
+def submit_llm_batch(client: Any, requests_: List[Dict[str, Any]], stages: Optional[Dict[str, str]] = None) -> int:
+    """Send one message batch, wait for it to end and store the answers in the LLM cache.
+
+    The batch id is checkpointed under LLM_BATCH_NAMESPACE, keyed by the
+    request set, so a run interrupted while waiting picks the same batch up
+    again instead of paying for a new one. Returns answers stored.
+    """
+    backend = get_cache_backend(LLM_CACHE_DIR)
+    checkpoint = sha256_hex("\n".join(r["custom_id"] for r in requests_))
+    record = backend.get_record(LLM_BATCH_NAMESPACE, checkpoint)
+    batch = None
+    if record and not record[0].get("ended"):
+        try:
+            batch = client.messages.batches.retrieve(record[0]["batch_id"])
+            print(f"Resuming LLM batch {batch.id} ({len(requests_)} requests)")
+        except Exception as e:
+            logging.warning(f"Cannot resume LLM batch {record[0]['batch_id']} ({e}); submitting a new one")
+    if batch is None:
+        batch = client.messages.batches.create(requests=requests_)
+        backend.put_record(LLM_BATCH_NAMESPACE, checkpoint, {"batch_id": batch.id, "ended": False})
+        print(f"Submitted LLM batch {batch.id} ({len(requests_)} requests)")
+
+    while batch.processing_status != "ended":
+        time.sleep(LLM_BATCH_POLL_S)
+        try:
+            batch = client.messages.batches.retrieve(batch.id)
+        except Exception as e:
+            if not _llm_retryable(e):
+                raise
+            logging.warning(f"Polling LLM batch {batch.id} failed ({e}); retrying")
+            continue
+        print(f"  LLM batch {batch.id}: {batch.processing_status}, "
+              f"{batch.request_counts.processing} of {len(requests_)} still processing")
+
+    params = {r["custom_id"]: r["params"] for r in requests_}
+    stored = failed = input_tokens = output_tokens = 0
+    for entry in client.messages.batches.results(batch.id):
+        p = params.get(entry.custom_id)
+        if p is None:
+            continue
+        if entry.result.type != "succeeded":
+            failed += 1
+            continue
+        message = entry.result.message
+        backend.put_record(LLM_CACHE_NAMESPACE, entry.custom_id,
+                           {"model": p["model"], "max_tokens": p["max_tokens"], "text": message.content[0].text})
+        stored += 1
+        input_tokens += message.usage.input_tokens
+        output_tokens += message.usage.output_tokens
+        LLM_BUDGET.record((stages or {}).get(entry.custom_id, "other"), p["model"], message.usage, batch=True)
+    backend.put_record(LLM_BATCH_NAMESPACE, checkpoint, {"batch_id": batch.id, "ended": True})
+    LLM_STATS.incr("batched", stored)
+    LLM_STATS.incr("batch_failed", failed)
+    print(f"LLM batch {batch.id}: {stored} answers ({input_tokens} input / {output_tokens} output tokens), "
+          f"{failed} errored or expired")
+    return stored
+
+
+def run_llm_batched(client: Any, run_pass: Callable[[], Any]) -> Any:
+    """--llm-batch: run `run_pass` with its LLM requests answered by message batches.
+
+    Each pass answers what it can from the LLM cache and defers the rest
+    (llm_call raises LLMDeferred, so callers fall back as if the LLM were
+    unavailable). The deferred requests go out as one batch and the pass runs
+    again; later rounds pick up requests that only arise from earlier answers
+    (e.g. a final review). Fetches and answers are cached, so the cache
+    checkpoints every phase. The first pass that defers nothing new is the
+    result; requests whose batch entry failed keep the heuristic fallback.
+    """
+    global LLM_BATCH
+    if not LLM_CACHE_DIR:
+        raise ValueError("--llm-batch needs the LLM response cache (no --no-cache / --no-llm-cache)")
+    submitted: set = set()
+    for round_no in itertools.count(1):
+        LLM_BATCH = LLMBatchCollector(submitted)
+        try:
+            result = run_pass()
+        finally:
+            collector, LLM_BATCH = LLM_BATCH, None
+        if not collector.requests or round_no > LLM_BATCH_MAX_ROUNDS:
+            return result
+        print(f"\nLLM batch round {round_no}: {len(collector.requests)} request(s) not in the LLM cache")
+        pending = [collector.requests[key] for key in sorted(collector.requests)]
+        pending = LLM_BUDGET.admit(pending, collector.stages)
+        for chunk in _llm_batch_chunks(pending) if pending else []:
+            submit_llm_batch(client, chunk, collector.stages)
+        submitted.update(collector.requests)  # Including requests the budget turned away
+        print(f"LLM batch round {round_no} done; resuming evaluation\n")
+
+
+def parse_json_reply(text: str) -> Any:
+    """JSON from a model reply, with or without a markdown code block."""
+    text = text.strip()
+    if "```json" in text:
+        text = text.split("```json")[1].split("```")[0].strip()
+    elif "```" in text:
+        text = text.split("```")[1].split("```")[0].strip()
+    return json.loads(text)
+
+
+def llm_review(
+    client: Any, prompt: str, model: str = DEFAULT_LLM_MODEL, max_tokens: int = 500, stage: str = ""
+) -> Optional[Dict[str, Any]]:
+    """Call Claude API for review under LLM_REVIEW_SYSTEM. Returns parsed JSON or None on error."""
+    if not client:
+        return None
+    try:
+        return llm_call(client, prompt, model, max_tokens, parse_json_reply, system=LLM_REVIEW_SYSTEM, stage=stage)
+    except Exception as e:
+        logging.debug(f"LLM review error: {e}")
+        return None
+
+
+# Parsers shared by the per-check calls and the consolidated review
+def _evidence_strength_verdict(result: Any) -> Optional[Tuple[str, str]]:
+    if isinstance(result, dict) and "strength" in result:
+        return result["strength"], result.get("reason", "LLM assessment")
+    return None
+
+
+def _self_interest_verdict(result: Any) -> Optional[Tuple[bool, str]]:
+    if isinstance(result, dict) and "is_self_interest" in result:
+        return result["is_self_interest"], result.get("reason", "LLM assessment")
+    return None
+
+
+def _satire_verdict(result: Any) -> Optional[Tuple[bool, str]]:
+    if isinstance(result, dict) and "is_satire" in result:
+        return result["is_satire"], result.get("reason", "LLM assessment")
+    return None
+
+
+def _severity_support_verdict(result: Any) -> Optional[Tuple[str, str, List[str]]]:
+    if isinstance(result, dict) and "status" in result:
+        return (
+            result["status"],
+            result.get("reason", "LLM assessment"),
+            result.get("still_missing", [])
+        )
+    return None
+
+
+def _source_type_verdict(result: Any) -> Optional[Dict[str, Any]]:
+    if isinstance(result, dict) and "source_type" in result:
+        return result
+    return None
+
+
+def _final_review_verdict(result: Any) -> Optional[Tuple[str, str]]:
+    if isinstance(result, dict) and "permission" in result:
+        return result["permission"], result.get("reason", "LLM assessment")
+    return None
+
+
+def _content_analysis_verdict(data: Any, truncated: bool) -> Optional[ContentAnalysis]:
+    if not isinstance(data, dict):
+        return None
+    return ContentAnalysis(
+        claims=data.get("claims", []),
+        contradiction_flags=data.get("contradictions", []),
+        confidence_level=data.get("confidence_level", "not_assessed"),
+        confidence_summary=data.get("confidence_summary", ""),
+        analysis_truncated=truncated,
+        analyzed=True,
+    )
+
+
+# Review sections: name -> (instructions, answer schema, output token budget, parser)
+LLM_REVIEW_SECTIONS: Dict[str, Tuple[str, str, int, Any]] = {
+    "satire": (SATIRE_GUIDE, SATIRE_SCHEMA, 500, _satire_verdict),
+    "source_type": (SOURCE_TYPE_GUIDE, SOURCE_TYPE_SCHEMA, 500, _source_type_verdict),
+    "evidence_strength": (EVIDENCE_STRENGTH_GUIDE, EVIDENCE_STRENGTH_SCHEMA, 500, _evidence_strength_verdict),
+    "self_interest": (SELF_INTEREST_GUIDE, SELF_INTEREST_SCHEMA, 500, _self_interest_verdict),
+    "severity_support": (SEVERITY_SUPPORT_GUIDE, SEVERITY_SUPPORT_SCHEMA, 500, _severity_support_verdict),
+    "content_analysis": (
+        f"{CONTENT_ANALYSIS_ROLE}\n\n{CONTENT_ANALYSIS_GUIDE}", CONTENT_ANALYSIS_SCHEMA, 1500, None,
+    ),
+    "final_review": (FINAL_REVIEW_GUIDE, FINAL_REVIEW_SCHEMA, 500, _final_review_verdict),
+}
+
+# Static system prompt for every review request (per-check and consolidated).
+# Each request carries only the source and names its section(s). The prefix
+# is ~2.3k tokens: a single section's instructions would fall under the
+# minimum cacheable length (1024 tokens, 2048 on Haiku), all of them do not.
+LLM_REVIEW_SYSTEM = "\n\n".join(
+    ["You review sources for an evidence evaluation. Each request gives one source and names the "
+     "section(s) to answer. Follow only those sections' instructions below, judge only the source in "
+     "the request, and answer in the requested JSON shape."]
+    + [f"=== SECTION: {name} ===\n{guide}\n\nAnswer shape:\n{schema}"
+       for name, (guide, schema, _, _) in LLM_REVIEW_SECTIONS.items()]
+)
+
+
+def llm_assess_evidence_strength(
+    client: Any,
+    text: str,
+    heuristic_strength: str,
+    model: str = DEFAULT_LLM_MODEL
+) -> Optional[Tuple[str, str]]:
+    """LLM review of evidence strength. Returns (strength, reason) or None."""
+    truncated = text[:LLM_MAX_TEXT_CHARS] if len(text) > LLM_MAX_TEXT_CHARS else text
+    prompt = f"""Analyze this source text for evidence strength.
+
+TEXT:
+{truncated}
+
+HEURISTIC ASSESSMENT: {heuristic_strength}
+
+Apply the evidence_strength section instructions. Respond ONLY with JSON:
+{EVIDENCE_STRENGTH_SCHEMA}"""
+
+    return _evidence_strength_verdict(llm_review(client, prompt, model, stage="evidence_strength"))
+
+
+def llm_assess_self_interest(
+    client: Any,
+    url: str,
+    text: str,
+    model: str = DEFAULT_LLM_MODEL
+) -> Optional[Tuple[bool, str]]:
+    """LLM review for self-interest. Returns (is_self_interest, reason) or None."""
+    truncated = text[:LLM_MAX_TEXT_CHARS] if len(text) > LLM_MAX_TEXT_CHARS else text
+    prompt = f"""Determine if this source has a self-interest conflict for evidentiary purposes.
+
+URL: {url}
+
+TEXT EXCERPT:
+{truncated}
+
+Apply the self_interest section instructions. Respond ONLY with JSON:
+{SELF_INTEREST_SCHEMA}"""
+
+    return _self_interest_verdict(llm_review(client, prompt, model, stage="self_interest"))
+
+
+def llm_assess_satire(
+    client: Any,
+    title: str,
+    text: str,
+    domain: str = "",
+    model: str = DEFAULT_LLM_MODEL
+) -> Optional[Tuple[bool, str]]:
+    """LLM review for satire/parody. Returns (is_satire, reason) or None."""
+    truncated = text[:3000] if len(text) > 3000 else text
+    prompt = f"""Determine if this source is satire, parody, or humor that should NEVER be cited as fact.
+
+SOURCE DOMAIN: {domain}
+ARTICLE TITLE: {title}
+
+TEXT EXCERPT:
+{truncated}
+
+Apply the satire section instructions. Respond ONLY with JSON:
+{SATIRE_SCHEMA}"""
+
+    return _satire_verdict(llm_review(client, prompt, model, stage="satire"))
+
+
+def llm_assess_severity_support(
+    client: Any,
+    text: str,
+    missing_elements: List[str],
+    model: str = DEFAULT_LLM_MODEL
+) -> Optional[Tuple[str, str, List[str]]]:
+    """LLM review for severity claim support. Returns (status, reason, still_missing) or None."""
+    truncated = text[:LLM_MAX_TEXT_CHARS] if len(text) > LLM_MAX_TEXT_CHARS else text
+    prompt = f"""Analyze if this text supports claims of systematic/widespread human rights violations.
+
+TEXT:
+{truncated}
+
+HEURISTICS FOUND MISSING: {', '.join(missing_elements)}
+
+Apply the severity_support section instructions. Respond ONLY with JSON:
+{SEVERITY_SUPPORT_SCHEMA}"""
+
+    return _severity_support_verdict(llm_review(client, prompt, model, stage="severity"))
+
+
+def llm_assess_source_type(
+    client: Any,
+    url: str,
+    domain: str,
+    text: str,
+    model: str = DEFAULT_LLM_MODEL
+) -> Optional[Dict[str, Any]]:
+    """
+    Comprehensive source type assessment for nuanced evidentiary handling.
+    Returns dict with source_type, evidence_level, and reasoning.
+    """
+    truncated = text[:LLM_MAX_TEXT_CHARS] if len(text) > LLM_MAX_TEXT_CHARS else text
+    prompt = f"""Analyze this source to determine its type and appropriate evidentiary use.
+
+URL: {url}
+DOMAIN: {domain}
+
+TEXT EXCERPT:
+{truncated}
+
+Apply the source_type section instructions. Respond ONLY with JSON:
+{SOURCE_TYPE_SCHEMA}"""
+
+    return _source_type_verdict(llm_review(client, prompt, model, stage="source_type"))
+
+
+def llm_final_review(
+    client: Any,
+    text: str,
+    heuristic_permission: str,
+    core_checks_summary: str,
+    model: str = DEFAULT_LLM_MODEL
+) -> Optional[Tuple[str, str]]:
+    """LLM final review for C: Context-only results. Returns (permission, reason) or None."""
+    truncated = text[:LLM_MAX_TEXT_CHARS] if len(text) > LLM_MAX_TEXT_CHARS else text
+    prompt = f"""Review this source evaluation for potential upgrade.
+
+TEXT EXCERPT:
+{truncated}
+
+HEURISTIC RESULT: {heuristic_permission}
+CHECKS SUMMARY: {core_checks_summary}
+
+Apply the final_review section instructions. Respond ONLY with JSON:
+{FINAL_REVIEW_SCHEMA}"""
+
+    return _final_review_verdict(llm_review(client, prompt, model, stage="final_review"))
+
+
+def llm_content_analysis(
+    client: Any,
+    text: str,
+    title: str,
+    url: str,
+    model: str = CONTENT_ANALYSIS_MODEL,
+) -> Optional[ContentAnalysis]:
+    """
+    Deep content analysis using Claude Sonnet.
+    Extracts claims, checks plausibility, flags contradictions.
+    Returns a ContentAnalysis dataclass or None on error.
+    """
+    if not client or not text:
+        return None
+
+    truncated = text[:CONTENT_ANALYSIS_MAX_CHARS]
+    was_truncated = len(text) > CONTENT_ANALYSIS_MAX_CHARS
+
+    prompt = f"""Analyze the factual claims in this article.
+
+ARTICLE TITLE: {title}
+URL: {url}
+
+FULL TEXT:
+{truncated}
+
+Apply the content_analysis section instructions. Respond ONLY with JSON:
+{CONTENT_ANALYSIS_SCHEMA}"""
+
+    return _content_analysis_verdict(llm_review(client, prompt, model, max_tokens=1500, stage="content_analysis"), was_truncated)
+
+
+def llm_consolidated_review(
+    client: Any,
+    url: str,
+    domain: str,
+    title: str,
+    text: str,
+    sections: Dict[str, str],
+    model: str = DEFAULT_LLM_MODEL,
+) -> Dict[str, Any]:
+    """Ask for every flagged review section in one request.
+
+    `sections` maps a LLM_REVIEW_SECTIONS name to the heuristic context shown
+    under its heading (may be empty); the instructions are in LLM_REVIEW_SYSTEM. Returns section -> verdict in the
+    shape the matching per-check llm_* function returns, None when the answer
+    is missing or unparseable. Content analysis switches the call to
+    CONTENT_ANALYSIS_MODEL and its longer text window.
+    """
+    deep = "content_analysis" in sections
+    limit = CONTENT_ANALYSIS_MAX_CHARS if deep else LLM_MAX_TEXT_CHARS
+    parts = [
+        "Review this source for an evidence evaluation. Answer every section below from the same "
+        "text; each section's instructions apply to that section's answer only.",
+        f"URL: {url}\nDOMAIN: {domain}\nARTICLE TITLE: {title}",
+        f"TEXT:\n{text[:limit]}",
+    ]
+    for name, context in sections.items():
+        parts.append(f"=== SECTION: {name} ===\n{context}" if context else f"=== SECTION: {name} ===")
+    answer_shape = ",\n".join(f'"{name}": {LLM_REVIEW_SECTIONS[name][1]}' for name in sections)
+    parts.append(f"Respond ONLY with one JSON object with exactly these keys:\n{{\n{answer_shape}\n}}")
+
+    data = llm_review(
+        client, "\n\n".join(parts), CONTENT_ANALYSIS_MODEL if deep else model,
+        max_tokens=sum(LLM_REVIEW_SECTIONS[name][2] for name in sections), stage="consolidated_review",
+    )
+    if not isinstance(data, dict):
+        data = {}
+    verdicts: Dict[str, Any] = {}
+    for name in sections:
+        if name == "content_analysis":
+            verdicts[name] = _content_analysis_verdict(data.get(name), len(text) > CONTENT_ANALYSIS_MAX_CHARS)
+        else:
+            verdicts[name] = LLM_REVIEW_SECTIONS[name][3](data.get(name))
+    return verdicts
+
+
+# -----------------------------------------------------------------------------
 # Fetching
 # -----------------------------------------------------------------------------
+class DomainThrottle:
+    """Per-domain politeness: space requests to the same registrable domain
+    at least `min_interval_s` apart, while different domains proceed freely.
+
+    Slots are reserved under a lock and slept outside it, so concurrent
+    workers queue up per domain instead of serializing the whole batch.
+    """
+
+    def __init__(self, min_interval_s: float):
+        self.min_interval_s = max(0.0, min_interval_s)
+        self._lock = threading.Lock()
+        self._next_slot: Dict[str, float] = {}
+
+    def reserve(self, domain: str) -> float:
+        """Reserve the next request slot for `domain`. Returns seconds to wait."""
+        if self.min_interval_s <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(domain, 0.0))
+            self._next_slot[domain] = slot + self.min_interval_s
+        return slot - now
+
+    def wait(self, domain: str) -> None:
+        delay = self.reserve(domain)
+        if delay > 0:
+            time.sleep(delay)
+
+
+def make_session() -> requests.Session:
+    """Build a requests session with the default browser headers."""
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    session.max_redirects = 10  # Prevent infinite redirect loops
+    return session
+
+
+_thread_state = threading.local()
+
+
+def thread_session() -> requests.Session:
+    """Return a session owned by the calling thread (sessions are not thread-safe)."""
+    session = getattr(_thread_state, "session", None)
+    if session is None:
+        session = make_session()
+        _thread_state.session = session
+    return session
+
+
+class CacheStats:
+    """Thread-safe fetch cache counters for the run summary."""
+
+    FIELDS = ("hits", "negative_hits", "misses", "revalidated", "extraction_hits", "evicted")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counts = {k: 0 for k in self.FIELDS}
+
+    def incr(self, key: str, n: int = 1) -> None:
+        with self._lock:
+            self.counts[key] += n
+
+    def summary(self) -> str:
+        c = self.counts
+        line = (f"Cache: {c['hits']} hits, {c['negative_hits']} negative hits, "
+                f"{c['misses']} misses ({c['revalidated']} revalidated with 304), "
+                f"{c['extraction_hits']} extraction results reused")
+        if c["evicted"]:
+            line += f", {c['evicted']} entries evicted"
+        return line
+
+
+CACHE_STATS = CacheStats()
+
+
+class LLMStats(CacheStats):
+    """llm_call counters: response cache hits/misses (a miss is one API
+    request), retries after rate-limit, overload or timeout errors, and
+    answers received through message batches."""
+
+    FIELDS = ("hits", "misses", "evicted", "retries", "rate_limited", "batched", "batch_failed")
+
+    def summary(self) -> str:
+        c = self.counts
+        line = f"LLM cache: {c['hits']} hits, {c['misses']} misses (API calls)"
+        if c["batched"] or c["batch_failed"]:
+            line += f", {c['batched']} answers from message batches ({c['batch_failed']} failed)"
+        if c["evicted"]:
+            line += f", {c['evicted']} responses evicted"
+        if c["retries"]:
+            line += f"; {c['retries']} retries ({c['rate_limited']} rate-limited/overloaded)"
+        return line
+
+
+LLM_STATS = LLMStats()
+
+
+class ExtractionStats(CacheStats):
+    """Which HTML extractors ran and which candidate won, per parsed page."""
+
+    FIELDS = ("pages", "readability_runs", "fallback_runs",
+              "jsonld_selected", "article_selected", "readability_selected", "fallback_selected")
+
+    def summary(self) -> str:
+        c = self.counts
+        pages = c["pages"] or 1
+        return (f"Extraction: {c['pages']} pages parsed; selected jsonld {c['jsonld_selected']}, "
+                f"article {c['article_selected']}, readability {c['readability_selected']}, "
+                f"fallback {c['fallback_selected']}; readability ran on {c['readability_runs']} "
+                f"({100 * c['readability_runs'] / pages:.0f}%), full-body text on {c['fallback_runs']} "
+                f"({100 * c['fallback_runs'] / pages:.0f}%)")
+
+
+EXTRACTION_STATS = ExtractionStats()
+
+
+class DomainVerdictStats(CacheStats):
+    """Outlet-level LLM verdicts reused from the domain store vs asked per article."""
+
+    FIELDS = ("reused", "asked", "disagreed")
+
+    def summary(self) -> str:
+        c = self.counts
+        return (f"Domain verdicts: {c['reused']} reused, {c['asked']} asked per article "
+                f"({c['disagreed']} where the article's heuristics disagreed with the domain verdict)")
+
+
+DOMAIN_VERDICT_STATS = DomainVerdictStats()
+
+
+def cache_ttl_class(doc: FetchedDoc) -> str:
+    """Map a fetch outcome onto a CACHE_TTLS policy key."""
+    if doc.fetch_status in ("ok", "pdf", "timeout", "error"):
+        return doc.fetch_status
+    if doc.status_code in (404, 410):
+        return "not_found"
+    if doc.status_code and doc.status_code >= 500:
+        return "server_error"
+    return "http_error"
+
+
+def cache_ttl_for(doc: FetchedDoc, max_age_s: int) -> int:
+    """TTL for a cached doc; `max_age_s` applies to successful HTML pages."""
+    ttl_class = cache_ttl_class(doc)
+    if ttl_class == "ok":
+        return max_age_s
+    return CACHE_TTLS.get(ttl_class, max_age_s)
+
+
 def cache_paths(cache_dir: str, url: str) -> Tuple[str, str]:
     h = sha256_hex(url)
     return os.path.join(cache_dir, f"{h}.json"), os.path.join(cache_dir, f"{h}.txt")
 
 
-def read_cache(cache_dir: str, url: str, max_age_s: int) -> Optional[FetchedDoc]:
-    meta_path, text_path = cache_paths(cache_dir, url)
-    if not os.path.exists(meta_path):
+def _doc_from_meta(meta: Dict[str, Any], text: str) -> FetchedDoc:
+    """Rebuild a FetchedDoc from stored metadata, ignoring unknown keys."""
+    known = {f.name for f in dataclasses.fields(FetchedDoc)}
+    doc = FetchedDoc(**{k: v for k, v in meta.items() if k in known})
+    doc.text = text
+    return doc
+
+
+def _doc_to_meta(doc: FetchedDoc) -> Dict[str, Any]:
+    meta = dataclasses.asdict(doc)
+    meta["html"] = ""
+    meta["text"] = ""
+    return meta
+
+
+def body_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def compress_body(data: bytes) -> Tuple[str, bytes]:
+    """Compress a raw response body. Returns (codec, blob); zstd when available."""
+    if HAS_ZSTD:
+        return "zstd", zstandard.ZstdCompressor(level=10).compress(data)
+    return "gzip", gzip.compress(data, compresslevel=6)
+
+
+def decompress_body(codec: str, blob: bytes) -> bytes:
+    if codec == "zstd":
+        return zstandard.ZstdDecompressor().decompress(blob)
+    return gzip.decompress(blob)
+
+
+class CacheBackend(abc.ABC):
+    """Storage interface for the fetch cache and its auxiliary records.
+
+    Fetch entries are keyed by requested URL; records are small JSON values
+    grouped by namespace (e.g. per-domain publisher profiles).
+    """
+
+    @abc.abstractmethod
+    def get(self, url: str) -> Optional[Tuple[FetchedDoc, float]]:
+        """Return (doc, stored_at) or None."""
+
+    @abc.abstractmethod
+    def put(self, url: str, doc: FetchedDoc, stored_at: Optional[float] = None) -> None:
+        ...
+
+    @abc.abstractmethod
+    def touch(self, url: str) -> None:
+        ...
+
+    @abc.abstractmethod
+    def get_record(self, namespace: str, key: str) -> Optional[Tuple[Any, float]]:
+        ...
+
+    @abc.abstractmethod
+    def put_record(self, namespace: str, key: str, value: Any) -> None:
+        ...
+
+    @abc.abstractmethod
+    def get_body(self, digest: str) -> Optional[bytes]:
+        """Raw response body by content hash, decompressed."""
+
+    @abc.abstractmethod
+    def put_body(self, data: bytes) -> str:
+        """Store a raw body (deduplicated by content). Returns its hash."""
+
+    @abc.abstractmethod
+    def iter_urls(self) -> List[str]:
+        ...
+
+    @abc.abstractmethod
+    def usage(self) -> int:
+        """Bytes the cache occupies on disk."""
+
+    @abc.abstractmethod
+    def evict(self, target_bytes: int) -> int:
+        """Drop least-recently-used entries until usage() <= target_bytes.
+
+        Raw bodies go first (PDFs before HTML), then extraction results,
+        then fetched pages, then other records. Returns entries removed.
+        """
+
+    @abc.abstractmethod
+    def record_usage(self, namespace: str) -> int:
+        """Stored bytes of one record namespace."""
+
+    @abc.abstractmethod
+    def evict_records(self, namespace: str, target_bytes: int) -> int:
+        """Drop least-recently-used records of `namespace` until its
+        record_usage() <= target_bytes. Returns records removed."""
+
+
+class DirectoryCache(CacheBackend):
+    """Legacy layout: a .json/.txt file pair per URL, records as JSON files.
+
+    mtime is the stored_at used for TTLs, so reads record access by setting
+    atime explicitly (independent of noatime/relatime mounts).
+    """
+
+    ENTRY_RE = re.compile(r"[0-9a-f]{16}\.(?:json|txt)")
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+
+    @staticmethod
+    def _accessed(path: str) -> None:
+        try:
+            os.utime(path, (time.time(), os.stat(path).st_mtime))
+        except OSError:
+            pass
+
+    def get(self, url: str) -> Optional[Tuple[FetchedDoc, float]]:
+        meta_path, text_path = cache_paths(self.cache_dir, url)
+        if not os.path.exists(meta_path):
+            return None
+        try:
+            stored_at = os.stat(meta_path).st_mtime
+            meta = json.loads(open(meta_path, "r", encoding="utf-8").read())
+            text = ""
+            if os.path.exists(text_path):
+                text = open(text_path, "r", encoding="utf-8", errors="ignore").read()
+            self._accessed(meta_path)
+            return _doc_from_meta(meta, text), stored_at
+        except Exception:
+            return None
+
+    def put(self, url: str, doc: FetchedDoc, stored_at: Optional[float] = None) -> None:
+        ensure_dir(self.cache_dir)
+        meta_path, text_path = cache_paths(self.cache_dir, url)
+        try:
+            with open(meta_path, "w", encoding="utf-8") as f:
+                json.dump(_doc_to_meta(doc), f, ensure_ascii=False, indent=2)
+            with open(text_path, "w", encoding="utf-8") as f:
+                f.write(doc.text or "")
+            if stored_at is not None:
+                os.utime(meta_path, (stored_at, stored_at))
+        except Exception:
+            pass
+
+    def touch(self, url: str) -> None:
+        meta_path, _ = cache_paths(self.cache_dir, url)
+        try:
+            os.utime(meta_path, None)
+        except OSError:
+            pass
+
+    def _record_path(self, namespace: str, key: str) -> str:
+        safe = re.sub(r"[^a-z0-9.-]", "_", key.lower())
+        return os.path.join(self.cache_dir, namespace, f"{safe}.json")
+
+    def get_record(self, namespace: str, key: str) -> Optional[Tuple[Any, float]]:
+        path = self._record_path(namespace, key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                record = json.load(f), os.stat(path).st_mtime
+        except (OSError, ValueError):
+            return None
+        self._accessed(path)
+        return record
+
+    def put_record(self, namespace: str, key: str, value: Any) -> None:
+        path = self._record_path(namespace, key)
+        try:
+            ensure_dir(os.path.dirname(path))
+            with open(path + ".tmp", "w", encoding="utf-8") as f:
+                json.dump(value, f, ensure_ascii=False)
+            os.replace(path + ".tmp", path)
+        except OSError:
+            pass
+
+    def _body_path(self, digest: str, codec: str) -> str:
+        return os.path.join(self.cache_dir, "bodies", digest[:2], f"{digest}.{codec}")
+
+    def get_body(self, digest: str) -> Optional[bytes]:
+        for codec in ("zstd", "gzip"):
+            path = self._body_path(digest, codec)
+            if os.path.exists(path):
+                try:
+                    with open(path, "rb") as f:
+                        data = decompress_body(codec, f.read())
+                except Exception:
+                    return None
+                self._accessed(path)
+                return data
         return None
-    try:
-        age = time.time() - os.stat(meta_path).st_mtime
-        if max_age_s >= 0 and age > max_age_s:
+
+    def put_body(self, data: bytes) -> str:
+        digest = body_hash(data)
+        codec, blob = compress_body(data)
+        path = self._body_path(digest, codec)
+        if not os.path.exists(path):
+            try:
+                ensure_dir(os.path.dirname(path))
+                with open(path + ".tmp", "wb") as f:
+                    f.write(blob)
+                os.replace(path + ".tmp", path)
+            except OSError:
+                pass
+        return digest
+
+    def iter_urls(self) -> List[str]:
+        urls = []
+        for name in os.listdir(self.cache_dir) if os.path.isdir(self.cache_dir) else []:
+            if re.fullmatch(r"[0-9a-f]{16}\.json", name):
+                try:
+                    with open(os.path.join(self.cache_dir, name), "r", encoding="utf-8") as f:
+                        urls.append(json.load(f)["url"])
+                except (OSError, ValueError, KeyError):
+                    continue
+        return urls
+
+    def _entries(self) -> List[Tuple[Tuple[int, float], int, List[str]]]:
+        """Evictable entries as ((tier, atime), bytes, paths), tiers in eviction order."""
+        if not os.path.isdir(self.cache_dir):
+            return []
+        entries, pdf_bodies = [], set()
+        for name in os.listdir(self.cache_dir):
+            path = os.path.join(self.cache_dir, name)
+            if not (name.endswith(".json") and self.ENTRY_RE.fullmatch(name)):
+                continue
+            paths = [p for p in (path, path[:-len(".json")] + ".txt") if os.path.exists(p)]
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    meta = json.load(f)
+                atime, size = os.stat(path).st_atime, sum(os.stat(p).st_size for p in paths)
+            except (OSError, ValueError):
+                continue
+            if meta.get("fetch_status") == "pdf" and meta.get("body_hash"):
+                pdf_bodies.add(meta["body_hash"])
+            entries.append(((3, atime), size, paths))
+        for name in os.listdir(self.cache_dir):
+            subdir = os.path.join(self.cache_dir, name)
+            if not os.path.isdir(subdir):
+                continue
+            for root, _, files in os.walk(subdir):
+                for fname in files:
+                    path = os.path.join(root, fname)
+                    if name == "bodies":
+                        tier = 0 if fname.split(".")[0] in pdf_bodies else 1
+                    else:
+                        tier = 2 if name.startswith("extraction-") else 4
+                    try:
+                        st = os.stat(path)
+                    except OSError:
+                        continue
+                    entries.append(((tier, st.st_atime), st.st_size, [path]))
+        return entries
+
+    def usage(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self, target_bytes: int) -> int:
+        entries = sorted(self._entries(), key=lambda e: e[0])
+        excess = sum(size for _, size, _ in entries) - target_bytes
+        removed = 0
+        for _, size, paths in entries:
+            if excess <= 0:
+                break
+            for path in paths:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            excess -= size
+            removed += 1
+        return removed
+
+    def _namespace_files(self, namespace: str) -> List[Tuple[float, int, str]]:
+        """(atime, bytes, path) for every record file of `namespace`."""
+        directory = os.path.join(self.cache_dir, namespace)
+        files = []
+        for name in os.listdir(directory) if os.path.isdir(directory) else []:
+            path = os.path.join(directory, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            files.append((st.st_atime, st.st_size, path))
+        return files
+
+    def record_usage(self, namespace: str) -> int:
+        return sum(size for _, size, _ in self._namespace_files(namespace))
+
+    def evict_records(self, namespace: str, target_bytes: int) -> int:
+        files = sorted(self._namespace_files(namespace))
+        excess = sum(size for _, size, _ in files) - target_bytes
+        removed = 0
+        for _, size, path in files:
+            if excess <= 0:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            excess -= size
+            removed += 1
+        return removed
+
+
+class SQLiteCache(CacheBackend):
+    """Single-file cache in `<cache_dir>/cache.sqlite3`.
+
+    WAL mode lets many evaluator processes read while one writes; upserts are
+    atomic, text is stored zlib-compressed, and entries are indexed by both
+    requested URL and final (post-redirect) URL. Every row carries an
+    accessed_at timestamp for LRU eviction.
+    """
+
+    FILENAME = "cache.sqlite3"
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS fetch_cache (
+            url          TEXT PRIMARY KEY,
+            final_url    TEXT NOT NULL DEFAULT '',
+            fetch_status TEXT NOT NULL DEFAULT '',
+            meta         TEXT NOT NULL,
+            text         BLOB,
+            stored_at    REAL NOT NULL,
+            accessed_at  REAL NOT NULL DEFAULT 0
+        );
+        CREATE INDEX IF NOT EXISTS idx_fetch_cache_final_url ON fetch_cache(final_url);
+        CREATE TABLE IF NOT EXISTS records (
+            namespace TEXT NOT NULL,
+            key       TEXT NOT NULL,
+            value       TEXT NOT NULL,
+            stored_at   REAL NOT NULL,
+            accessed_at REAL NOT NULL DEFAULT 0,
+            PRIMARY KEY (namespace, key)
+        );
+        CREATE TABLE IF NOT EXISTS bodies (
+            hash      TEXT PRIMARY KEY,
+            codec     TEXT NOT NULL,
+            body      BLOB NOT NULL,
+            size        INTEGER NOT NULL,
+            stored_at   REAL NOT NULL,
+            accessed_at REAL NOT NULL DEFAULT 0
+        );
+    """
+    # (table, size expression, filter, ordering) in eviction order
+    EVICTION_ORDER = (
+        ("bodies", "size", "",
+         "hash IN (SELECT json_extract(meta, '$.body_hash') FROM fetch_cache "
+         "WHERE fetch_status = 'pdf') DESC, accessed_at"),
+        ("records", "length(value)", "WHERE namespace LIKE 'extraction-%'", "accessed_at"),
+        ("fetch_cache", "length(meta) + ifnull(length(text), 0)", "", "accessed_at"),
+        ("records", "length(value)", "WHERE namespace NOT LIKE 'extraction-%'", "accessed_at"),
+    )
+
+    def __init__(self, cache_dir: str):
+        ensure_dir(cache_dir)
+        self.path = os.path.join(cache_dir, self.FILENAME)
+        self._local = threading.local()
+        with self._conn() as conn:
+            conn.executescript(self.SCHEMA)
+            for table in ("fetch_cache", "records", "bodies"):
+                columns = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+                if "accessed_at" not in columns:
+                    conn.execute(f"ALTER TABLE {table} ADD COLUMN accessed_at REAL NOT NULL DEFAULT 0")
+                    conn.execute(f"UPDATE {table} SET accessed_at = stored_at")
+        conn = self._conn()
+        if conn.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+            # Files created before incremental auto-vacuum: switching needs one full rebuild
+            try:
+                conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+                conn.execute("VACUUM")
+            except sqlite3.Error as e:
+                logging.debug(f"Cache vacuum failed for {self.path}: {e}")
+
+    def _accessed(self, table: str, where: str, params: Tuple[Any, ...]) -> None:
+        try:
+            with self._conn() as conn:
+                conn.execute(f"UPDATE {table} SET accessed_at = ? WHERE {where}", (time.time(), *params))
+        except sqlite3.Error:
+            pass
+
+    def _conn(self) -> sqlite3.Connection:
+        """One connection per thread (sqlite3 connections are not shareable)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            # Must precede journal_mode: WAL writes the header and auto_vacuum is then fixed
+            conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=30000")
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _find(conn: sqlite3.Connection, url: str, columns: str) -> Optional[Tuple[Any, ...]]:
+        """`columns` of the entry for `url`, else of the latest entry redirected to it."""
+        row = conn.execute(f"SELECT {columns} FROM fetch_cache WHERE url = ?", (url,)).fetchone()
+        if row is None:
+            # Same page previously reached through a redirect
+            row = conn.execute(
+                f"SELECT {columns} FROM fetch_cache WHERE final_url = ? ORDER BY stored_at DESC LIMIT 1", (url,)
+            ).fetchone()
+        return row
+
+    def get(self, url: str) -> Optional[Tuple[FetchedDoc, float]]:
+        try:
+            row = self._find(self._conn(), url, "rowid, meta, text, stored_at")
+            if row is None:
+                return None
+            rowid, meta, blob, stored_at = row
+            self._accessed("fetch_cache", "rowid = ?", (rowid,))
+            text = zlib.decompress(blob).decode("utf-8", errors="ignore") if blob else ""
+            doc = _doc_from_meta(json.loads(meta), text)
+            doc.url = url
+            return doc, stored_at
+        except (sqlite3.Error, zlib.error, ValueError, TypeError):
             return None
-        meta = json.loads(open(meta_path, "r", encoding="utf-8").read())
-        text = ""
-        if os.path.exists(text_path):
-            text = open(text_path, "r", encoding="utf-8", errors="ignore").read()
-        doc = FetchedDoc(**meta)
-        doc.text = text
-        return doc
-    except Exception:
+
+    def put(self, url: str, doc: FetchedDoc, stored_at: Optional[float] = None) -> None:
+        blob = zlib.compress((doc.text or "").encode("utf-8"))
+        try:
+            with self._conn() as conn:
+                conn.execute(
+                    "INSERT INTO fetch_cache (url, final_url, fetch_status, meta, text, stored_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT(url) DO UPDATE SET final_url = excluded.final_url, "
+                    "fetch_status = excluded.fetch_status, meta = excluded.meta, "
+                    "text = excluded.text, stored_at = excluded.stored_at, "
+                    "accessed_at = excluded.accessed_at",
+                    (url, doc.final_url or "", doc.fetch_status,
+                     json.dumps(_doc_to_meta(doc), ensure_ascii=False), blob,
+                     time.time() if stored_at is None else stored_at, time.time()),
+                )
+        except sqlite3.Error as e:
+            logging.debug(f"Cache write failed for {url}: {e}")
+
+    def touch(self, url: str) -> None:
+        try:
+            with self._conn() as conn:
+                # The same entry get() would return, including one found by its redirect target
+                row = self._find(conn, url, "rowid")
+                if row is not None:
+                    conn.execute("UPDATE fetch_cache SET stored_at = ? WHERE rowid = ?", (time.time(), row[0]))
+        except sqlite3.Error:
+            pass
+
+    def get_record(self, namespace: str, key: str) -> Optional[Tuple[Any, float]]:
+        try:
+            row = self._conn().execute(
+                "SELECT value, stored_at FROM records WHERE namespace = ? AND key = ?", (namespace, key)
+            ).fetchone()
+            if row is None:
+                return None
+            self._accessed("records", "namespace = ? AND key = ?", (namespace, key))
+            return json.loads(row[0]), row[1]
+        except (sqlite3.Error, ValueError):
+            return None
+
+    def put_record(self, namespace: str, key: str, value: Any) -> None:
+        try:
+            with self._conn() as conn:
+                conn.execute(
+                    "INSERT INTO records (namespace, key, value, stored_at, accessed_at) VALUES (?, ?, ?, ?, ?) "
+                    "ON CONFLICT(namespace, key) DO UPDATE SET value = excluded.value, "
+                    "stored_at = excluded.stored_at, accessed_at = excluded.accessed_at",
+                    (namespace, key, json.dumps(value, ensure_ascii=False), time.time(), time.time()),
+                )
+        except sqlite3.Error as e:
+            logging.debug(f"Record write failed for {namespace}/{key}: {e}")
+
+    def get_body(self, digest: str) -> Optional[bytes]:
+        try:
+            row = self._conn().execute("SELECT codec, body FROM bodies WHERE hash = ?", (digest,)).fetchone()
+            if row is None:
+                return None
+            self._accessed("bodies", "hash = ?", (digest,))
+            return decompress_body(row[0], row[1])
+        except Exception:
+            return None
+
+    def put_body(self, data: bytes) -> str:
+        digest = body_hash(data)
+        try:
+            conn = self._conn()
+            if conn.execute("SELECT 1 FROM bodies WHERE hash = ?", (digest,)).fetchone():
+                return digest
+            codec, blob = compress_body(data)
+            with conn:
+                conn.execute(
+                    "INSERT OR IGNORE INTO bodies (hash, codec, body, size, stored_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (digest, codec, blob, len(blob), time.time(), time.time()),
+                )
+        except sqlite3.Error as e:
+            logging.debug(f"Body write failed for {digest}: {e}")
+        return digest
+
+    def iter_urls(self) -> List[str]:
+        try:
+            return [row[0] for row in self._conn().execute("SELECT url FROM fetch_cache")]
+        except sqlite3.Error:
+            return []
+
+    def usage(self) -> int:
+        """Bytes on disk: used database pages plus the WAL file."""
+        try:
+            conn = self._conn()
+            page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+            pages = conn.execute("PRAGMA page_count").fetchone()[0] - conn.execute("PRAGMA freelist_count").fetchone()[0]
+        except sqlite3.Error:
+            return 0
+        try:
+            wal = os.path.getsize(self.path + "-wal")
+        except OSError:
+            wal = 0
+        return pages * page_size + wal
+
+    def evict(self, target_bytes: int) -> int:
+        removed = 0
+        try:
+            conn = self._conn()
+            # Fold the WAL into the database first so usage() counts each page once
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchall()
+            excess = self.usage() - target_bytes
+            for table, size, where, order in self.EVICTION_ORDER:
+                if excess <= 0:
+                    break
+                victims = []
+                for rowid, nbytes in conn.execute(f"SELECT rowid, {size} FROM {table} {where} ORDER BY {order}"):
+                    if excess <= 0:
+                        break
+                    victims.append((rowid,))
+                    excess -= nbytes or 0
+                with conn:
+                    conn.executemany(f"DELETE FROM {table} WHERE rowid = ?", victims)
+                removed += len(victims)
+            if removed:
+                # Return the freed pages to the filesystem; the checkpoint applies the
+                # truncation to the database file and resets the WAL. executescript
+                # runs the pragma to completion (execute() frees one page per step).
+                conn.executescript("PRAGMA incremental_vacuum;")
+                conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchall()
+        except sqlite3.Error as e:
+            logging.debug(f"Cache eviction failed: {e}")
+        return removed
+
+    def record_usage(self, namespace: str) -> int:
+        try:
+            return self._conn().execute(
+                "SELECT ifnull(sum(length(value)), 0) FROM records WHERE namespace = ?", (namespace,)
+            ).fetchone()[0]
+        except sqlite3.Error:
+            return 0
+
+    def evict_records(self, namespace: str, target_bytes: int) -> int:
+        excess = self.record_usage(namespace) - target_bytes
+        victims = []
+        try:
+            conn = self._conn()
+            for rowid, nbytes in conn.execute(
+                "SELECT rowid, length(value) FROM records WHERE namespace = ? ORDER BY accessed_at", (namespace,)
+            ):
+                if excess <= 0:
+                    break
+                victims.append((rowid,))
+                excess -= nbytes or 0
+            with conn:
+                conn.executemany("DELETE FROM records WHERE rowid = ?", victims)
+        except sqlite3.Error as e:
+            logging.debug(f"Record eviction failed for {namespace}: {e}")
+            return 0
+        return len(victims)
+
+
+CACHE_BACKENDS = {"sqlite": SQLiteCache, "files": DirectoryCache}
+CACHE_BACKEND = "sqlite"  # Overridden by --cache-backend
+CACHE_MAX_BYTES = 0  # High-water mark for stored bytes, 0 = unbounded (--cache-max-bytes)
+CACHE_LOW_WATER = 0.9  # Eviction trims to this fraction of CACHE_MAX_BYTES
+CACHE_CHECK_EVERY = 50  # Cache writes between size checks
+_cache_writes = itertools.count()
+_backends: Dict[Tuple[str, str], CacheBackend] = {}
+_backends_lock = threading.Lock()
+
+
+def get_cache_backend(cache_dir: str) -> CacheBackend:
+    """Shared backend instance for a cache directory."""
+    key = (CACHE_BACKEND, os.path.abspath(cache_dir))
+    with _backends_lock:
+        backend = _backends.get(key)
+        if backend is None:
+            backend = CACHE_BACKENDS[CACHE_BACKEND](cache_dir)
+            _backends[key] = backend
+        return backend
+
+
+def migrate_directory_cache(cache_dir: str, backend: Optional[CacheBackend] = None) -> int:
+    """One-shot import of the legacy .json/.txt file pairs (and publisher
+    profiles) in `cache_dir` into the SQLite store. Entries keep their
+    original mtime as stored_at so TTLs carry over. Returns entries migrated.
+    """
+    backend = backend or SQLiteCache(cache_dir)
+    legacy = DirectoryCache(cache_dir)
+    migrated = 0
+    for name in sorted(os.listdir(cache_dir)) if os.path.isdir(cache_dir) else []:
+        if not re.fullmatch(r"[0-9a-f]{16}\.json", name):
+            continue
+        meta_path = os.path.join(cache_dir, name)
+        try:
+            meta = json.loads(open(meta_path, "r", encoding="utf-8").read())
+        except (OSError, ValueError):
+            continue
+        url = meta.get("url", "")
+        entry = legacy.get(url) if url else None
+        if entry:
+            backend.put(url, entry[0], stored_at=entry[1])
+            migrated += 1
+    publishers_dir = os.path.join(cache_dir, "publishers")
+    for name in sorted(os.listdir(publishers_dir)) if os.path.isdir(publishers_dir) else []:
+        if name.endswith(".json"):
+            record = legacy.get_record("publishers", name[:-len(".json")])
+            if record:
+                backend.put_record("publishers", record[0].get("domain", name[:-len(".json")]), record[0])
+                migrated += 1
+    return migrated
+
+
+def read_cache_entry(cache_dir: str, url: str, max_age_s: int) -> Tuple[Optional[FetchedDoc], bool]:
+    """Read a cache entry regardless of age. Returns (doc, is_fresh).
+
+    Freshness follows the status-aware TTL policy (see CACHE_TTLS); a
+    negative `max_age_s` disables expiry. Expired entries are still returned
+    (with is_fresh=False) so the caller can revalidate them with the stored
+    ETag / Last-Modified validators.
+    """
+    backend = get_cache_backend(cache_dir)
+    entry = backend.get(url)
+    if entry is None:
+        return None, False
+    doc, stored_at = entry
+    fresh = max_age_s < 0 or time.time() - stored_at <= cache_ttl_for(doc, max_age_s)
+    # Restore the raw HTML so link discovery works on cache hits too, and on
+    # stale entries a 304 revalidation hands back unchanged
+    if doc.body_hash and doc.fetch_status == "ok":
+        raw = backend.get_body(doc.body_hash)
+        doc.html = raw.decode("utf-8", errors="ignore") if raw else ""
+    return doc, fresh
+
+
+def read_cache(cache_dir: str, url: str, max_age_s: int) -> Optional[FetchedDoc]:
+    doc, fresh = read_cache_entry(cache_dir, url, max_age_s)
+    return doc if fresh else None
+
+
+def touch_cache(cache_dir: str, url: str) -> None:
+    """Restart an entry's TTL after a 304 Not Modified."""
+    get_cache_backend(cache_dir).touch(url)
+
+
+def conditional_headers(cached: Optional[FetchedDoc]) -> Dict[str, str]:
+    """If-None-Match / If-Modified-Since headers for revalidating a stale entry."""
+    if not cached or cached.fetch_status not in ("ok", "pdf"):
+        return {}
+    headers = {}
+    if cached.etag:
+        headers["If-None-Match"] = cached.etag
+    if cached.last_modified:
+        headers["If-Modified-Since"] = cached.last_modified
+    return headers
+
+
+def write_cache(cache_dir: str, url: str, doc: FetchedDoc, body: bytes = b"") -> None:
+    """Store a fetch result; a non-empty raw `body` is kept compressed and
+    content-addressed so the page can be re-extracted without refetching."""
+    backend = get_cache_backend(cache_dir)
+    if body:
+        doc.body_hash = backend.put_body(body)
+    backend.put(url, doc)
+    if CACHE_MAX_BYTES > 0 and next(_cache_writes) % CACHE_CHECK_EVERY == 0:
+        enforce_cache_limit(cache_dir)
+
+
+def enforce_cache_limit(cache_dir: str) -> int:
+    """Evict LRU entries once the cache exceeds CACHE_MAX_BYTES.
+    Returns entries removed."""
+    if CACHE_MAX_BYTES <= 0:
+        return 0
+    backend = get_cache_backend(cache_dir)
+    if backend.usage() <= CACHE_MAX_BYTES:
+        return 0
+    removed = backend.evict(int(CACHE_MAX_BYTES * CACHE_LOW_WATER))
+    CACHE_STATS.incr("evicted", removed)
+    return removed
+
+
+def artifact_namespace(pipeline: str, kind: str) -> str:
+    """Record namespace for a pipeline's derived artifacts, e.g. "v6-verdicts".
+
+    Fetched pages, raw bodies and extraction results are shared by every
+    pipeline using the cache directory; only what a pipeline derives from
+    them (verdicts, claims) is kept apart.
+    """
+    return f"{pipeline}-{kind}"
+
+
+def read_artifact(cache_dir: str, pipeline: str, kind: str, key: str, max_age_s: int = -1) -> Optional[Any]:
+    """Stored artifact value, or None if missing or older than `max_age_s`
+    (negative = never expires)."""
+    record = get_cache_backend(cache_dir).get_record(artifact_namespace(pipeline, kind), sha256_hex(key))
+    if record is None:
         return None
+    value, stored_at = record
+    if max_age_s >= 0 and time.time() - stored_at > max_age_s:
+        return None
+    return value
+
+
+def write_artifact(cache_dir: str, pipeline: str, kind: str, key: str, value: Any) -> None:
+    # Keys are hashed: they are usually URLs, too long for file-backed records
+    get_cache_backend(cache_dir).put_record(artifact_namespace(pipeline, kind), sha256_hex(key), value)
+
 
+def reextract_cache(cache_dir: str) -> Tuple[int, int]:
+    """Rebuild text/meta for every cached page from its stored raw body.
 
-def write_cache(cache_dir: str, url: str, doc: FetchedDoc) -> None:
-    ensure_dir(cache_dir)
-    meta_path, text_path = cache_paths(cache_dir, url)
+    Runs the current extractors at CPU speed without touching the network;
+    entries keep their stored_at so TTLs are unaffected. Returns
+    (re-extracted, skipped without a stored body).
+    """
+    backend = get_cache_backend(cache_dir)
+    done = skipped = 0
+    for url in backend.iter_urls():
+        entry = backend.get(url)
+        if entry is None:
+            continue
+        doc, stored_at = entry
+        raw = backend.get_body(doc.body_hash) if doc.body_hash else None
+        if not raw:
+            skipped += 1
+            continue
+        try:
+            if doc.fetch_status == "pdf":
+                if not HAS_PDFMINER:
+                    skipped += 1
+                    continue
+                doc.text = cached_pdf_extraction(cache_dir, raw, force=True)
+            elif doc.fetch_status == "ok":
+                html = raw.decode("utf-8", errors="ignore")
+                _apply_html_extraction(doc, html, url, cache_dir, force=True)
+                if not doc.status_code or doc.status_code < 400:
+                    wall_warnings = ("Bot-block/anti-automation detected", "Paywall/login wall detected")
+                    doc.warnings = [w for w in doc.warnings if w not in wall_warnings]
+                    _detect_access_walls(doc, html)
+            else:
+                skipped += 1
+                continue
+        except Exception as e:
+            logging.debug(f"Re-extraction failed for {url}: {e}")
+            skipped += 1
+            continue
+        doc.html = ""
+        backend.put(url, doc, stored_at=stored_at)
+        done += 1
+    return done, skipped
+
+
+LAZY_EXTRACTION = True  # Skip extractors that cannot change the pick (--eager-extraction disables)
+
+# Elements removed before reading <article> / fallback text
+NOISE_TAGS = ["script", "style", "noscript", "svg", "nav", "footer", "header", "aside", "form", "button"]
+# Elements whose id/class contains one of these are removed as well
+NOISE_ID_CLASS_KEYWORDS = ["nav", "menu", "subscribe", "cookie", "newsletter", "advert", "banner", "modal", "social", "comment"]
+DEFAULT_NOISE = (tuple(NOISE_TAGS), tuple(NOISE_ID_CLASS_KEYWORDS))
+CONTROL_CHARS_RE = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f]')
+_noise_local = threading.local()  # lxml XPath objects are kept per thread
+_noise_patterns: Dict[Tuple[str, ...], Optional["re.Pattern[str]"]] = {}
+
+
+def load_noise_config(path: str) -> None:
+    """Override the noise lists from JSON: {"tags": [...], "id_class_keywords": [...]}.
+    Either key may be omitted; matching is case-insensitive."""
+    with open(path, "r", encoding="utf-8") as f:
+        config = json.load(f)
+    tags = [str(t).lower() for t in config.get("tags", NOISE_TAGS)]
+    keywords = [str(k).lower() for k in config.get("id_class_keywords", NOISE_ID_CLASS_KEYWORDS)]
+    bad = [v for v in tags if not re.fullmatch(r"[a-z][a-z0-9-]*", v)]
+    bad += [v for v in keywords if not re.fullmatch(r"[a-z0-9_-]+", v)]
+    if bad:
+        raise ValueError(f"Invalid noise tag/keyword(s) in {path}: {', '.join(bad)}")
+    NOISE_TAGS[:] = tags
+    NOISE_ID_CLASS_KEYWORDS[:] = keywords
+
+
+def _noise_keyword_re() -> Optional["re.Pattern[str]"]:
+    """NOISE_ID_CLASS_KEYWORDS as one compiled case-insensitive alternation."""
+    key = tuple(NOISE_ID_CLASS_KEYWORDS)
+    if key not in _noise_patterns:
+        _noise_patterns[key] = re.compile("|".join(map(re.escape, key)), re.I) if key else None
+    return _noise_patterns[key]
+
+
+def _noise_elements(root: Any) -> set:
+    """Elements to prune. Noise tags are filtered by libxml2 inside iter();
+    an XPath prefilter hands only elements carrying an id or class to the
+    precompiled keyword regex. (A pure XPath 1.0 predicate was measured
+    slower: translate() is re-evaluated per keyword per element.)"""
+    pruned = set(root.iter(*NOISE_TAGS)) if NOISE_TAGS else set()
+    pattern = _noise_keyword_re()
+    if pattern is None:
+        return pruned
+    attributed = getattr(_noise_local, "xpath", None)
+    if attributed is None:
+        attributed = _noise_local.xpath = lxml.etree.XPath("descendant-or-self::*[@id or @class]")
+    pruned.update(el for el in attributed(root)
+                  if pattern.search(f"{el.get('id') or ''} {el.get('class') or ''}"))
+    return pruned
+
+
+def _jsonld_article_body(raw: str) -> str:
+    """Longest articleBody/text in a JSON-LD block (object or top-level array)."""
     try:
-        meta = dataclasses.asdict(doc)
-        meta["html"] = ""
-        meta["text"] = ""
-        with open(meta_path, "w", encoding="utf-8") as f:
-            json.dump(meta, f, ensure_ascii=False, indent=2)
-        with open(text_path, "w", encoding="utf-8") as f:
-            f.write(doc.text or "")
-    except Exception:
-        pass
+        data = json.loads(raw)
+    except ValueError:
+        return ""
+    best = ""
+    for item in data if isinstance(data, list) else [data]:
+        if isinstance(item, dict):
+            body = item.get("articleBody") or item.get("text") or ""
+            if isinstance(body, str) and len(body) > len(best):
+                best = body
+    return best
+
+
+def _pick_candidate(candidates: Dict[str, str]) -> Tuple[str, str]:
+    """Choose the main text among extraction candidates. Returns (source, text).
+
+    Quality-first strategy:
+    - JSON-LD articleBody is the cleanest (author-written content only)
+    - <article> tag is usually clean if present and not too large
+    - Readability is good when it returns a focused article (<15K chars)
+    - When all sources are huge, take the shortest that has >= 500 chars
+    - Fallback (full page text) is last resort
+    """
+    source, best = "", ""
+    if "jsonld" in candidates and len(candidates["jsonld"]) >= 500:
+        source, best = "jsonld", candidates["jsonld"]
+    else:
+        # Score candidates by quality: shorter is usually cleaner (less noise)
+        # but must be >= 500 chars to be meaningful article content
+        scored = []
+        for name, text in candidates.items():
+            if name == "fallback":
+                continue  # fallback is last resort
+            tlen = len(text)
+            if tlen < 500:
+                continue
+            # Prefer sources in the 500-15000 char sweet spot (typical article)
+            # Penalize very large extractions (likely grabbed navigation/ads)
+            if tlen <= 15000:
+                score = 1000  # ideal range
+            elif tlen <= 30000:
+                score = 500   # acceptable
+            else:
+                score = 100   # probably too noisy
+            # Bonus for JSON-LD and article tag (structurally cleaner)
+            if name == "jsonld":
+                score += 500
+            elif name == "article":
+                score += 200
+            scored.append((score, name, text))
+        if scored:
+            scored.sort(reverse=True)
+            _, source, best = scored[0]
+
+    # Final fallback
+    if not best or len(best) < 200:
+        source, best = "fallback", candidates.get("fallback", "")
+    return source, best
 
 
-def extract_from_html(html: str, url: str) -> Tuple[Dict[str, str], str, str]:
-    """Extract metadata and text from HTML."""
+def _html_candidates_bs4(html: str) -> Tuple[Dict[str, str], str, Dict[str, str]]:
+    """Legacy extraction: BeautifulSoup tree, plus separate readability parses.
+    Returns (meta, title, candidates); the "fallback" candidate is always set."""
     soup = BeautifulSoup(html, "html.parser")
     meta = {}
 
@@ -1031,30 +3016,15 @@ def extract_from_html(html: str, url: str) -> Tuple[Dict[str, str], str, str]:
             raw = (sc.string or sc.get_text() or "").strip()
             if not raw:
                 continue
-            try:
-                data = json.loads(raw)
-                if isinstance(data, dict):
-                    body = data.get("articleBody") or data.get("text") or ""
-                    if isinstance(body, str) and len(body) > len(main_text):
-                        main_text = body
-                # Handle JSON-LD arrays (some sites use @graph)
-                elif isinstance(data, list):
-                    for item in data:
-                        if isinstance(item, dict):
-                            body = item.get("articleBody") or item.get("text") or ""
-                            if isinstance(body, str) and len(body) > len(main_text):
-                                main_text = body
-            except Exception:
-                pass
+            body = _jsonld_article_body(raw)
+            if len(body) > len(main_text):
+                main_text = body
     except Exception:
         pass
 
     # Remove noise (AFTER JSON-LD extraction)
-    for tag in soup(["script", "style", "noscript", "svg"]):
+    for tag in soup(NOISE_TAGS):
         tag.decompose()
-    for tagname in ["nav", "footer", "header", "aside", "form", "button"]:
-        for t in soup.find_all(tagname):
-            t.decompose()
 
     # Kill common noise patterns
     for t in soup.find_all(True):
@@ -1066,13 +3036,11 @@ def extract_from_html(html: str, url: str) -> Tuple[Dict[str, str], str, str]:
             if isinstance(tag_class, str):
                 tag_class = [tag_class]
             ident = " ".join([str(tag_id), " ".join(str(c) for c in tag_class)]).lower()
-            noise_kw = ["nav", "menu", "subscribe", "cookie", "newsletter", "advert", "banner", "modal", "social", "comment"]
-            if any(k in ident for k in noise_kw):
+            if any(k in ident for k in NOISE_ID_CLASS_KEYWORDS):
                 t.decompose()
         except (AttributeError, TypeError):
             continue
 
-    # Gather all candidate texts, then pick the best one
     candidates = {}
 
     if main_text and len(main_text) >= 200:
@@ -1087,9 +3055,9 @@ def extract_from_html(html: str, url: str) -> Tuple[Dict[str, str], str, str]:
 
     # Try readability
     if HAS_READABILITY:
+        EXTRACTION_STATS.incr("readability_runs")
         try:
-            clean_html = re.sub(r'[\x00-\x08\x0b\x0c\x0e-\x1f]', '', html)
-            doc = Document(clean_html)
+            doc = Document(CONTROL_CHARS_RE.sub('', html))
             summary = doc.summary(html_partial=True)
             s2 = BeautifulSoup(summary, "html.parser")
             readable = s2.get_text(separator="\n")
@@ -1098,56 +3066,195 @@ def extract_from_html(html: str, url: str) -> Tuple[Dict[str, str], str, str]:
         except Exception:
             pass
 
-    # Fallback to full body text (noisiest)
-    fallback = soup.get_text(separator="\n")
-    if len(fallback) >= 200:
-        candidates["fallback"] = fallback
-
-    # Pick the best candidate using a quality-first strategy:
-    # - JSON-LD articleBody is the cleanest (author-written content only)
-    # - <article> tag is usually clean if present and not too large
-    # - Readability is good when it returns a focused article (<15K chars)
-    # - When all sources are huge, take the shortest that has >= 500 chars
-    # - Fallback (full page text) is last resort
-    best = ""
-    if "jsonld" in candidates and len(candidates["jsonld"]) >= 500:
-        best = candidates["jsonld"]
-    else:
-        # Score candidates by quality: shorter is usually cleaner (less noise)
-        # but must be >= 500 chars to be meaningful article content
-        scored = []
-        for source, text in candidates.items():
-            if source == "fallback":
-                continue  # fallback is last resort
-            tlen = len(text)
-            if tlen < 500:
-                continue
-            # Prefer sources in the 500-15000 char sweet spot (typical article)
-            # Penalize very large extractions (likely grabbed navigation/ads)
-            if tlen <= 15000:
-                score = 1000  # ideal range
-            elif tlen <= 30000:
-                score = 500   # acceptable
-            else:
-                score = 100   # probably too noisy
-            # Bonus for JSON-LD and article tag (structurally cleaner)
-            if source == "jsonld":
-                score += 500
-            elif source == "article":
-                score += 200
-            scored.append((score, source, text))
+    # Full body text (noisiest)
+    EXTRACTION_STATS.incr("fallback_runs")
+    candidates["fallback"] = soup.get_text(separator="\n")
+    return meta, title, candidates
 
-        if scored:
-            scored.sort(reverse=True)
-            best = scored[0][2]
 
-    # Final fallback
-    if not best or len(best) < 200:
-        best = fallback if fallback else ""
+if HAS_READABILITY:
+    class _ArticleDocument(Document):
+        """readability Document that keeps the sanitized article element, so
+        its text is read from the tree instead of reparsing summary()."""
+
+        article = None
+
+        def sanitize(self, node, *args, **kwargs):
+            cleaned = super().sanitize(node, *args, **kwargs)
+            self.article = node
+            return cleaned
+
+
+WHITESPACE_PRESERVING_TAGS = {"pre", "textarea"}
+ASCII_SPACES = "\x20\x0a\x09\x0c\x0d"
+
+
+def _tree_text(el: Any, skip: Optional[set] = None) -> str:
+    """Text nodes joined by newlines, matching BeautifulSoup's get_text("\\n").
+
+    Comments are skipped and whitespace-only nodes outside <pre>/<textarea>
+    collapse to a single newline or space. Subtrees of elements in `skip` are
+    left out but their tail text is kept as its own node, as after decompose(),
+    so candidate lengths line up with the legacy extractor.
+    """
+    parts: List[str] = []
+    preserve = 0
+    skip = skip or set()
+
+    def add(text: str) -> None:
+        if not preserve and not text.strip(ASCII_SPACES):
+            text = "\n" if "\n" in text else " "
+        parts.append(text)
+
+    walker = lxml.etree.iterwalk(el, events=("start", "end"))
+    for event, node in walker:
+        is_element = isinstance(node.tag, str)
+        if event == "start":
+            if node in skip:
+                walker.skip_subtree()
+            elif is_element:
+                if node.tag in WHITESPACE_PRESERVING_TAGS:
+                    preserve += 1
+                if node.text:
+                    add(node.text)
+        else:
+            if is_element and node.tag in WHITESPACE_PRESERVING_TAGS and node not in skip:
+                preserve -= 1
+            if node is not el and node.tail:
+                add(node.tail)
+    return "\n".join(parts)
+
+
+def _html_candidates_lxml(html: str, lazy: bool = False) -> Tuple[Dict[str, str], str, Dict[str, str]]:
+    """Single-parse extraction: one lxml (libxml2) tree feeds metadata, JSON-LD,
+    <article>, fallback text and finally readability. Noise is pruned by
+    skipping subtrees while reading text rather than by mutating the tree, so
+    readability can score the same tree last.
+
+    With `lazy`, extractors run cheapest first and stop as soon as an earlier
+    candidate is certain to win under _pick_candidate: JSON-LD of 500+ chars
+    always wins, and an <article> of 500-15000 chars (score 1200) beats any
+    readability result (at most 1000). Skipped candidates are simply absent.
+    Returns (meta, title, candidates); "fallback" is set unless skipped.
+    """
+    data = CONTROL_CHARS_RE.sub("", html).encode("utf-8", "replace")
+    root = lxml.html.document_fromstring(data, parser=lxml.html.HTMLParser(encoding="utf-8"))
+
+    names: Dict[str, str] = {}
+    props: Dict[str, str] = {}
+    for tag in root.iter("meta"):
+        content = str(tag.get("content") or "").strip()
+        if tag.get("name") is not None:
+            names.setdefault(tag.get("name"), content)
+        if tag.get("property") is not None:
+            props.setdefault(tag.get("property"), content)
+
+    title = ""
+    title_el = next(root.iter("title"), None)
+    if title_el is not None and len(title_el) == 0 and title_el.text:
+        title = title_el.text.strip()
+    title = title or props.get("og:title") or names.get("twitter:title") or ""
+
+    meta = {
+        "description": props.get("og:description") or names.get("description") or "",
+        "published_time": props.get("article:published_time") or "",
+        "author": names.get("author") or props.get("article:author") or "",
+    }
+
+    main_text = ""
+    for sc in root.iter("script"):
+        if "ld+json" in (sc.get("type") or "").lower():
+            raw = (sc.text or "").strip()
+            body = _jsonld_article_body(raw) if raw else ""
+            if len(body) > len(main_text):
+                main_text = body
+
+    candidates = {}
+    if main_text and len(main_text) >= 200:
+        candidates["jsonld"] = main_text
+    if lazy and len(main_text) >= 500:
+        return meta, title, candidates
+
+    pruned = _noise_elements(root)
+
+    # First <article> that survives pruning
+    for art in root.iter("article"):
+        if art in pruned or any(a in pruned for a in art.iterancestors()):
+            continue
+        art_text = _tree_text(art, pruned)
+        if len(art_text) >= 200:
+            candidates["article"] = art_text
+        break
+    if lazy and 500 <= len(candidates.get("article", "")) <= 15000:
+        return meta, title, candidates
+
+    EXTRACTION_STATS.incr("fallback_runs")
+    candidates["fallback"] = "" if root in pruned else _tree_text(root, pruned)
+
+    # Readability mutates the tree, so it runs last
+    if HAS_READABILITY:
+        EXTRACTION_STATS.incr("readability_runs")
+        try:
+            doc = _ArticleDocument(root)
+            doc.summary(html_partial=True)
+            readable = _tree_text(doc.article) if doc.article is not None else ""
+            if len(readable) >= 200:
+                candidates["readability"] = readable
+        except Exception:
+            pass
+    return meta, title, candidates
+
 
+def extract_from_html(html: str, url: str) -> Tuple[Dict[str, str], str, str]:
+    """Extract metadata and text from HTML."""
+    meta, title, candidates = None, "", {}
+    if HAS_LXML:
+        try:
+            meta, title, candidates = _html_candidates_lxml(html, lazy=LAZY_EXTRACTION)
+        except (lxml.etree.ParserError, ValueError):
+            pass  # e.g. empty document; html.parser is more forgiving
+    if meta is None:
+        meta, title, candidates = _html_candidates_bs4(html)
+    source, best = _pick_candidate(candidates)
+    EXTRACTION_STATS.incr("pages")
+    EXTRACTION_STATS.incr(f"{source}_selected")
     return meta, title, clean_text(best)
 
 
+def compare_extractors(cache_dir: str) -> Tuple[int, List[str], float, float]:
+    """Check the lxml extractor against the legacy BeautifulSoup one on every
+    cached HTML body (the golden corpus). Returns (pages compared, URLs whose
+    metadata, selected candidate or final text differ, legacy seconds, lxml
+    seconds)."""
+    backend = get_cache_backend(cache_dir)
+    compared, mismatches = 0, []
+    legacy_s = lxml_s = 0.0
+    for url in backend.iter_urls():
+        entry = backend.get(url)
+        if entry is None or entry[0].fetch_status != "ok" or not entry[0].body_hash:
+            continue
+        raw = backend.get_body(entry[0].body_hash)
+        if not raw:
+            continue
+        html = raw.decode("utf-8", errors="ignore")
+        started = time.perf_counter()
+        try:
+            new_meta, new_title, new_candidates = _html_candidates_lxml(html, lazy=LAZY_EXTRACTION)
+        except (lxml.etree.ParserError, ValueError):
+            continue
+        lxml_s += time.perf_counter() - started
+        started = time.perf_counter()
+        old_meta, old_title, old_candidates = _html_candidates_bs4(html)
+        legacy_s += time.perf_counter() - started
+        new_source, new_text = _pick_candidate(new_candidates)
+        old_source, old_text = _pick_candidate(old_candidates)
+        compared += 1
+        if ((new_meta, new_title, new_source) != (old_meta, old_title, old_source)
+                or clean_text(new_text) != clean_text(old_text)):
+            mismatches.append(f"{url} ({old_source} -> {new_source})")
+    return compared, mismatches, legacy_s, lxml_s
+
+
 def sanitize_url(url: str) -> str:
     """Fix malformed URLs before fetching.
 
@@ -1178,12 +3285,98 @@ KNOWN_PAYWALL_DOMAINS = {
 }
 
 
-def _process_response(doc: FetchedDoc, resp: requests.Response, url: str, cache_dir: str) -> None:
-    """Process an HTTP response and populate the FetchedDoc."""
+# Bump whenever extract_from_html / PDF extraction output changes: cached
+# extraction results are keyed by (body hash, EXTRACTOR_VERSION), so a bump
+# invalidates that layer without touching fetched bodies.
+EXTRACTOR_VERSION = "1"
+
+
+def _extraction_namespace() -> str:
+    namespace = f"extraction-v{EXTRACTOR_VERSION}"
+    noise = (tuple(NOISE_TAGS), tuple(NOISE_ID_CLASS_KEYWORDS))
+    if noise != DEFAULT_NOISE:
+        # Results under a custom noise config are kept apart from the defaults
+        namespace += "-" + sha256_hex(json.dumps(noise))[:8]
+    return namespace
+
+
+def cached_html_extraction(
+    cache_dir: str, html: str, url: str, force: bool = False
+) -> Tuple[Dict[str, str], str, str]:
+    """`extract_from_html` memoized by body hash and extractor version.
+
+    Syndicated copies, mirrors and redirect aliases with an identical body
+    skip parsing entirely. An empty `cache_dir` disables the lookup; `force`
+    recomputes and overwrites the stored result.
+    """
+    if not cache_dir:
+        return extract_from_html(html, url)
+    backend = get_cache_backend(cache_dir)
+    key = body_hash(html.encode("utf-8"))
+    if not force:
+        record = backend.get_record(_extraction_namespace(), key)
+        if record is not None:
+            CACHE_STATS.incr("extraction_hits")
+            value = record[0]
+            return value["meta"], value["title"], value["text"]
+    meta, title, text = extract_from_html(html, url)
+    backend.put_record(_extraction_namespace(), key, {"meta": meta, "title": title, "text": text})
+    return meta, title, text
+
+
+def cached_pdf_extraction(cache_dir: str, data: bytes, force: bool = False) -> str:
+    """PDF text extraction memoized by body hash and extractor version."""
+    if not cache_dir:
+        return _extract_pdf_text(data)
+    backend = get_cache_backend(cache_dir)
+    key = body_hash(data)
+    if not force:
+        record = backend.get_record(_extraction_namespace(), key)
+        if record is not None:
+            CACHE_STATS.incr("extraction_hits")
+            return record[0]["text"]
+    text = _extract_pdf_text(data)
+    backend.put_record(_extraction_namespace(), key, {"text": text})
+    return text
+
+
+def _apply_html_extraction(doc: FetchedDoc, html: str, url: str, cache_dir: str = "", force: bool = False) -> None:
+    """Populate text/meta fields of `doc` from an HTML body."""
+    meta, title, text = cached_html_extraction(cache_dir, html, doc.final_url or url, force)
+    doc.html = html
+    doc.meta = meta
+    doc.title = title
+    doc.author = meta.get("author", "")
+    doc.published = meta.get("published_time", "")
+    doc.text = text
+
+
+def _detect_access_walls(doc: FetchedDoc, html: str) -> None:
+    """Flag paywall/bot-block boilerplate in a successfully fetched page."""
+    hits = KEYWORD_SCANNER.scan(normalize(html + " " + doc.text))
+    if hits.any("botblock"):
+        doc.warnings.append("Bot-block/anti-automation detected")
+    if hits.any("paywall"):
+        doc.warnings.append("Paywall/login wall detected")
+
+
+def _extract_pdf_text(data: bytes) -> str:
+    return clean_text(pdf_extract_text(io.BytesIO(data)) or "")
+
+
+def _process_response(doc: FetchedDoc, resp: requests.Response, url: str, cache_dir: str) -> bytes:
+    """Process an HTTP response and populate the FetchedDoc.
+
+    Extraction results are memoized in `cache_dir` (pass "" to bypass).
+    Returns the raw body worth keeping for later re-extraction (the decoded
+    HTML as UTF-8, or the PDF bytes); empty when nothing usable came back.
+    """
     doc.status_code = resp.status_code
     doc.final_url = str(resp.url)
     doc.content_type = resp.headers.get("content-type", "")
     doc.bytes_downloaded = len(resp.content or b"")
+    doc.etag = resp.headers.get("etag", "")
+    doc.last_modified = resp.headers.get("last-modified", "")
 
     if resp.status_code >= 400:
         # Distinguish paywall from generic HTTP errors
@@ -1202,7 +3395,7 @@ def _process_response(doc: FetchedDoc, resp: requests.Response, url: str, cache_
         resp.encoding = resp.encoding or "utf-8"
         html = resp.text or ""
         if len(html) > 1000 and "text/html" in doc.content_type.lower():
-            meta, title, text = extract_from_html(html, doc.final_url or url)
+            meta, title, text = cached_html_extraction(cache_dir, html, doc.final_url or url)
             if len(text) > 500:
                 # We got substantial content despite the error code
                 doc.html = html
@@ -1213,41 +3406,31 @@ def _process_response(doc: FetchedDoc, resp: requests.Response, url: str, cache_
                 doc.text = text
                 doc.fetch_status = "ok"  # Override — we got usable content
                 doc.warnings.append(f"Content extracted despite HTTP {resp.status_code}")
+                return html.encode("utf-8")
             else:
                 doc.fetch_status = "http_error"
         else:
             doc.fetch_status = "http_error"
+        return b""
     elif "pdf" in doc.content_type.lower() or doc.final_url.lower().endswith(".pdf"):
         doc.fetch_status = "pdf"
         if HAS_PDFMINER:
             try:
-                ensure_dir(cache_dir)
-                pdf_path = os.path.join(cache_dir, f"{sha256_hex(url)}.pdf")
-                with open(pdf_path, "wb") as f:
-                    f.write(resp.content)
-                doc.text = clean_text(pdf_extract_text(pdf_path) or "")
+                doc.text = cached_pdf_extraction(cache_dir, resp.content)
             except Exception as e:
                 doc.warnings.append(f"PDF extraction failed: {e}")
         else:
             doc.warnings.append("PDF extraction unavailable (pdfminer not installed)")
+        return resp.content or b""
     else:
         resp.encoding = resp.encoding or "utf-8"
         html = resp.text or ""
-        doc.html = html
-        meta, title, text = extract_from_html(html, doc.final_url or url)
-        doc.meta = meta
-        doc.title = title
-        doc.author = meta.get("author", "")
-        doc.published = meta.get("published_time", "")
-        doc.text = text
+        _apply_html_extraction(doc, html, url, cache_dir)
         doc.fetch_status = "ok"
 
         # Check for paywall/botblock
-        combined = normalize(html + " " + text)
-        if any(normalize(h) in combined for h in BOTBLOCK_HINTS):
-            doc.warnings.append("Bot-block/anti-automation detected")
-        if any(normalize(h) in combined for h in PAYWALL_HINTS):
-            doc.warnings.append("Paywall/login wall detected")
+        _detect_access_walls(doc, html)
+        return html.encode("utf-8")
 
 
 def fetch_doc(
@@ -1258,17 +3441,27 @@ def fetch_doc(
     timeout_s: int,
     cache_max_age_s: int,
     no_cache: bool,
+    throttle: Optional[DomainThrottle] = None,
 ) -> FetchedDoc:
     """Fetch a document with automatic URL sanitization, retry on 403, and
-    extended timeouts for known slow domains."""
+    extended timeouts for known slow domains.
+
+    With a `throttle`, politeness is enforced per domain before the request;
+    without one, the legacy global `sleep_s` pause follows every fetch.
+    """
 
     # Sanitize URL before anything else
     url = sanitize_url(url)
 
+    stale = None
     if not no_cache:
-        cached = read_cache(cache_dir, url, cache_max_age_s)
-        if cached:
+        cached, fresh = read_cache_entry(cache_dir, url, cache_max_age_s)
+        if cached and fresh:
+            CACHE_STATS.incr("hits" if cached.fetch_status in ("ok", "pdf") else "negative_hits")
             return cached
+        stale = cached
+        CACHE_STATS.incr("misses")
+    revalidate = conditional_headers(stale)
 
     doc = FetchedDoc(url=url, fetched_at=utc_now_iso())
     doc.domain = registrable_domain(url)
@@ -1278,9 +3471,13 @@ def fetch_doc(
     if doc.domain in SLOW_DOMAINS:
         effective_timeout = max(timeout_s, 45)
 
+    if throttle:
+        throttle.wait(doc.domain)
+
+    body = b""
     try:
         resp = session.get(
-            url, headers=HEADERS, timeout=effective_timeout,
+            url, headers={**HEADERS, **revalidate}, timeout=effective_timeout,
             allow_redirects=True,
         )
 
@@ -1288,26 +3485,147 @@ def fetch_doc(
         if resp.status_code == 403:
             time.sleep(1)  # Brief pause before retry
             resp = session.get(
-                url, headers=RETRY_HEADERS, timeout=effective_timeout,
+                url, headers={**RETRY_HEADERS, **revalidate}, timeout=effective_timeout,
                 allow_redirects=True,
             )
 
-        _process_response(doc, resp, url, cache_dir)
+        # Not modified: keep the cached body and extraction, restart its TTL
+        if resp.status_code == 304 and stale:
+            touch_cache(cache_dir, url)
+            CACHE_STATS.incr("revalidated")
+            if not throttle:
+                time.sleep(sleep_s)
+            return stale
+
+        body = _process_response(doc, resp, url, "" if no_cache else cache_dir)
+
+    except requests.exceptions.TooManyRedirects:
+        doc.fetch_status = "error"
+        doc.warnings.append("Redirect loop detected (too many redirects)")
+    except requests.Timeout:
+        doc.fetch_status = "timeout"
+        doc.warnings.append(f"Request timed out ({effective_timeout}s)")
+    except Exception as e:
+        doc.fetch_status = "error"
+        doc.warnings.append(f"Fetch error: {e}")
+
+    if not no_cache:
+        write_cache(cache_dir, url, doc, body)
+    if not throttle:
+        time.sleep(sleep_s)
+    return doc
+
+
+async def async_fetch_doc(
+    client: "httpx.AsyncClient",
+    url: str,
+    cache_dir: str,
+    timeout_s: int,
+    cache_max_age_s: int,
+    no_cache: bool,
+    semaphore: asyncio.Semaphore,
+    throttle: Optional[DomainThrottle] = None,
+) -> FetchedDoc:
+    """Async counterpart of `fetch_doc` on a shared httpx connection pool.
+
+    Fills the same FetchedDoc and reads/writes the same cache entries.
+    Extraction is CPU-bound, so it runs in a worker thread to keep the
+    event loop free for other downloads.
+    """
+    url = sanitize_url(url)
+
+    stale = None
+    if not no_cache:
+        cached, fresh = await asyncio.to_thread(read_cache_entry, cache_dir, url, cache_max_age_s)
+        if cached and fresh:
+            CACHE_STATS.incr("hits" if cached.fetch_status in ("ok", "pdf") else "negative_hits")
+            return cached
+        stale = cached
+        CACHE_STATS.incr("misses")
+    revalidate = conditional_headers(stale)
+
+    doc = FetchedDoc(url=url, fetched_at=utc_now_iso())
+    doc.domain = registrable_domain(url)
+
+    effective_timeout = timeout_s
+    if doc.domain in SLOW_DOMAINS:
+        effective_timeout = max(timeout_s, 45)
+
+    resp = None
+    async with semaphore:
+        # Reserve the domain slot only once a request can actually go out;
+        # slots taken before queueing on the semaphore would fire back-to-back
+        if throttle:
+            delay = throttle.reserve(doc.domain)
+            if delay > 0:
+                await asyncio.sleep(delay)
+        try:
+            resp = await client.get(url, headers={**HEADERS, **revalidate}, timeout=effective_timeout)
+            # Retry on 403 with alternate headers (different browser fingerprint)
+            if resp.status_code == 403:
+                await asyncio.sleep(1)
+                resp = await client.get(url, headers={**RETRY_HEADERS, **revalidate}, timeout=effective_timeout)
+        except httpx.TooManyRedirects:
+            doc.fetch_status = "error"
+            doc.warnings.append("Redirect loop detected (too many redirects)")
+        except httpx.TimeoutException:
+            doc.fetch_status = "timeout"
+            doc.warnings.append(f"Request timed out ({effective_timeout}s)")
+        except Exception as e:
+            doc.fetch_status = "error"
+            doc.warnings.append(f"Fetch error: {e}")
+
+    # Not modified: keep the cached body and extraction, restart its TTL
+    if resp is not None and resp.status_code == 304 and stale:
+        await asyncio.to_thread(touch_cache, cache_dir, url)
+        CACHE_STATS.incr("revalidated")
+        return stale
+
+    def finish() -> None:
+        body = b""
+        if resp is not None:
+            try:
+                body = _process_response(doc, resp, url, "" if no_cache else cache_dir)
+            except Exception as e:
+                doc.fetch_status = "error"
+                doc.warnings.append(f"Fetch error: {e}")
+        if not no_cache:
+            write_cache(cache_dir, url, doc, body)
+
+    await asyncio.to_thread(finish)
+    return doc
+
 
-    except requests.exceptions.TooManyRedirects:
-        doc.fetch_status = "error"
-        doc.warnings.append("Redirect loop detected (too many redirects)")
-    except requests.Timeout:
-        doc.fetch_status = "timeout"
-        doc.warnings.append(f"Request timed out ({effective_timeout}s)")
-    except Exception as e:
-        doc.fetch_status = "error"
-        doc.warnings.append(f"Fetch error: {e}")
+def fetch_docs_async(
+    urls: List[str],
+    cache_dir: str,
+    sleep_s: float,
+    timeout_s: int,
+    cache_max_age_s: int,
+    no_cache: bool,
+    concurrency: int,
+) -> List[FetchedDoc]:
+    """Fetch many URLs concurrently with httpx; results keep input order.
 
-    if not no_cache:
-        write_cache(cache_dir, url, doc)
-    time.sleep(sleep_s)
-    return doc
+    Requests share one connection pool, are bounded by a semaphore of size
+    `concurrency`, and `sleep_s` is enforced per registrable domain.
+    """
+    if not HAS_HTTPX:
+        raise RuntimeError("httpx is not installed; use the synchronous fetch_doc path")
+
+    async def run() -> List[FetchedDoc]:
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        throttle = DomainThrottle(sleep_s)
+        limits = httpx.Limits(max_connections=max(1, concurrency), max_keepalive_connections=max(1, concurrency))
+        async with httpx.AsyncClient(
+            headers=HEADERS, follow_redirects=True, max_redirects=10, limits=limits,
+        ) as client:
+            return list(await asyncio.gather(*[
+                async_fetch_doc(client, u, cache_dir, timeout_s, cache_max_age_s, no_cache, semaphore, throttle)
+                for u in urls
+            ]))
+
+    return asyncio.run(run())
 
 
 def crawl_publisher_pages(
@@ -1319,6 +3637,7 @@ def crawl_publisher_pages(
     cache_max_age_s: int,
     no_cache: bool,
     max_pages: int = 3,
+    throttle: Optional[DomainThrottle] = None,
 ) -> List[FetchedDoc]:
     """Crawl publisher's about/policy pages."""
     if not main.final_url:
@@ -1331,7 +3650,10 @@ def crawl_publisher_pages(
     for path in CRAWL_PATHS:
         if len(pages) >= max_pages:
             break
-        doc = fetch_doc(session, urljoin(root, path), cache_dir, sleep_s, timeout_s, cache_max_age_s, no_cache)
+        doc = fetch_doc(
+            session, urljoin(root, path), cache_dir, sleep_s, timeout_s, cache_max_age_s, no_cache,
+            throttle=throttle,
+        )
         if doc.fetch_status in ("ok", "pdf") and len(doc.text or "") > 150:
             pages.append(doc)
 
@@ -1385,9 +3707,10 @@ def assess_completeness(doc: FetchedDoc) -> Tuple[Completeness, str]:
         warning_detail = "; ".join(doc.warnings) if doc.warnings else doc.fetch_status
         return Completeness.FAILED, f"Fetch failed: {warning_detail}"
 
+    rules = HEURISTIC_RULES
     text_len = len(doc.text or "")
 
-    if text_len < 100:
+    if text_len < rules.min_text_chars:
         return Completeness.FAILED, f"Insufficient text retrieved ({text_len} chars)"
 
     # Check for partial access indicators
@@ -1396,7 +3719,7 @@ def assess_completeness(doc: FetchedDoc) -> Tuple[Completeness, str]:
 
     # If we have substantial content (>2000 chars), consider it complete
     # even if there were bot-block hints - we clearly got through
-    if text_len >= 2000:
+    if text_len >= rules.complete_text_chars:
         if has_botblock or has_paywall:
             return Completeness.COMPLETE, f"Full content retrieved ({text_len} chars) despite access warnings"
         return Completeness.COMPLETE, f"Full content retrieved ({text_len} chars)"
@@ -1405,58 +3728,90 @@ def assess_completeness(doc: FetchedDoc) -> Tuple[Completeness, str]:
     if has_botblock:
         return Completeness.PARTIAL, f"Bot-block detected with limited content ({text_len} chars)"
 
-    if has_paywall and text_len < 800:
+    if has_paywall and text_len < rules.paywall_partial_chars:
         return Completeness.PARTIAL, "Paywall detected with limited content retrieved"
 
-    if text_len < 300:
+    if text_len < rules.limited_text_chars:
         return Completeness.PARTIAL, f"Limited text retrieved ({text_len} chars)"
 
     return Completeness.COMPLETE, f"Full content retrieved ({text_len} chars)"
 
 
-def assess_evidence_strength(doc: FetchedDoc) -> Tuple[EvidenceStrength, str, List[str]]:
+def has_attribution(text: str) -> bool:
+    """True if the text attributes its claims (secondary reporting)."""
+    return any(pat.search(text) for pat in ATTRIBUTION_PATTERNS)
+
+
+def assess_evidence_strength(
+    doc: FetchedDoc, hits: Optional[KeywordHits] = None
+) -> Tuple[EvidenceStrength, str, List[str]]:
     """
     Check 4: Evidence strength (anchor type).
     """
-    if not doc.text or len(doc.text) < 100:
+    rules = HEURISTIC_RULES
+    if not doc.text or len(doc.text) < rules.min_text_chars:
         return EvidenceStrength.NOT_ASSESSED, "Insufficient text to assess", []
 
     text = doc.text
-    text_low = text.lower()
+    hits = hits or scan_article_keywords(text)
 
     # Check for primary anchors
-    primary_found = []
-    for kw in PRIMARY_ANCHOR_KEYWORDS:
-        if kw in text_low:
-            primary_found.append(kw)
+    primary_found = [kw for kw in rules.primary_anchor_keywords if hits.offset(kw) != -1]
 
     if doc.fetch_status == "pdf":
-        quotes = find_quotes(text, primary_found[:3] if primary_found else ["document"], max_quotes=2)
+        quotes = find_quotes(text, primary_found[:3] if primary_found else ["document"], max_quotes=2, hits=hits)
         return EvidenceStrength.STRONG, "Primary document (PDF) with direct evidence", quotes
 
-    if len(primary_found) >= 2:
-        quotes = find_quotes(text, primary_found[:3], max_quotes=2)
+    if len(primary_found) >= rules.strong_primary_anchors:
+        quotes = find_quotes(text, primary_found[:3], max_quotes=2, hits=hits)
         return EvidenceStrength.STRONG, f"Contains primary anchors: {', '.join(primary_found[:3])}", quotes
 
     # Check for secondary reporting with attribution
-    attribution_patterns = [
-        r"according to [A-Z]",
-        r"[A-Z][a-z]+ (said|told|reported|stated)",
-        r"sources? (said|told|confirmed)",
-        r"citing [a-z]",
-        r"documents? (show|reveal|indicate)",
-    ]
-
-    has_attribution = any(re.search(pat, text) for pat in attribution_patterns)
-
-    if has_attribution:
-        quotes = find_quotes(text, ["according to", "said", "told", "reported", "citing"], max_quotes=2)
+    if has_attribution(text):
+        quotes = find_quotes(text, ATTRIBUTION_KEYWORDS, max_quotes=2, hits=hits)
         return EvidenceStrength.MEDIUM, "Secondary reporting with attribution", quotes
 
     return EvidenceStrength.WEAK, "Assertions without clear evidence trail", []
 
 
-def assess_specificity(doc: FetchedDoc) -> Tuple[bool, str, List[str]]:
+def extract_specificity_features(text: str) -> SpecificityFeatures:
+    """Count specificity anchors in `text` with the precompiled SPEC_* patterns.
+
+    Each pattern keeps its own findall pass (a merged alternation would stop
+    overlapping anchors, e.g. the year inside a full date, from both counting),
+    but patterns whose required digits/keywords are absent are skipped.
+    """
+    f = SpecificityFeatures()
+    if not text:
+        return f
+
+    # WHEN / HOW MUCH need digits
+    if SPEC_DIGIT_RE.search(text):
+        f.years = len(set(SPEC_YEAR_RE.findall(text)))
+        f.full_dates = len(SPEC_FULL_DATE_RE.findall(text))
+        f.numeric_dates = len(SPEC_NUMERIC_DATE_RE.findall(text))
+        f.quantities_people = len(SPEC_PEOPLE_RE.findall(text))
+        f.quantities_money = len(SPEC_MONEY_RE.findall(text))
+        f.quantities_ratio = len(SPEC_RATIO_RE.findall(text))
+
+    # WHERE: capitalized place names followed by location context, plus "in X"
+    if SPEC_LOCATION_WORD_RE.search(text):
+        f.location_context = len(SPEC_LOCATION_CONTEXT_RE.findall(text))
+    f.in_places = len(SPEC_IN_PLACE_RE.findall(text))
+
+    # WHO: "Name Name said", '" said Name', "Name Name, the minister"
+    names = set(SPEC_SPEAKER_RE.findall(text))
+    if '"' in text:
+        names.update(SPEC_QUOTE_ATTRIBUTION_RE.findall(text))
+    if SPEC_TITLE_WORD_RE.search(text):
+        names.update(SPEC_TITLED_NAME_RE.findall(text))
+    f.named_actors = len(names)
+    return f
+
+
+def assess_specificity(
+    doc: FetchedDoc, features: Optional[SpecificityFeatures] = None
+) -> Tuple[bool, str, List[str]]:
     """
     Check 5: Specificity & auditability.
     Look for: who/what/when/where/how much
@@ -1464,66 +3819,14 @@ def assess_specificity(doc: FetchedDoc) -> Tuple[bool, str, List[str]]:
     A source is specific and auditable if it provides concrete anchors
     that allow independent verification.
     """
-    if not doc.text or len(doc.text) < 100:
+    rules = HEURISTIC_RULES
+    if not doc.text or len(doc.text) < rules.min_text_chars:
         return False, "Insufficient text to assess", []
 
-    text = doc.text
-    anchors = []
-
-    # WHEN: dates (years, full dates, relative time references)
-    years = re.findall(r"\b(19\d\d|20\d\d)\b", text)
-    full_dates = re.findall(
-        r"\b(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s*\d{4}\b",
-        text, re.I
-    )
-    date_patterns = re.findall(r"\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b", text)
-    if years or full_dates or date_patterns:
-        total_dates = len(set(years)) + len(full_dates) + len(date_patterns)
-        if total_dates >= 2:
-            anchors.append(f"dates/times ({total_dates} found)")
-
-    # WHERE: locations (countries, cities, regions, specific places)
-    # Look for capitalized place names followed by location context
-    location_context = re.findall(
-        r"\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s*(?:Province|City|District|Region|County|State|Ministry|Bureau|Court|Parliament|Congress|Hall)\b",
-        text
-    )
-    # Also catch standalone well-known location patterns
-    countries_cities = re.findall(
-        r"\bin\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\b",
-        text
-    )
-    if location_context or len(countries_cities) >= 3:
-        anchors.append(f"locations ({len(location_context) + min(len(countries_cities), 5)} found)")
-
-    # HOW MUCH: numbers/quantities (votes, percentages, money, counts)
-    # Look for numbers with context
-    quantities_people = re.findall(
-        r"\b\d{1,3}(?:,\d{3})*(?:\.\d+)?\s*(?:people|persons|individuals|members|delegates|votes?|cases|incidents|deaths|victims|detainees|prisoners|percent|%)\b",
-        text, re.I
-    )
-    quantities_money = re.findall(
-        r"\b(?:\$|€|£|¥)?\d{1,3}(?:,\d{3})*(?:\.\d+)?\s*(?:billion|million|trillion|yuan|dollars?|euros?|pounds?)\b",
-        text, re.I
-    )
-    quantities_ratio = re.findall(r"\b\d+\s*(?:to|vs\.?|against)\s*\d+\b", text, re.I)
-    total_quantities = len(quantities_people) + len(quantities_money) + len(quantities_ratio)
-    if total_quantities >= 2:
-        anchors.append(f"quantities ({total_quantities} found)")
-
-    # WHO: named individuals
-    # Pattern 1: "Name Name said/told/stated" or "Name Name,"
-    named_speakers = re.findall(r"\b([A-Z][a-z]+\s+[A-Z][a-z]+)\s*(?:,|said|told|stated|added|noted|warned|announced)", text)
-    # Pattern 2: Quoted speech followed by attribution
-    quote_attributions = re.findall(r'"\s*(?:said|told|according to)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)', text)
-    # Pattern 3: "according to Name" or "Name, the/a title"
-    titled_names = re.findall(r"\b([A-Z][a-z]+\s+[A-Z][a-z]+),?\s+(?:the\s+)?(?:president|minister|director|chief|head|leader|spokesman|spokesperson|secretary|chairman|official)", text, re.I)
-    unique_names = set(named_speakers + quote_attributions + titled_names)
-    if len(unique_names) >= 2:
-        anchors.append(f"named actors ({len(unique_names)} found)")
+    anchors = (features or extract_specificity_features(doc.text)).anchors(rules)
 
     # Require at least 2 different types of anchors for specificity
-    has_specificity = len(anchors) >= 2
+    has_specificity = len(anchors) >= rules.min_anchor_types
 
     if has_specificity:
         return True, f"Contains traceable anchors: {'; '.join(anchors)}", anchors
@@ -1533,7 +3836,9 @@ def assess_specificity(doc: FetchedDoc) -> Tuple[bool, str, List[str]]:
         return False, "No clear who/what/when/where/how much anchors found", []
 
 
-def assess_severity_support(doc: FetchedDoc) -> Tuple[bool, SeveritySupport, str, List[str]]:
+def assess_severity_support(
+    doc: FetchedDoc, hits: Optional[KeywordHits] = None
+) -> Tuple[bool, SeveritySupport, str, List[str]]:
     """
     Check 7: Severity support gate.
     Only applies when claim is "systematic/widespread/state policy".
@@ -1541,10 +3846,10 @@ def assess_severity_support(doc: FetchedDoc) -> Tuple[bool, SeveritySupport, str
     if not doc.text:
         return False, SeveritySupport.NOT_ASSESSED, "No text to assess", []
 
-    text_low = doc.text.lower()
+    hits = hits or scan_article_keywords(doc.text)
 
     # First check if this is even a systematic claim
-    has_systematic_claim = any(kw in text_low for kw in SYSTEMATIC_CLAIM_KEYWORDS)
+    has_systematic_claim = hits.any("systematic_claim")
 
     if not has_systematic_claim:
         return False, SeveritySupport.NOT_APPLICABLE, "No systematic/widespread claims detected", []
@@ -1552,9 +3857,9 @@ def assess_severity_support(doc: FetchedDoc) -> Tuple[bool, SeveritySupport, str
     # Check the three requirements
     missing = []
 
-    has_extent = any(h in text_low for h in EXTENT_HINTS)
-    has_systematicity = any(h in text_low for h in SYSTEMATICITY_HINTS)
-    has_institutionalization = any(h in text_low for h in INSTITUTIONALIZATION_HINTS)
+    has_extent = hits.any("extent")
+    has_systematicity = hits.any("systematicity")
+    has_institutionalization = hits.any("institutionalization")
 
     if not has_extent:
         missing.append("extent (severity of harm)")
@@ -1582,12 +3887,11 @@ def assess_publisher_signals(aux_pages: List[FetchedDoc]) -> PublisherSignals:
         return signals
 
     combined_text = "\n\n".join([p.text for p in aux_pages if p.text])
-    combined_low = combined_text.lower()
+    hits = KEYWORD_SCANNER.scan(combined_text.lower())
 
     # 8) Ownership/transparency
-    ownership_keywords = ["owned by", "ownership", "board of directors", "governance", "nonprofit", "non-profit", "funded by", "funding"]
-    if any(kw in combined_low for kw in ownership_keywords):
-        quotes = find_quotes(combined_text, ownership_keywords, max_quotes=2)
+    if hits.any("ownership"):
+        quotes = find_quotes(combined_text, OWNERSHIP_KEYWORDS, max_quotes=2, hits=hits)
         signals.ownership_transparency = Check(
             status="found",
             reason="Ownership/governance information found on publisher pages",
@@ -1596,9 +3900,8 @@ def assess_publisher_signals(aux_pages: List[FetchedDoc]) -> PublisherSignals:
         )
 
     # 9) Corrections behavior
-    corrections_keywords = ["correction", "retraction", "we correct", "clarification", "erratum", "updated"]
-    if any(kw in combined_low for kw in corrections_keywords):
-        quotes = find_quotes(combined_text, corrections_keywords, max_quotes=2)
+    if hits.any("corrections"):
+        quotes = find_quotes(combined_text, CORRECTIONS_KEYWORDS, max_quotes=2, hits=hits)
         signals.corrections_behavior = Check(
             status="found",
             reason="Corrections/accountability policy or practice found",
@@ -1607,9 +3910,8 @@ def assess_publisher_signals(aux_pages: List[FetchedDoc]) -> PublisherSignals:
         )
 
     # 10) Standards/method
-    standards_keywords = ["editorial standards", "editorial policy", "code of ethics", "methodology", "fact-check", "verification"]
-    if any(kw in combined_low for kw in standards_keywords):
-        quotes = find_quotes(combined_text, standards_keywords, max_quotes=2)
+    if hits.any("standards"):
+        quotes = find_quotes(combined_text, STANDARDS_KEYWORDS, max_quotes=2, hits=hits)
         signals.standards_transparency = Check(
             status="found",
             reason="Editorial standards or methodology information found",
@@ -1620,6 +3922,273 @@ def assess_publisher_signals(aux_pages: List[FetchedDoc]) -> PublisherSignals:
     return signals
 
 
+# -----------------------------------------------------------------------------
+# Publisher Profiles (per-domain memoization of aux crawls)
+# -----------------------------------------------------------------------------
+@dataclass
+class PublisherProfile:
+    """Crawled about/policy pages and derived signals for one registrable domain."""
+    domain: str
+    root: str = ""
+    max_pages: int = 0
+    crawled_at: float = 0.0
+    aux_pages: List[FetchedDoc] = field(default_factory=list)
+    signals: PublisherSignals = field(default_factory=PublisherSignals)
+
+
+def _profile_to_dict(profile: PublisherProfile) -> Dict[str, Any]:
+    return {
+        "domain": profile.domain,
+        "root": profile.root,
+        "max_pages": profile.max_pages,
+        "crawled_at": profile.crawled_at,
+        "pages": [
+            {"url": p.url, "final_url": p.final_url, "fetch_status": p.fetch_status, "text": p.text}
+            for p in profile.aux_pages
+        ],
+        "signals": dataclasses.asdict(profile.signals),
+    }
+
+
+def _profile_from_dict(data: Dict[str, Any]) -> PublisherProfile:
+    signals = PublisherSignals(**{k: Check(**v) for k, v in data.get("signals", {}).items()})
+    pages = [
+        FetchedDoc(url=p["url"], final_url=p.get("final_url", ""), domain=data["domain"],
+                   fetch_status=p.get("fetch_status", "ok"), text=p.get("text", ""))
+        for p in data.get("pages", [])
+    ]
+    return PublisherProfile(
+        domain=data["domain"],
+        root=data.get("root", ""),
+        max_pages=data.get("max_pages", 0),
+        crawled_at=data.get("crawled_at", 0.0),
+        aux_pages=pages,
+        signals=signals,
+    )
+
+
+class PublisherStore:
+    """Publisher profiles keyed by registrable domain, shared across a batch.
+
+    Each domain is crawled and assessed at most once per run (concurrent
+    workers for the same domain wait on a per-domain lock), and profiles are
+    persisted as "publishers" records in the cache backend with their own TTL
+    so later runs skip the aux crawl entirely.
+    """
+
+    def __init__(self, cache_dir: str, max_age_s: int = DEFAULT_PUBLISHER_MAX_AGE_S, persist: bool = True):
+        self.cache_dir = cache_dir
+        self.max_age_s = max_age_s
+        self.persist = persist
+        self._profiles: Dict[str, PublisherProfile] = {}
+        self._lock = threading.Lock()
+        self._domain_locks: Dict[str, threading.Lock] = {}
+
+    def _fresh(self, profile: PublisherProfile, max_pages: int) -> bool:
+        if profile.max_pages < max_pages:
+            return False
+        return self.max_age_s < 0 or time.time() - profile.crawled_at <= self.max_age_s
+
+    def _load(self, domain: str) -> Optional[PublisherProfile]:
+        if not self.persist:
+            return None
+        record = get_cache_backend(self.cache_dir).get_record("publishers", domain)
+        if record is None:
+            return None
+        try:
+            return _profile_from_dict(record[0])
+        except (KeyError, TypeError):
+            return None
+
+    def _save(self, profile: PublisherProfile) -> None:
+        if self.persist:
+            get_cache_backend(self.cache_dir).put_record("publishers", profile.domain, _profile_to_dict(profile))
+
+    def get_or_crawl(
+        self,
+        session: requests.Session,
+        main: FetchedDoc,
+        sleep_s: float,
+        timeout_s: int,
+        cache_max_age_s: int,
+        no_cache: bool,
+        max_pages: int,
+        throttle: Optional[DomainThrottle] = None,
+    ) -> PublisherProfile:
+        """Return the publisher profile for `main`'s domain, crawling it only once."""
+        domain = main.domain or registrable_domain(main.final_url or main.url)
+        with self._lock:
+            domain_lock = self._domain_locks.setdefault(domain, threading.Lock())
+
+        with domain_lock:
+            profile = self._profiles.get(domain)
+            if profile and self._fresh(profile, max_pages):
+                return profile
+
+            profile = self._load(domain)
+            if profile is None or not self._fresh(profile, max_pages):
+                parsed = urlparse(main.final_url or main.url)
+                aux_pages = crawl_publisher_pages(
+                    session, main, self.cache_dir, sleep_s, timeout_s, cache_max_age_s, no_cache,
+                    max_pages, throttle=throttle,
+                )
+                profile = PublisherProfile(
+                    domain=domain,
+                    root=f"{parsed.scheme}://{parsed.netloc}",
+                    max_pages=max_pages,
+                    crawled_at=time.time(),
+                    aux_pages=aux_pages,
+                    signals=assess_publisher_signals(aux_pages),
+                )
+                self._save(profile)
+
+            self._profiles[domain] = profile
+            return profile
+
+
+class DomainVerdictStore:
+    """Outlet-level LLM verdicts (satire, source type) keyed by registrable domain.
+
+    The proactive satire check and the source-type check mostly classify the
+    outlet, so one article's answer is reused for later articles from the
+    same domain. Per-article answers count as votes for or against the stored
+    verdict; it is reused while fresh (voted on within `max_age_s`; 0 disables
+    reuse, negative never expires), while its confidence (agreeing / (all
+    votes + 1)) stays at DOMAIN_VERDICT_MIN_CONFIDENCE, and only when the
+    caller's `agrees` check finds the article's own heuristics consistent with
+    it. Persisted as "domain-verdicts" records keyed by model and domain;
+    MULTI_PUBLISHER_DOMAINS are never memoized. Workers only wait for each
+    other while a domain's first answer is in flight (first_answer); the
+    LLM request itself never runs under a store lock.
+    """
+
+    # What two verdicts must share to count as agreeing
+    VERDICT_KEYS: Dict[str, Callable[[Any], Any]] = {
+        "satire": lambda v: bool(v[0]),
+        "source_type": lambda v: v.get("source_type"),
+    }
+    # Defined by the article's content (see the source_type taxonomy), not by the outlet
+    ARTICLE_SOURCE_TYPES = {"advocacy_org", "government_self"}
+
+    def __init__(self, cache_dir: str, max_age_s: int = DEFAULT_DOMAIN_VERDICT_MAX_AGE_S, persist: bool = True):
+        self.cache_dir = cache_dir
+        self.max_age_s = max_age_s
+        self.persist = persist
+        self._records: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._domain_locks: Dict[str, threading.Lock] = {}
+        self._first: Dict[Tuple[str, str], threading.Event] = {}
+
+    def enabled(self, domain: str) -> bool:
+        return bool(domain) and self.max_age_s != 0 and domain.lower() not in MULTI_PUBLISHER_DOMAINS
+
+    def _domain_lock(self, domain: str) -> threading.Lock:
+        with self._lock:
+            return self._domain_locks.setdefault(domain, threading.Lock())
+
+    @contextlib.contextmanager
+    def first_answer(self, domain: str, kinds: List[str], model: str):
+        """Wait while another worker asks the domain's first `kinds` question.
+
+        A worker that finds no verdict and nobody asking claims the question
+        until the block exits, so the rest of the domain's articles wait for
+        that one answer instead of asking in parallel. Once a verdict exists
+        nobody waits. `kinds` are claimed in a fixed order so workers
+        cannot deadlock on each other.
+        """
+        key = f"{model}:{domain}"
+        claimed: List[Tuple[str, str]] = []
+        try:
+            for kind in sorted(kinds) if self.enabled(domain) else []:
+                while True:
+                    with self._domain_lock(domain):
+                        answered = kind in self._record(key)
+                    with self._lock:
+                        pending = None if answered else self._first.get((key, kind))
+                        if not answered and pending is None:
+                            self._first[(key, kind)] = threading.Event()
+                            claimed.append((key, kind))
+                    if pending is None:
+                        break
+                    pending.wait()
+            yield
+        finally:
+            with self._lock:
+                for claim in claimed:
+                    self._first.pop(claim).set()
+
+    def _record(self, key: str) -> Dict[str, Any]:
+        record = self._records.get(key)
+        if record is None:
+            stored = get_cache_backend(self.cache_dir).get_record("domain-verdicts", key) if self.persist else None
+            record = stored[0] if stored and isinstance(stored[0], dict) else {}
+            self._records[key] = record
+        return record
+
+    @staticmethod
+    def confidence(entry: Dict[str, Any]) -> float:
+        return entry["votes"] / (entry["votes"] + entry["dissent"] + 1)
+
+    def lookup(self, domain: str, kind: str, model: str, agrees: Callable[[Any], bool]) -> Any:
+        """The domain's reusable `kind` verdict for this article, or None."""
+        if not self.enabled(domain):
+            return None
+        with self._domain_lock(domain):
+            entry = self._record(f"{model}:{domain}").get(kind)
+            if (not entry or self.confidence(entry) < DOMAIN_VERDICT_MIN_CONFIDENCE
+                    or (self.max_age_s > 0 and time.time() - entry["confirmed_at"] > self.max_age_s)):
+                return None
+            verdict = tuple(entry["value"]) if kind == "satire" else entry["value"]
+            if not agrees(verdict):
+                DOMAIN_VERDICT_STATS.incr("disagreed")
+                return None
+            DOMAIN_VERDICT_STATS.incr("reused")
+            return verdict
+
+    def record(self, domain: str, kind: str, model: str, verdict: Any) -> None:
+        """Count a per-article answer as a vote on the domain's `kind` verdict.
+
+        A dissenting answer takes over once dissent outnumbers agreement, with
+        the old agreeing votes as its dissent, so a contested domain keeps
+        being asked per article.
+        """
+        if verdict is None or not self.enabled(domain):
+            return
+        DOMAIN_VERDICT_STATS.incr("asked")
+        if kind == "source_type" and verdict.get("source_type") in self.ARTICLE_SOURCE_TYPES:
+            return
+        key = f"{model}:{domain}"
+        same = self.VERDICT_KEYS[kind]
+        with self._domain_lock(domain):
+            record = self._record(key)
+            entry = record.get(kind)
+            if entry is None:
+                entry = {"value": verdict, "votes": 1, "dissent": 0}
+            elif same(entry["value"]) == same(verdict):
+                entry["votes"] += 1
+            elif entry["dissent"] + 1 > entry["votes"]:
+                entry = {"value": verdict, "votes": 1, "dissent": entry["votes"]}
+            else:
+                entry["dissent"] += 1
+            entry["confirmed_at"] = time.time()
+            record[kind] = entry
+            if self.persist:
+                get_cache_backend(self.cache_dir).put_record("domain-verdicts", key, record)
+
+    def resolve(self, domain: str, kind: str, model: str, agrees: Callable[[Any], bool],
+                ask: Callable[[], Any]) -> Tuple[Any, bool]:
+        """(verdict, reused): the domain's verdict if reusable, else ask() recorded as a vote."""
+        if not self.enabled(domain):
+            return ask(), False
+        with self.first_answer(domain, [kind], model):
+            verdict = self.lookup(domain, kind, model, agrees)
+            if verdict is not None:
+                return verdict, True
+            verdict = ask()
+            self.record(domain, kind, model, verdict)
+            return verdict, False
+
+
 # -----------------------------------------------------------------------------
 # Use Permission Determination
 # -----------------------------------------------------------------------------
@@ -1704,7 +4273,7 @@ def determine_use_permission(
                 if core.content_analysis_boost == "downgrade":
                     return UsePermission.A_SAFEGUARDS, f"Strong evidence but content analysis flagged concerns: {core.content_analysis_reason}"
                 # Check corroboration for high-impact claims
-                if is_single_source:
+                if is_single_source and HEURISTIC_RULES.single_source_caps_a:
                     return UsePermission.A_SAFEGUARDS, "Strong evidence but single-source run - corroboration not assessed"
                 return UsePermission.A_PREFERRED, "Strong primary anchors, complete access, traceable"
 
@@ -1773,13 +4342,7 @@ def check_auto_reject(doc: FetchedDoc) -> Tuple[bool, str, bool]:
     site_labels = meta_desc + " " + meta_og + " " + meta_site
 
     # If the SITE (not an article) calls itself satire/parody, auto-reject
-    self_identify_patterns = [
-        "satire site", "satirical news", "satirical website", "satire publication",
-        "parody news", "parody site", "fake news site", "comedy news",
-        "humor site", "humour site", "satirical publication", "not real news",
-        "all stories are fiction", "fictional news", "entertainment purposes only",
-    ]
-    if any(p in site_labels for p in self_identify_patterns):
+    if KEYWORD_SCANNER.scan(site_labels).any("satire_self_identify"):
         return True, f"Site self-identifies as satire in metadata", False
 
     # Satire signals in metadata - FLAG for LLM review, don't auto-reject
@@ -1787,15 +4350,102 @@ def check_auto_reject(doc: FetchedDoc) -> Tuple[bool, str, bool]:
     needs_llm_review = False
     if doc.text or doc.title:
         combined = normalize((doc.title or "") + " " + (doc.meta.get("description", "") or ""))
-        if any(normalize(kw) in combined for kw in SATIRE_KEYWORDS):
+        if KEYWORD_SCANNER.scan(combined).any("satire"):
             needs_llm_review = True
 
     return False, "", needs_llm_review
 
 
+def body_self_identifies_as_satire(text: str) -> bool:
+    """Heuristic (no-LLM) satire check on the opening 5000 and closing 2000 chars."""
+    if not text:
+        return False
+    if KEYWORD_SCANNER.scan(normalize(text[:5000])).any("body_satire"):
+        return True
+    return len(text) > 2000 and KEYWORD_SCANNER.scan(normalize(text[-2000:])).any("body_satire")
+
+
 # -----------------------------------------------------------------------------
 # Main Evaluation
 # -----------------------------------------------------------------------------
+def run_core_checks(
+    doc: FetchedDoc, url: str, intended_use: IntendedUse, is_single_source: bool
+) -> CoreChecks:
+    """Heuristic core checks 1-7 for one fetched document (no network, no LLM)."""
+    core = CoreChecks()
+    core.intended_use = intended_use
+
+    # Check 2: Relationship
+    rel, a_only, rel_reason = assess_relationship(doc.final_url or url, doc.domain, doc.text or "")
+    core.relationship = rel
+    core.b_only_restriction = a_only
+    core.relationship_reason = rel_reason
+
+    # Check 3: Completeness
+    comp, comp_reason = assess_completeness(doc)
+    core.completeness = comp
+    core.completeness_reason = comp_reason
+
+    # Checks 4 and 7 share one keyword scan of the article text
+    keyword_hits = scan_article_keywords(doc.text)
+
+    # Check 4: Evidence strength
+    ev_strength, ev_reason, ev_quotes = assess_evidence_strength(doc, keyword_hits)
+    core.evidence_strength = ev_strength
+    core.evidence_reason = ev_reason
+    core.evidence_quotes = ev_quotes
+
+    # Check 5: Specificity
+    spec_features = extract_specificity_features(doc.text)
+    has_spec, spec_reason, spec_anchors = assess_specificity(doc, spec_features)
+    core.specificity_features = dataclasses.asdict(spec_features)
+    core.has_specificity = has_spec
+    core.specificity_reason = spec_reason
+    core.specificity_anchors = spec_anchors
+
+    # Check 6: Corroboration
+    if is_single_source:
+        core.corroboration = CorroborationStatus.NOT_ASSESSED
+        core.corroboration_reason = "Single-source run - corroboration not assessed"
+    else:
+        # In multi-source runs, this would be populated by cross-checking
+        core.corroboration = CorroborationStatus.NOT_ASSESSED
+        core.corroboration_reason = "Cross-source corroboration check not implemented in this run"
+
+    # Check 7: Severity support
+    sev_detected, sev_support, sev_reason, sev_missing = assess_severity_support(doc, keyword_hits)
+    core.severity_claim_detected = sev_detected
+    core.severity_support = sev_support
+    core.severity_reason = sev_reason
+    core.severity_missing = sev_missing
+
+
+    return core
+
+
+def plan_llm_review(doc: FetchedDoc, core: CoreChecks) -> Dict[str, str]:
+    """Consolidated-review sections the heuristics flag, with their context lines.
+
+    Mirrors the per-check triggers in evaluate_source. LLM answers can only
+    narrow those triggers (e.g. state media skips the self-interest check), so
+    a section asked here may go unused but none is ever missing. The final
+    review is not planned: it judges the checks after every LLM change to
+    them, so evaluate_source asks it in a follow-up request once a
+    permission lands on C, the same request separate mode makes.
+    """
+    sections = {"satire": ""}
+    if core.relationship == RelationshipType.THIRD_PARTY:
+        sections["source_type"] = ""
+        sections["self_interest"] = ""
+    if core.evidence_strength in (EvidenceStrength.WEAK, EvidenceStrength.MEDIUM):
+        sections["evidence_strength"] = f"HEURISTIC ASSESSMENT: {core.evidence_strength.value}"
+    if core.severity_claim_detected and core.severity_support == SeveritySupport.PARTIAL:
+        sections["severity_support"] = f"HEURISTICS FOUND MISSING: {', '.join(core.severity_missing)}"
+    if len(doc.text) > 500 and core.completeness != Completeness.FAILED:
+        sections["content_analysis"] = ""
+    return sections
+
+
 def evaluate_source(
     session: requests.Session,
     url: str,
@@ -1809,11 +4459,28 @@ def evaluate_source(
     is_single_source: bool,
     llm_client: Optional[Any] = None,
     llm_model: str = DEFAULT_LLM_MODEL,
+    throttle: Optional[DomainThrottle] = None,
+    publisher_store: Optional[PublisherStore] = None,
+    all_uses: bool = False,
+    consolidated_llm: bool = False,
+    domain_verdicts: Optional[DomainVerdictStore] = None,
 ) -> EvalResult:
-    """Evaluate a single source."""
+    """Evaluate a single source.
+
+    With `all_uses`, the shared checks run once and a permission is derived
+    for every intended use (result.use_permissions); `intended_use` picks the
+    one mirrored in use_permission. With `consolidated_llm`, the LLM reviews
+    the heuristics flag are asked in one request (llm_consolidated_review)
+    instead of one request per check, with the final review as a follow-up;
+    result.llm_usage meters either way.
+    With `domain_verdicts`, the satire and source-type reviews reuse the
+    domain's verdict where the article's heuristics agree with it.
+    """
 
     # Fetch main document
-    main = fetch_doc(session, url, cache_dir, sleep_s, timeout_s, cache_max_age_s, no_cache)
+    main = fetch_doc(
+        session, url, cache_dir, sleep_s, timeout_s, cache_max_age_s, no_cache, throttle=throttle
+    )
 
     result = EvalResult(
         url=url,
@@ -1823,17 +4490,70 @@ def evaluate_source(
         content_type=main.content_type,
         text_length=len(main.text or ""),
         warnings=list(main.warnings),
+        single_source=is_single_source,
+        llm_enabled=llm_client is not None,
     )
+    if llm_client:
+        llm_client = MeteredClient(llm_client, result.llm_usage)
 
     # Check auto-reject first
     should_reject, reject_reason, needs_llm_satire_review = check_auto_reject(main)
 
+    # Heuristic checks need only the main document; in consolidated mode they
+    # decide which sections the single LLM request asks for
+    core = run_core_checks(main, url, intended_use, is_single_source)
+
+    # Outlet-level reviews and when the article's heuristics agree with a domain
+    # verdict: satire signals must match it; source type has no article-level
+    # heuristic beyond the third-party trigger, so any confident verdict fits
+    satire_signals = needs_llm_satire_review or body_self_identifies_as_satire(main.text)
+    outlet_agrees: Dict[str, Callable[[Any], bool]] = {
+        "satire": lambda verdict: bool(verdict[0]) == satire_signals,
+        "source_type": lambda verdict: True,
+    }
+    memo = domain_verdicts if domain_verdicts and domain_verdicts.enabled(main.domain) else None
+    reused: Dict[str, Any] = {}
+    review: Dict[str, Any] = {}
+    if consolidated_llm and not should_reject and llm_client and main.text:
+        sections = plan_llm_review(main, core)
+        first = [section for section in outlet_agrees if section in sections]
+        with memo.first_answer(main.domain, first, llm_model) if memo else contextlib.nullcontext():
+            if memo:
+                for section, agrees in outlet_agrees.items():
+                    verdict = memo.lookup(main.domain, section, llm_model, agrees) if section in sections else None
+                    if verdict is not None:
+                        reused[section] = verdict
+                        del sections[section]
+            if sections:
+                review = llm_consolidated_review(
+                    llm_client, main.final_url or url, main.domain, main.title or "", main.text,
+                    sections, llm_model,
+                )
+            if memo:
+                for section in outlet_agrees:
+                    if section in sections:
+                        memo.record(main.domain, section, llm_model, review.get(section))
+
+    def llm_verdict(section: str, ask: Any) -> Any:
+        """Answer from the domain verdict, the consolidated review, or a separate call for this check."""
+        if section not in reused and not consolidated_llm and memo and section in outlet_agrees:
+            verdict, was_reused = memo.resolve(main.domain, section, llm_model, outlet_agrees[section], ask)
+            if not was_reused:
+                return verdict
+            reused[section] = verdict
+        if section in reused:
+            result.llm_decisions.append(f"{section}_domain_verdict")
+            return reused[section]
+        # The final review needs the post-LLM checks: a follow-up request in both modes
+        return review.get(section) if consolidated_llm and section != "final_review" else ask()
+
     # LLM is the decision-maker for satire on non-obvious cases
     if not should_reject and llm_client and main.text:
         # If satire signals in metadata OR proactive check, ask LLM to decide
         if needs_llm_satire_review:
             # Metadata had satire keywords - LLM must determine if it's satire or journalism ABOUT satire
-            llm_satire = llm_assess_satire(llm_client, main.title or "", main.text, main.domain, llm_model)
+            llm_satire = llm_verdict("satire", lambda: llm_assess_satire(
+                llm_client, main.title or "", main.text, main.domain, llm_model))
             result.llm_used = True
             result.llm_decisions.append("satire_verification")
             if llm_satire and llm_satire[0]:
@@ -1842,7 +4562,8 @@ def evaluate_source(
             # If LLM says NOT satire, we continue (don't reject)
         else:
             # No metadata signals - still do a lightweight check for edge cases
-            llm_satire = llm_assess_satire(llm_client, main.title or "", main.text, main.domain, llm_model)
+            llm_satire = llm_verdict("satire", lambda: llm_assess_satire(
+                llm_client, main.title or "", main.text, main.domain, llm_model))
             if llm_satire and llm_satire[0]:
                 should_reject = True
                 reject_reason = f"LLM detected satire: {llm_satire[1]}"
@@ -1851,98 +4572,56 @@ def evaluate_source(
 
     # If no LLM available, do aggressive content-based satire detection
     if not should_reject and not llm_client:
-        body_lower = normalize(main.text[:5000]) if main.text else ""
-        footer_lower = normalize(main.text[-2000:]) if main.text and len(main.text) > 2000 else body_lower
-
-        # Check body AND footer for self-identification as satire
-        body_satire_patterns = [
-            "this is a satirical", "this is satire", "satirical news",
-            "all stories are fictional", "all articles are satire",
-            "entertainment purposes only", "parody site", "humor publication",
-            "satirical publication", "a satirical", "is satirical",
-            "satire and parody", "humor and satire", "comedic purpose",
-            "fictional and satirical", "satirical commentary",
-            "internet tendency",  # McSweeney's Internet Tendency
-            "not intended as factual", "purely fictional",
-            "humor column", "humor piece", "satire column",
-        ]
-        if any(p in body_lower for p in body_satire_patterns) or \
-           any(p in footer_lower for p in body_satire_patterns):
+        if body_self_identifies_as_satire(main.text):
             should_reject = True
             reject_reason = "Heuristic: source self-identifies as satire in body text"
         elif needs_llm_satire_review:
             result.warnings.append("Satire keywords in metadata - manual review recommended")
 
     if should_reject:
+        result.auto_rejected = True
+        result.core.intended_use = intended_use
         result.use_permission = UsePermission.DO_NOT_USE
         result.permission_reason = reject_reason
+        if all_uses:
+            result.use_permissions = {
+                use.value: {"permission": UsePermission.DO_NOT_USE.value, "reason": reject_reason}
+                for use in IntendedUse
+            }
         return result
 
-    # Fetch auxiliary publisher pages
+    # Fetch auxiliary publisher pages (once per domain when a store is shared)
     aux_pages = []
+    publisher_signals = None
     if main.fetch_status in ("ok", "pdf") and max_aux_pages > 0:
-        aux_pages = crawl_publisher_pages(
-            session, main, cache_dir, sleep_s, timeout_s, cache_max_age_s, no_cache, max_aux_pages
-        )
+        if publisher_store:
+            profile = publisher_store.get_or_crawl(
+                session, main, sleep_s, timeout_s, cache_max_age_s, no_cache, max_aux_pages,
+                throttle=throttle,
+            )
+            aux_pages = profile.aux_pages
+            publisher_signals = profile.signals
+        else:
+            aux_pages = crawl_publisher_pages(
+                session, main, cache_dir, sleep_s, timeout_s, cache_max_age_s, no_cache, max_aux_pages,
+                throttle=throttle,
+            )
 
     result.evidence_pages = [main.final_url or url] + [p.final_url or p.url for p in aux_pages]
 
-    # Run core checks
-    core = CoreChecks()
-    core.intended_use = intended_use
-
-    # Check 2: Relationship
-    rel, a_only, rel_reason = assess_relationship(main.final_url or url, main.domain, main.text or "")
-    core.relationship = rel
-    core.b_only_restriction = a_only
-    core.relationship_reason = rel_reason
-
-    # Check 3: Completeness
-    comp, comp_reason = assess_completeness(main)
-    core.completeness = comp
-    core.completeness_reason = comp_reason
-
-    # Check 4: Evidence strength
-    ev_strength, ev_reason, ev_quotes = assess_evidence_strength(main)
-    core.evidence_strength = ev_strength
-    core.evidence_reason = ev_reason
-    core.evidence_quotes = ev_quotes
-
-    # Check 5: Specificity
-    has_spec, spec_reason, spec_anchors = assess_specificity(main)
-    core.has_specificity = has_spec
-    core.specificity_reason = spec_reason
-    core.specificity_anchors = spec_anchors
-
-    # Check 6: Corroboration
-    if is_single_source:
-        core.corroboration = CorroborationStatus.NOT_ASSESSED
-        core.corroboration_reason = "Single-source run - corroboration not assessed"
-    else:
-        # In multi-source runs, this would be populated by cross-checking
-        core.corroboration = CorroborationStatus.NOT_ASSESSED
-        core.corroboration_reason = "Cross-source corroboration check not implemented in this run"
-
-    # Check 7: Severity support
-    sev_detected, sev_support, sev_reason, sev_missing = assess_severity_support(main)
-    core.severity_claim_detected = sev_detected
-    core.severity_support = sev_support
-    core.severity_reason = sev_reason
-    core.severity_missing = sev_missing
-
     result.core = core
 
     # Part 2: Publisher signals
-    result.publisher = assess_publisher_signals(aux_pages)
+    result.publisher = publisher_signals or assess_publisher_signals(aux_pages)
 
     # LLM Augmentation: review borderline cases
     if llm_client and main.text:
         # Comprehensive source type assessment for nuanced handling
         # Only run for sources not already classified by heuristics
         if core.relationship == RelationshipType.THIRD_PARTY:
-            source_type_result = llm_assess_source_type(
+            source_type_result = llm_verdict("source_type", lambda: llm_assess_source_type(
                 llm_client, main.final_url or url, main.domain, main.text, llm_model
-            )
+            ))
             if source_type_result:
                 result.llm_used = True
                 result.llm_decisions.append("source_type_assessment")
@@ -1969,9 +4648,9 @@ def evaluate_source(
 
         # Review evidence strength if weak or medium (and not already upgraded)
         if core.evidence_strength in (EvidenceStrength.WEAK, EvidenceStrength.MEDIUM):
-            llm_ev = llm_assess_evidence_strength(
+            llm_ev = llm_verdict("evidence_strength", lambda: llm_assess_evidence_strength(
                 llm_client, main.text, core.evidence_strength.value, llm_model
-            )
+            ))
             if llm_ev:
                 new_strength, new_reason = llm_ev
                 if new_strength != core.evidence_strength.value:
@@ -1982,9 +4661,9 @@ def evaluate_source(
 
         # Review self-interest if third-party (might have missed it)
         if core.relationship == RelationshipType.THIRD_PARTY:
-            llm_self = llm_assess_self_interest(
+            llm_self = llm_verdict("self_interest", lambda: llm_assess_self_interest(
                 llm_client, main.final_url or url, main.text, llm_model
-            )
+            ))
             if llm_self and llm_self[0]:
                 core.relationship = RelationshipType.SELF_INTEREST
                 core.b_only_restriction = True
@@ -1994,9 +4673,9 @@ def evaluate_source(
 
         # Review severity support if partial
         if core.severity_claim_detected and core.severity_support == SeveritySupport.PARTIAL:
-            llm_sev = llm_assess_severity_support(
+            llm_sev = llm_verdict("severity_support", lambda: llm_assess_severity_support(
                 llm_client, main.text, core.severity_missing, llm_model
-            )
+            ))
             if llm_sev:
                 status, reason, still_missing = llm_sev
                 if status == "supported":
@@ -2011,9 +4690,9 @@ def evaluate_source(
 
     # Deep content analysis: extract claims, check plausibility, flag contradictions
     if llm_client and main.text and len(main.text) > 500 and core.completeness != Completeness.FAILED:
-        content_result = llm_content_analysis(
+        content_result = llm_verdict("content_analysis", lambda: llm_content_analysis(
             llm_client, main.text, main.title or "", main.final_url or url
-        )
+        ))
         if content_result and content_result.analyzed:
             result.content_analysis = content_result
             result.llm_used = True
@@ -2068,28 +4747,42 @@ def evaluate_source(
                     f"Content analysis: high confidence, {attributed}/{total} claims attributed"
                 )
 
-    # Determine final use permission
-    use_perm, perm_reason = determine_use_permission(intended_use, core, result.publisher, is_single_source, main.domain)
+    # Determine final use permission (for every intended use in --intended-use all runs)
+    uses = list(IntendedUse) if all_uses else [intended_use]
+    permissions = {
+        use: determine_use_permission(use, core, result.publisher, is_single_source, main.domain)
+        for use in uses
+    }
 
-    # LLM final review: check if C: Context-only could be upgraded
+    # LLM final review: check if C: Context-only could be upgraded. The review
+    # only sees the checks, so one answer serves every use that landed on C.
     # Skip upgrade review for Wikipedia (tertiary source - always context-only)
-    if llm_client and main.text and use_perm == UsePermission.C_CONTEXT and "wikipedia.org" not in main.domain.lower():
+    needs_review = any(perm == UsePermission.C_CONTEXT for perm, _ in permissions.values())
+    if llm_client and main.text and needs_review and "wikipedia.org" not in main.domain.lower():
         checks_summary = f"evidence={core.evidence_strength.value}, specificity={core.has_specificity}, relationship={core.relationship.value}"
         if result.content_analysis.analyzed:
             checks_summary += f", content_confidence={result.content_analysis.confidence_level}"
-        llm_final = llm_final_review(
-            llm_client, main.text, use_perm.value, checks_summary, llm_model
-        )
+        llm_final = llm_verdict("final_review", lambda: llm_final_review(
+            llm_client, main.text, UsePermission.C_CONTEXT.value, checks_summary, llm_model
+        ))
         if llm_final:
             new_perm, new_reason = llm_final
+            result.final_review = "kept"
             if new_perm == "A_SAFEGUARDS":
-                use_perm = UsePermission.A_SAFEGUARDS
-                perm_reason = f"{perm_reason} [LLM upgraded: {new_reason}]"
+                result.final_review = "upgraded"
+                result.final_review_reason = new_reason
                 result.llm_used = True
                 result.llm_decisions.append("final_review_upgrade")
 
-    result.use_permission = use_perm
-    result.permission_reason = perm_reason
+    for use, (perm, reason) in permissions.items():
+        if perm == UsePermission.C_CONTEXT and result.final_review == "upgraded":
+            permissions[use] = (UsePermission.A_SAFEGUARDS, f"{reason} [LLM upgraded: {result.final_review_reason}]")
+    if all_uses:
+        result.use_permissions = {
+            use.value: {"permission": perm.value, "reason": reason}
+            for use, (perm, reason) in permissions.items()
+        }
+    result.use_permission, result.permission_reason = permissions[intended_use]
 
     return result
 
@@ -2105,11 +4798,34 @@ def evaluate_sources(
     max_aux_pages: int,
     use_llm: bool = True,
     llm_model: str = DEFAULT_LLM_MODEL,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    publisher_max_age_s: int = DEFAULT_PUBLISHER_MAX_AGE_S,
+    llm_review_mode: str = "separate",
+    llm_batch: bool = False,
+    domain_verdict_max_age_s: int = DEFAULT_DOMAIN_VERDICT_MAX_AGE_S,
 ) -> List[EvalResult]:
-    """Evaluate multiple sources."""
-    session = requests.Session()
-    session.headers.update(HEADERS)
-    session.max_redirects = 10  # Prevent infinite redirect loops
+    """Evaluate multiple sources.
+
+    `intended_use` "ALL" evaluates each source once for all three uses (see
+    evaluate_source). With `concurrency` > 1, sources are evaluated by a bounded worker pool and
+    `sleep_s` is enforced per registrable domain instead of after every fetch,
+    so wall-clock time scales with the number of distinct domains. Publisher
+    pages are crawled once per domain and shared across the batch. Each
+    verdict is also stored as a "v6-verdicts" artifact in the shared cache,
+    and its intended-use-independent checks as a "v6-checks" artifact.
+    With `llm_batch`, LLM requests go out as message batches between passes
+    over the cached pages (see run_llm_batched). Satire and source-type
+    verdicts are memoized per domain for `domain_verdict_max_age_s` (see
+    DomainVerdictStore; 0 asks for every article).
+    """
+    if llm_batch and use_llm:
+        batch_client = get_anthropic_client()
+        if batch_client:
+            return run_llm_batched(batch_client, lambda: evaluate_sources(
+                urls, intended_use, cache_dir, cache_max_age_s, no_cache, sleep_s, timeout_s,
+                max_aux_pages, use_llm, llm_model, concurrency, publisher_max_age_s, llm_review_mode,
+                domain_verdict_max_age_s=domain_verdict_max_age_s,
+            ))
 
     # Initialize LLM client if enabled
     llm_client = None
@@ -2130,11 +4846,13 @@ def evaluate_sources(
             unique_urls.append(u)
 
     is_single_source = len(unique_urls) == 1
-    use = IntendedUse(intended_use)
+    all_uses = intended_use.upper() == "ALL"
+    use = IntendedUse.A if all_uses else IntendedUse(intended_use)
+    verdict_use = "ALL" if all_uses else use.value
+    publisher_store = PublisherStore(cache_dir, publisher_max_age_s, persist=not no_cache)
+    domain_verdicts = DomainVerdictStore(cache_dir, domain_verdict_max_age_s, persist=not no_cache)
 
-    results = []
-    for i, url in enumerate(unique_urls, 1):
-        print(f"[{i}/{len(unique_urls)}] Evaluating: {url}")
+    def run_one(url: str, session: requests.Session, throttle: Optional[DomainThrottle]) -> EvalResult:
         result = evaluate_source(
             session=session,
             url=url,
@@ -2148,28 +4866,134 @@ def evaluate_sources(
             is_single_source=is_single_source,
             llm_client=llm_client,
             llm_model=llm_model,
+            throttle=throttle,
+            publisher_store=publisher_store,
+            all_uses=all_uses,
+            consolidated_llm=llm_review_mode == "consolidated",
+            domain_verdicts=domain_verdicts,
         )
-        print(f"    -> {result.use_permission.value}")
-        results.append(result)
+        if not no_cache:
+            data = result_to_dict(result)
+            write_artifact(cache_dir, "v6", "verdicts", f"{verdict_use}:{url}", data)
+            # Checks do not depend on intended use: --rejudge can re-derive any use from these
+            write_artifact(cache_dir, "v6", "checks", url, data)
+        return result
 
-    return results
+    if concurrency <= 1:
+        session = make_session()
+        results = []
+        for i, url in enumerate(unique_urls, 1):
+            print(f"[{i}/{len(unique_urls)}] Evaluating: {url}")
+            result = run_one(url, session, None)
+            print(f"    -> {result.use_permission.value}")
+            results.append(result)
+        return results
+
+    # Concurrent run: results keep input order, progress prints as sources finish
+    print(f"Evaluating with {concurrency} workers (per-domain spacing: {sleep_s}s)")
+    throttle = DomainThrottle(sleep_s)
+    slots: List[Optional[EvalResult]] = [None] * len(unique_urls)
+    done = 0
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = {
+            pool.submit(lambda u: run_one(u, thread_session(), throttle), url): idx
+            for idx, url in enumerate(unique_urls)
+        }
+        for fut in as_completed(futures):
+            idx = futures[fut]
+            result = fut.result()
+            slots[idx] = result
+            done += 1
+            print(f"[{done}/{len(unique_urls)}] {unique_urls[idx]}\n    -> {result.use_permission.value}")
+
+    return [r for r in slots if r is not None]
 
 
 # -----------------------------------------------------------------------------
 # Report Generation
 # -----------------------------------------------------------------------------
-def render_report_md(results: List[EvalResult]) -> str:
-    """Generate markdown report."""
+def total_llm_usage(results: List[EvalResult]) -> LLMUsage:
+    total = LLMUsage()
+    for r in results:
+        for f in dataclasses.fields(LLMUsage):
+            setattr(total, f.name, getattr(total, f.name) + getattr(r.llm_usage, f.name))
+    return total
+
+
+def prompt_cache_savings(usage: LLMUsage) -> float:
+    """Fraction of input-token cost saved by prompt caching (negative while only writing)."""
+    total = usage.input_tokens + usage.cache_read_tokens + usage.cache_write_tokens
+    if not total:
+        return 0.0
+    billed = (usage.input_tokens + usage.cache_read_tokens * PROMPT_CACHE_READ_COST
+              + usage.cache_write_tokens * PROMPT_CACHE_WRITE_COST)
+    return 1.0 - billed / total
+
+
+def format_llm_usage(usage: LLMUsage, sources: int = 1) -> str:
+    text = (f"{usage.calls} call(s), {usage.input_tokens} input / {usage.output_tokens} output tokens, "
+            f"{usage.latency_s:.1f}s")
+    if sources > 1:
+        text += (f" ({usage.calls / sources:.1f} calls, {usage.input_tokens / sources:.0f} input tokens, "
+                 f"{usage.latency_s / sources:.1f}s per source)")
+    if usage.cache_read_tokens or usage.cache_write_tokens:
+        text += (f"; prompt cache: {usage.cache_read_tokens} cached / {usage.cache_write_tokens} written "
+                 f"input tokens, {prompt_cache_savings(usage):.0%} of input cost saved")
+    return text
+
+
+def format_permissions(r: EvalResult) -> str:
+    """One-line permission summary: the triplet for --intended-use all runs."""
+    if r.use_permissions:
+        return " | ".join(f"{use}: {v['permission']}" for use, v in r.use_permissions.items())
+    return r.use_permission.value
+
+
+def format_llm_budget(budget: Dict[str, Any]) -> List[str]:
+    """Markdown table of LLMBudget.to_dict() spend per stage."""
+    lines = ["| LLM stage | Calls | Input | Cached input | Output | Cost (USD) | Refused |",
+             "|---|---|---|---|---|---|---|"]
+    for name, s in list(budget["stages"].items()) + [("**total**", budget["total"])]:
+        lines.append(f"| {name} | {s['calls']} | {s['input_tokens'] + s['cache_write_tokens']} | "
+                     f"{s['cache_read_tokens']} | {s['output_tokens']} | {s['cost_usd']:.4f} | {s['refused']} |")
+    if budget["exhausted"]:
+        lines.append("\n_LLM budget reached: refused requests fell back to heuristics._")
+    return lines + [""]
+
+
+def render_report_md(
+    results: List[EvalResult], llm_budget: Optional[Dict[str, Any]] = None, llm_batch: bool = False
+) -> str:
+    """Generate markdown report; `llm_budget` (LLMBudget.to_dict()) adds per-stage spend.
+
+    With `llm_batch` the per-source LLM usage reads 0 calls: sources are
+    answered from the LLM cache the batches filled, so the note points to
+    the stage table, where the batches are billed.
+    """
     lines = []
     lines.append("# HRF Source Evaluation Report")
     lines.append(f"_Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}_")
     lines.append(f"_Evaluator: v6 (HRF Practical v1)_\n")
+    usage = total_llm_usage(results)
+    if usage.calls:
+        lines.append(f"_LLM usage: {format_llm_usage(usage, len(results))}_\n")
+    if llm_batch:
+        lines.append("_LLM requests went out as message batches: per-source LLM usage counts direct API "
+                     "calls only and reads 0; batch spend is in the LLM stage table._\n")
+    if llm_budget and llm_budget["stages"]:
+        lines.extend(format_llm_budget(llm_budget))
 
     for r in results:
         lines.append(f"## {r.final_url or r.url}\n")
         lines.append(f"**Domain:** {r.domain}")
-        lines.append(f"**Use Permission:** {r.use_permission.value}")
-        lines.append(f"**Reason:** {r.permission_reason}\n")
+        if r.use_permissions:
+            lines.append("**Use Permission by Intended Use:**")
+            for use, verdict in r.use_permissions.items():
+                lines.append(f"- **{use}:** {verdict['permission']} — {verdict['reason']}")
+            lines.append("")
+        else:
+            lines.append(f"**Use Permission:** {r.use_permission.value}")
+            lines.append(f"**Reason:** {r.permission_reason}\n")
 
         lines.append("### Core Checks\n")
 
@@ -2222,6 +5046,10 @@ def render_report_md(results: List[EvalResult]) -> str:
             lines.append("\n### LLM Augmentation")
             lines.append(f"- LLM used: Yes")
             lines.append(f"- Decisions augmented: {', '.join(r.llm_decisions)}")
+        if r.llm_usage.calls:
+            lines.append(f"- LLM usage: {format_llm_usage(r.llm_usage)}")
+        elif llm_batch and r.llm_used:
+            lines.append("- LLM usage: answered by message batches (see the LLM stage table)")
 
         lines.append("\n### Evidence Pages Fetched")
         for ep in r.evidence_pages:
@@ -2240,6 +5068,7 @@ def result_to_dict(r: EvalResult) -> Dict[str, Any]:
         "domain": r.domain,
         "use_permission": r.use_permission.value,
         "permission_reason": r.permission_reason,
+        **({"use_permissions": r.use_permissions} if r.use_permissions else {}),
         "core_checks": {
             "intended_use": r.core.intended_use.value,
             "relationship": {
@@ -2260,6 +5089,7 @@ def result_to_dict(r: EvalResult) -> Dict[str, Any]:
                 "has_anchors": r.core.has_specificity,
                 "reason": r.core.specificity_reason,
                 "anchors": r.core.specificity_anchors,
+                "features": r.core.specificity_features,
             },
             "corroboration": {
                 "status": r.core.corroboration.value,
@@ -2271,6 +5101,10 @@ def result_to_dict(r: EvalResult) -> Dict[str, Any]:
                 "reason": r.core.severity_reason,
                 "missing": r.core.severity_missing,
             },
+            "content_analysis_signal": {
+                "boost": r.core.content_analysis_boost,
+                "reason": r.core.content_analysis_reason,
+            },
         },
         "publisher_signals": {
             "ownership_transparency": {
@@ -2309,37 +5143,586 @@ def result_to_dict(r: EvalResult) -> Dict[str, Any]:
             "llm_used": r.llm_used,
             "llm_error": r.llm_error,
             "llm_decisions": r.llm_decisions,
+            "llm_usage": {**dataclasses.asdict(r.llm_usage), "latency_s": round(r.llm_usage.latency_s, 3)},
+            "llm_enabled": r.llm_enabled,
+            "single_source": r.single_source,
+            "auto_rejected": r.auto_rejected,
+            "final_review": {"status": r.final_review, "reason": r.final_review_reason},
         },
     }
 
 
+def _check_from_dict(d: Dict[str, Any]) -> Check:
+    return Check(status=d.get("status", "not_assessed"), reason=d.get("reason", ""),
+                 evidence_quotes=list(d.get("quotes", [])), assessed=d.get("assessed", False))
+
+
+def result_from_dict(d: Dict[str, Any]) -> EvalResult:
+    """Inverse of result_to_dict; missing keys (older reports) keep their defaults."""
+    cc = d.get("core_checks", {})
+    rel = cc.get("relationship", {})
+    comp = cc.get("completeness", {})
+    ev = cc.get("evidence_strength", {})
+    spec = cc.get("specificity", {})
+    corr = cc.get("corroboration", {})
+    sev = cc.get("severity_support", {})
+    signal = cc.get("content_analysis_signal", {})
+    core = CoreChecks(
+        intended_use=IntendedUse(cc.get("intended_use", IntendedUse.C.value)),
+        relationship=RelationshipType(rel.get("type", RelationshipType.UNKNOWN.value)),
+        b_only_restriction=rel.get("b_only_restriction", False),
+        relationship_reason=rel.get("reason", ""),
+        completeness=Completeness(comp.get("status", Completeness.FAILED.value)),
+        completeness_reason=comp.get("reason", ""),
+        evidence_strength=EvidenceStrength(ev.get("level", EvidenceStrength.NOT_ASSESSED.value)),
+        evidence_reason=ev.get("reason", ""),
+        evidence_quotes=list(ev.get("quotes", [])),
+        has_specificity=spec.get("has_anchors", False),
+        specificity_reason=spec.get("reason", ""),
+        specificity_anchors=list(spec.get("anchors", [])),
+        specificity_features=dict(spec.get("features", {})),
+        corroboration=CorroborationStatus(corr.get("status", CorroborationStatus.NOT_ASSESSED.value)),
+        corroboration_reason=corr.get("reason", ""),
+        severity_claim_detected=sev.get("claim_detected", False),
+        severity_support=SeveritySupport(sev.get("status", SeveritySupport.NOT_APPLICABLE.value)),
+        severity_reason=sev.get("reason", ""),
+        severity_missing=list(sev.get("missing", [])),
+        content_analysis_boost=signal.get("boost"),
+        content_analysis_reason=signal.get("reason", ""),
+    )
+    ps = d.get("publisher_signals", {})
+    publisher = PublisherSignals(**{
+        name: _check_from_dict(ps[name]) for name in
+        ("ownership_transparency", "corrections_behavior", "standards_transparency") if name in ps
+    })
+    ca = d.get("content_analysis", {})
+    content = ContentAnalysis(
+        claims=list(ca.get("claims", [])),
+        contradiction_flags=list(ca.get("contradiction_flags", [])),
+        confidence_summary=ca.get("confidence_summary", ""),
+        confidence_level=ca.get("confidence_level", "not_assessed"),
+        analysis_truncated=ca.get("analysis_truncated", False),
+        analyzed=ca.get("analyzed", False),
+    )
+    md = d.get("metadata", {})
+    review = md.get("final_review", {})
+    return EvalResult(
+        url=d.get("url", ""),
+        final_url=d.get("final_url", ""),
+        domain=d.get("domain", ""),
+        use_permission=UsePermission(d.get("use_permission", UsePermission.DO_NOT_USE.value)),
+        permission_reason=d.get("permission_reason", ""),
+        core=core,
+        publisher=publisher,
+        content_analysis=content,
+        fetch_status=md.get("fetch_status", ""),
+        content_type=md.get("content_type", ""),
+        text_length=md.get("text_length", 0),
+        evidence_pages=list(md.get("evidence_pages", [])),
+        warnings=list(md.get("warnings", [])),
+        llm_used=md.get("llm_used", False),
+        llm_error=md.get("llm_error", ""),
+        llm_decisions=list(md.get("llm_decisions", [])),
+        llm_usage=LLMUsage(**md.get("llm_usage", {})),
+        llm_enabled=md.get("llm_enabled", False),
+        single_source=md.get("single_source", False),
+        auto_rejected=md.get("auto_rejected", False),
+        final_review=review.get("status", ""),
+        final_review_reason=review.get("reason", ""),
+        use_permissions=dict(d.get("use_permissions", {})),
+    )
+
+
+# -----------------------------------------------------------------------------
+# Offline Re-judging (--rejudge)
+# -----------------------------------------------------------------------------
+REJUDGE_SKIPPED_REVIEW = "LLM final review not re-run offline for this intended use"
+
+
+def _rejudge_permission(r: EvalResult, use: IntendedUse) -> Tuple[UsePermission, str, bool]:
+    """(permission, reason, review_skipped) for `use` from the stored checks."""
+    if r.auto_rejected:
+        return UsePermission.DO_NOT_USE, r.permission_reason, False
+    perm, reason = determine_use_permission(use, r.core, r.publisher, r.single_source, r.domain)
+    if perm == UsePermission.C_CONTEXT and "wikipedia.org" not in r.domain.lower():
+        if r.final_review == "upgraded":
+            return UsePermission.A_SAFEGUARDS, f"{reason} [LLM upgraded: {r.final_review_reason}]", False
+        if not r.final_review and r.llm_enabled and r.text_length:
+            return perm, reason, True
+    return perm, reason, False
+
+
+def rejudge_result(r: EvalResult, intended_use: Optional[IntendedUse] = None, all_uses: bool = False) -> EvalResult:
+    """Re-derive use_permission from stored checks: no fetches, no LLM calls.
+
+    Auto-rejected sources stay rejected, and a stored LLM final-review upgrade
+    is replayed when the new permission is again C: Context-only. If the
+    review never ran because the original permission differed, the result
+    keeps C and says so in its warnings. `all_uses` fills use_permissions
+    for A, B and C and mirrors A in use_permission.
+    """
+    use = IntendedUse.A if all_uses else (intended_use or r.core.intended_use)
+    r.core.intended_use = use
+    r.warnings = [w for w in r.warnings if w != REJUDGE_SKIPPED_REVIEW]
+    verdicts = {u: _rejudge_permission(r, u) for u in (IntendedUse if all_uses else [use])}
+    if any(skipped for _, _, skipped in verdicts.values()):
+        r.warnings.append(REJUDGE_SKIPPED_REVIEW)
+    r.use_permissions = {
+        u.value: {"permission": perm.value, "reason": reason} for u, (perm, reason, _) in verdicts.items()
+    } if all_uses else {}
+    r.use_permission, r.permission_reason, _ = verdicts[use]
+    return r
+
+
+def rejudge_report(
+    entries: List[Dict[str, Any]],
+    intended_use: Optional[IntendedUse] = None,
+    cache_dir: str = "",
+    all_uses: bool = False,
+) -> List[EvalResult]:
+    """Rejudge every entry of a saved hrf_report.json.
+
+    Entries written before the checks were fully serialized are replaced by
+    the source's "v6-checks" artifact in `cache_dir` when one exists.
+    """
+    results = []
+    for entry in entries:
+        if cache_dir and "content_analysis_signal" not in entry.get("core_checks", {}):
+            stored = read_artifact(cache_dir, "v6", "checks", entry.get("url", ""))
+            if stored:
+                entry = stored
+        results.append(rejudge_result(result_from_dict(entry), intended_use, all_uses))
+    return results
+
+
+# -----------------------------------------------------------------------------
+# Batch Re-scoring (vectorized heuristic rules over the cached corpus)
+# -----------------------------------------------------------------------------
+@dataclass
+class FeatureMatrix:
+    """Columnar heuristic features for a batch of cached documents.
+
+    Everything the heuristic-only (--no-llm) permission path reads, so rule
+    configurations can be re-applied as array operations without re-scanning.
+    """
+    urls: List[str]
+    keywords: List[str]                # columns of keyword_hits
+    keyword_hits: Any                  # bool ndarray [docs x keywords]
+    columns: Dict[str, Any] = field(default_factory=dict)  # name -> 1-D ndarray
+
+
+def load_cached_docs(cache_dir: str, urls: Optional[List[str]] = None) -> List[FetchedDoc]:
+    """Cached main documents for `urls`.
+
+    Without `urls`, the sources v6 evaluated: cached pages with a "v6-checks"
+    artifact. The fetch cache also holds publisher pages, v7 articles and
+    negative-cached failures, which are not sources.
+    """
+    backend = get_cache_backend(cache_dir)
+    if urls:
+        urls = [sanitize_url(u) for u in urls]
+    else:
+        urls = [u for u in backend.iter_urls() if read_artifact(cache_dir, "v6", "checks", u) is not None]
+    docs = []
+    for url in urls:
+        entry = backend.get(url)
+        if entry is not None:
+            docs.append(entry[0])
+    return docs
+
+
+def build_feature_matrix(docs: List[FetchedDoc], keywords: List[str]) -> FeatureMatrix:
+    """Scan each document once and stack the results into NumPy columns."""
+    spec_fields = [f.name for f in dataclasses.fields(SpecificityFeatures)]
+    flags = ["fetch_failed", "is_pdf", "paywall", "botblock", "attribution", "b_only", "wikipedia", "rejected"]
+    rows: Dict[str, List[Any]] = {name: [] for name in ["text_len", *flags, *spec_fields]}
+    keyword_hits = np.zeros((len(docs), len(keywords)), dtype=bool)
+    for i, doc in enumerate(docs):
+        text = doc.text or ""
+        hits = scan_article_keywords(text)
+        keyword_hits[i] = [hits.offset(kw) != -1 for kw in keywords]
+        warnings = [w.lower() for w in doc.warnings]
+        rows["text_len"].append(len(text))
+        rows["fetch_failed"].append(doc.fetch_status in ("http_error", "timeout", "error"))
+        rows["is_pdf"].append(doc.fetch_status == "pdf")
+        rows["paywall"].append(any("paywall" in w or "login" in w for w in warnings))
+        rows["botblock"].append(any("bot" in w for w in warnings))
+        rows["attribution"].append(has_attribution(text))
+        rows["b_only"].append(assess_relationship(doc.final_url or doc.url, doc.domain, text)[1])
+        rows["wikipedia"].append("wikipedia.org" in doc.domain.lower())
+        rows["rejected"].append(check_auto_reject(doc)[0] or body_self_identifies_as_satire(text))
+        features = extract_specificity_features(text)
+        for name in spec_fields:
+            rows[name].append(getattr(features, name))
+    return FeatureMatrix(
+        urls=[doc.url for doc in docs],
+        keywords=list(keywords),
+        keyword_hits=keyword_hits,
+        columns={name: np.array(values, dtype=bool if name in flags else np.int64)
+                 for name, values in rows.items()},
+    )
+
+
+def score_feature_matrix(
+    fm: FeatureMatrix,
+    rules: HeuristicRules,
+    intended_use: IntendedUse,
+    is_single_source: bool = False,
+) -> Tuple[Any, Any]:
+    """Heuristic-only determine_use_permission for every document at once.
+
+    Returns (permission values, deciding rule names) as string arrays. The
+    rule list mirrors the order of the checks in determine_use_permission.
+    """
+    c = fm.columns
+    text_len = c["text_len"]
+    unassessable = (text_len == 0) | (text_len < rules.min_text_chars)
+
+    # Check 3: completeness
+    failed = c["fetch_failed"] | (text_len < rules.min_text_chars)
+    partial = ~failed & (text_len < rules.complete_text_chars) & (
+        c["botblock"]
+        | (c["paywall"] & (text_len < rules.paywall_partial_chars))
+        | (text_len < rules.limited_text_chars)
+    )
+
+    # Check 4: evidence strength
+    primary = fm.keyword_hits[:, [fm.keywords.index(kw) for kw in rules.primary_anchor_keywords]].sum(axis=1)
+    strong = ~unassessable & (c["is_pdf"] | (primary >= rules.strong_primary_anchors))
+    medium = ~unassessable & ~strong & c["attribution"]
+    weak = ~unassessable & ~strong & ~medium
+
+    # Check 5: specificity
+    anchor_types = (
+        ((c["years"] + c["full_dates"] + c["numeric_dates"]) >= rules.min_dates).astype(np.int64)
+        + ((c["location_context"] > 0) | (c["in_places"] >= rules.min_in_places))
+        + ((c["quantities_people"] + c["quantities_money"] + c["quantities_ratio"]) >= rules.min_quantities)
+        + (c["named_actors"] >= rules.min_named_actors)
+    )
+    specific = ~unassessable & (anchor_types >= rules.min_anchor_types)
+
+    everything = np.ones(len(fm.urls), dtype=bool)
+    steps = [
+        ("auto_reject", c["rejected"], UsePermission.DO_NOT_USE),
+        ("wikipedia", c["wikipedia"], UsePermission.C_CONTEXT),
+        ("access_failed", failed, UsePermission.MANUAL_RETRIEVAL),
+    ]
+    if intended_use == IntendedUse.A:
+        capped = is_single_source and rules.single_source_caps_a
+        steps += [
+            ("partial_access", partial, UsePermission.MANUAL_RETRIEVAL),
+            ("self_interest", c["b_only"], UsePermission.B_NARRATIVE),
+            ("weak_evidence", weak, UsePermission.C_CONTEXT),
+            ("no_specificity", ~specific, UsePermission.C_CONTEXT),
+            ("strong_evidence", strong, UsePermission.A_SAFEGUARDS if capped else UsePermission.A_PREFERRED),
+            ("medium_evidence", medium, UsePermission.A_SAFEGUARDS),
+            ("insufficient_evidence", everything, UsePermission.C_CONTEXT),
+        ]
+    elif intended_use == IntendedUse.B:
+        steps += [
+            ("self_interest", c["b_only"], UsePermission.B_NARRATIVE),
+            ("narrative_use", everything, UsePermission.B_NARRATIVE),
+        ]
+    else:
+        steps += [("context_use", everything, UsePermission.C_CONTEXT)]
+
+    decided = np.select([cond for _, cond, _ in steps], list(range(len(steps))))
+    permissions = np.array([perm.value for _, _, perm in steps])[decided]
+    rule_names = np.array([name for name, _, _ in steps])[decided]
+    return permissions, rule_names
+
+
+def rescore_diff(
+    fm: FeatureMatrix,
+    base: HeuristicRules,
+    candidate: HeuristicRules,
+    intended_use: IntendedUse,
+    is_single_source: bool = False,
+) -> Dict[str, Any]:
+    """Score `fm` under both rule sets and summarize what moved, per rule."""
+    perm_a, rule_a = score_feature_matrix(fm, base, intended_use, is_single_source)
+    perm_b, rule_b = score_feature_matrix(fm, candidate, intended_use, is_single_source)
+    moved = np.flatnonzero((perm_a != perm_b) | (rule_a != rule_b))
+
+    transitions = []
+    if len(moved):
+        keys = np.stack([rule_a[moved], rule_b[moved], perm_a[moved], perm_b[moved]], axis=1)
+        groups, counts = np.unique(keys, axis=0, return_counts=True)
+        for (from_rule, to_rule, from_perm, to_perm), count in sorted(
+                zip(groups.tolist(), counts.tolist()), key=lambda g: -g[1]):
+            transitions.append({"from_rule": from_rule, "to_rule": to_rule,
+                                "from": from_perm, "to": to_perm, "count": count})
+
+    def tally(values: Any) -> Dict[str, int]:
+        names, counts = np.unique(values, return_counts=True)
+        return dict(zip(names.tolist(), counts.tolist()))
+
+    return {
+        "intended_use": intended_use.value,
+        "documents": len(fm.urls),
+        "permission_changes": int((perm_a != perm_b).sum()),
+        "rule_changes": int(len(moved)),
+        "base_rules": dataclasses.asdict(base),
+        "candidate_rules": dataclasses.asdict(candidate),
+        "permissions": {"base": tally(perm_a), "candidate": tally(perm_b)},
+        "transitions": transitions,
+        "changes": [
+            {"url": fm.urls[i], "from": perm_a[i], "to": perm_b[i],
+             "from_rule": rule_a[i], "to_rule": rule_b[i]}
+            for i in moved.tolist()
+        ],
+    }
+
+
+def rescore_cache(
+    cache_dir: str,
+    base: HeuristicRules,
+    candidate: HeuristicRules,
+    intended_use: IntendedUse,
+    urls: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """Re-score cached documents under two rule configurations (no network, no LLM)."""
+    docs = load_cached_docs(cache_dir, urls)
+    keywords = list(dict.fromkeys(base.primary_anchor_keywords + candidate.primary_anchor_keywords))
+    fm = build_feature_matrix(docs, keywords)
+    return rescore_diff(fm, base, candidate, intended_use, is_single_source=len(docs) == 1)
+
+
 # -----------------------------------------------------------------------------
 # CLI
 # -----------------------------------------------------------------------------
+# (CLI flag, CACHE_TTLS key, help text) for the status-aware cache TTLs
+CACHE_TTL_ARGS = [
+    ("--cache-ttl-pdf", "pdf", "TTL for cached PDFs"),
+    ("--cache-ttl-not-found", "not_found", "TTL for cached 404/410 responses"),
+    ("--cache-ttl-http-error", "http_error", "TTL for other cached 4xx responses"),
+    ("--cache-ttl-server-error", "server_error", "TTL for cached 5xx responses"),
+    ("--cache-ttl-timeout", "timeout", "TTL for cached timeouts"),
+    ("--cache-ttl-error", "error", "TTL for cached connection/redirect errors"),
+]
+
+
+def add_cache_ttl_args(p: argparse.ArgumentParser) -> None:
+    for flag, key, help_text in CACHE_TTL_ARGS:
+        p.add_argument(flag, type=int, default=CACHE_TTLS[key],
+                       help=f"{help_text} in seconds (default: {CACHE_TTLS[key]})")
+
+
+def apply_cache_ttl_args(args: argparse.Namespace) -> None:
+    for flag, key, _ in CACHE_TTL_ARGS:
+        CACHE_TTLS[key] = getattr(args, flag.lstrip("-").replace("-", "_"))
+
+
+def add_llm_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument("--llm-rpm", type=int, default=LLM_RPM,
+                   help="Max LLM requests per minute per model (default: 0 = unlimited)")
+    p.add_argument("--llm-itpm", type=int, default=LLM_ITPM,
+                   help="Max LLM input tokens per minute per model (default: 0 = unlimited)")
+    p.add_argument("--llm-timeout-s", type=float, default=LLM_TIMEOUT_S,
+                   help=f"Per-request LLM timeout (default: {LLM_TIMEOUT_S:g})")
+    p.add_argument("--llm-max-retries", type=int, default=LLM_MAX_RETRIES,
+                   help=f"Retries on 429/529, timeouts and connection errors (default: {LLM_MAX_RETRIES})")
+    p.add_argument("--no-llm-prompt-cache", action="store_true",
+                   help="Do not mark the static review instructions for provider-side prompt caching")
+    p.add_argument("--llm-batch", action="store_true",
+                   help="Send LLM requests as message batches (cheaper, slower): collect, submit, "
+                        "poll, then resume; needs the cache")
+    p.add_argument("--llm-batch-poll-s", type=float, default=LLM_BATCH_POLL_S,
+                   help=f"Seconds between message batch status checks (default: {LLM_BATCH_POLL_S:g})")
+    p.add_argument("--max-llm-tokens", type=int, default=0,
+                   help="Per-job LLM token ceiling; further requests fall back to heuristics (default: 0 = none)")
+    p.add_argument("--max-llm-cost", type=float, default=0.0,
+                   help="Per-job LLM cost ceiling in USD, at LLM_PRICES list prices (default: 0 = none)")
+    p.add_argument("--usage-json", default="",
+                   help="Keep LLM token/cost totals per stage in this JSON file, updated after every request")
+    p.add_argument("--no-llm-cache", action="store_true",
+                   help="Always call the API instead of reusing cached LLM responses")
+    p.add_argument("--llm-cache-max-age-s", type=int, default=LLM_CACHE_MAX_AGE_S,
+                   help=f"Reuse cached LLM responses up to this age (default: {LLM_CACHE_MAX_AGE_S}, -1 = forever)")
+    p.add_argument("--llm-cache-max-bytes", type=int, default=LLM_CACHE_MAX_BYTES,
+                   help=f"Evict least-recently-used LLM responses above this size "
+                        f"(default: {LLM_CACHE_MAX_BYTES}, 0 = unbounded)")
+
+
+def apply_llm_args(args: argparse.Namespace) -> None:
+    """Rate limits, retries, batching and budget for llm_call; its cache lives
+    in --cache-dir unless --no-cache / --no-llm-cache (--llm-batch needs it)."""
+    global LLM_RPM, LLM_ITPM, LLM_TIMEOUT_S, LLM_MAX_RETRIES, LLM_BATCH_POLL_S, LLM_PROMPT_CACHE
+    global LLM_CACHE_DIR, LLM_CACHE_MAX_AGE_S, LLM_CACHE_MAX_BYTES
+    LLM_RPM, LLM_ITPM = args.llm_rpm, args.llm_itpm
+    LLM_TIMEOUT_S, LLM_MAX_RETRIES = args.llm_timeout_s, args.llm_max_retries
+    LLM_BATCH_POLL_S = args.llm_batch_poll_s
+    LLM_PROMPT_CACHE = not args.no_llm_prompt_cache
+    LLM_BUDGET.configure(args.max_llm_tokens, args.max_llm_cost, args.usage_json)
+    LLM_CACHE_DIR = "" if args.no_cache or args.no_llm_cache else args.cache_dir
+    if args.llm_batch and not LLM_CACHE_DIR:
+        print("--llm-batch stores answers in the LLM cache; drop --no-cache / --no-llm-cache.")
+        sys.exit(2)
+    LLM_CACHE_MAX_AGE_S = args.llm_cache_max_age_s
+    LLM_CACHE_MAX_BYTES = args.llm_cache_max_bytes
+
+
+def add_cache_backend_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument("--cache-backend", choices=sorted(CACHE_BACKENDS), default=CACHE_BACKEND,
+                   help="sqlite = single-file store (default), files = legacy .json/.txt pairs")
+    p.add_argument("--migrate-cache", action="store_true",
+                   help="Import a legacy file-pair cache in --cache-dir into SQLite, then exit")
+    p.add_argument("--reextract", action="store_true",
+                   help="Rebuild cached text/meta from stored raw bodies (no network), then exit")
+    p.add_argument("--noise-config", default="",
+                   help='JSON file overriding noise pruning: {"tags": [...], "id_class_keywords": [...]}')
+    p.add_argument("--eager-extraction", action="store_true",
+                   help="Run every HTML extractor even when an earlier candidate already wins")
+    p.add_argument("--check-extractor", action="store_true",
+                   help="Compare the lxml extractor with the legacy one on cached pages, then exit")
+    p.add_argument("--cache-max-bytes", type=int, default=CACHE_MAX_BYTES,
+                   help="Evict least-recently-used cache entries above this size (default: 0 = unbounded)")
+
+
+def apply_cache_backend_args(args: argparse.Namespace) -> bool:
+    """Select the cache backend and run one-shot maintenance modes.
+    Returns True if a maintenance mode ran and the caller should exit."""
+    global CACHE_BACKEND, CACHE_MAX_BYTES, LAZY_EXTRACTION
+    CACHE_BACKEND = args.cache_backend
+    CACHE_MAX_BYTES = args.cache_max_bytes
+    LAZY_EXTRACTION = not args.eager_extraction
+    if args.noise_config:
+        load_noise_config(args.noise_config)
+    if args.migrate_cache:
+        n = migrate_directory_cache(args.cache_dir)
+        print(f"Migrated {n} cache entries from {args.cache_dir} into {SQLiteCache.FILENAME}")
+        return True
+    if args.reextract:
+        started = time.time()
+        done, skipped = reextract_cache(args.cache_dir)
+        print(f"Re-extracted {done} cached pages in {time.time() - started:.1f}s "
+              f"({skipped} skipped without a stored body)")
+        return True
+    if args.check_extractor:
+        if not HAS_LXML:
+            print("lxml is not installed; the legacy extractor is already in use.")
+            return True
+        compared, mismatches, legacy_s, lxml_s = compare_extractors(args.cache_dir)
+        for line in mismatches:
+            print(f"  MISMATCH {line}")
+        print(f"Compared {compared} cached pages: {len(mismatches)} mismatches "
+              f"(legacy {legacy_s:.2f}s, lxml {lxml_s:.2f}s)")
+        return True
+    return False
+
+
 def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
     p = argparse.ArgumentParser(
         description="HRF Source Evaluator v6 - Source Credibility Standard (Practical v1)"
     )
     p.add_argument("--works-cited", default="", help="Path to works cited file with URLs")
     p.add_argument("--urls", default="", help="Comma-separated URLs to evaluate")
-    p.add_argument("--intended-use", required=True, choices=["A", "B", "C"],
-                   help="A=factual support, B=narrative, C=analysis/context")
-    p.add_argument("--cache-dir", default=".cache_hrf_eval")
-    p.add_argument("--cache-max-age-s", type=int, default=7 * 24 * 3600)
+    p.add_argument("--intended-use", type=str.upper, choices=["A", "B", "C", "ALL"],
+                   help="A=factual support, B=narrative, C=analysis/context, "
+                        "all=evaluate once and report a permission for each use")
+    p.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR)
+    p.add_argument("--cache-max-age-s", type=int, default=CACHE_TTLS["ok"],
+                   help="TTL for successfully fetched HTML pages (negative = never expire)")
+    add_cache_ttl_args(p)
     p.add_argument("--no-cache", action="store_true")
+    add_cache_backend_args(p)
+    add_llm_args(p)
     p.add_argument("--sleep-s", type=float, default=DEFAULT_SLEEP_S)
     p.add_argument("--timeout-s", type=int, default=DEFAULT_TIMEOUT_S)
+    p.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY,
+                   help="Parallel fetch workers; --sleep-s then applies per domain (default: 1)")
     p.add_argument("--max-aux-pages", type=int, default=3)
+    p.add_argument("--publisher-max-age-s", type=int, default=DEFAULT_PUBLISHER_MAX_AGE_S,
+                   help="TTL for cached per-domain publisher profiles (default: 30 days)")
+    p.add_argument("--domain-verdict-max-age-s", type=int, default=DEFAULT_DOMAIN_VERDICT_MAX_AGE_S,
+                   help="How long a domain's LLM satire/source-type verdict is reused for its other "
+                        "articles (default: 30 days; 0 = ask for every article, negative = never expire)")
     p.add_argument("--out-md", default="hrf_report.md")
     p.add_argument("--out-json", default="hrf_report.json")
     p.add_argument("--no-llm", action="store_true", help="Disable LLM augmentation (heuristics only)")
     p.add_argument("--llm-model", default=DEFAULT_LLM_MODEL,
                    help=f"Anthropic model for LLM review (default: {DEFAULT_LLM_MODEL})")
+    p.add_argument("--llm-review", choices=["separate", "consolidated"], default="separate",
+                   help="separate: one LLM request per flagged check (default); "
+                        "consolidated: one structured request per source for all flagged checks, "
+                        "plus the final review when a source lands on C")
+    p.add_argument("--rules", default="",
+                   help="JSON file overriding heuristic thresholds (see HeuristicRules)")
+    p.add_argument("--rescore", default="",
+                   help="Re-score cached sources (--urls/--works-cited, default every source v6 evaluated) under --rules "
+                        "and this rules JSON, write a per-rule permission diff, then exit")
+    p.add_argument("--rescore-out", default="rescore_diff.json")
+    p.add_argument("--rejudge", default="",
+                   help="Recompute permissions from a saved JSON report (no fetches, no LLM), "
+                        "optionally for another --intended-use, and write --out-md/--out-json")
     return p.parse_args(argv)
 
 
+def run_rejudge(args: argparse.Namespace) -> None:
+    """--rejudge: re-derive permissions offline from a saved report."""
+    with open(args.rejudge, "r", encoding="utf-8") as f:
+        entries = json.load(f)
+    before = [e.get("use_permission", "") for e in entries]
+    started = time.perf_counter()
+    all_uses = args.intended_use == "ALL"
+    results = rejudge_report(
+        entries,
+        IntendedUse(args.intended_use) if args.intended_use and not all_uses else None,
+        args.cache_dir,
+        all_uses,
+    )
+    elapsed = time.perf_counter() - started
+
+    with open(args.out_md, "w", encoding="utf-8") as f:
+        f.write(render_report_md(results))
+    with open(args.out_json, "w", encoding="utf-8") as f:
+        json.dump([result_to_dict(r) for r in results], f, ensure_ascii=False, indent=2)
+
+    changed = sum(1 for old, r in zip(before, results) if old != r.use_permission.value)
+    print(f"Rejudged {len(results)} source(s) in {elapsed * 1000:.1f}ms: {changed} permission change(s)")
+    for old, r in zip(before, results):
+        marker = "" if old == r.use_permission.value else f"  (was {old})"
+        print(f"  {r.domain}: {format_permissions(r)}{marker}")
+    print(f"Wrote: {args.out_md}")
+    print(f"Wrote: {args.out_json}")
+
+
+def run_rescore(args: argparse.Namespace, urls: List[str]) -> None:
+    """--rescore: diff heuristic permissions between two rule files over the cached sources."""
+    if not HAS_NUMPY:
+        print("--rescore needs numpy (pip install numpy).")
+        sys.exit(2)
+    started = time.time()
+    diff = rescore_cache(
+        args.cache_dir, HEURISTIC_RULES, load_heuristic_rules(args.rescore),
+        IntendedUse(args.intended_use), urls or None,
+    )
+    if not diff["documents"]:
+        print("No evaluated sources in the cache; pass them with --urls or --works-cited.")
+    with open(args.rescore_out, "w", encoding="utf-8") as f:
+        json.dump(diff, f, ensure_ascii=False, indent=2)
+    print(f"Re-scored {diff['documents']} cached source(s) in {time.time() - started:.1f}s: "
+          f"{diff['permission_changes']} permission change(s), {diff['rule_changes']} rule change(s)")
+    for t in diff["transitions"]:
+        print(f"  {t['count']:5d}  {t['from_rule']} ({t['from']}) -> {t['to_rule']} ({t['to']})")
+    print(f"Wrote: {args.rescore_out}")
+
+
 def main(argv: Optional[List[str]] = None) -> None:
+    global HEURISTIC_RULES
     args = parse_args(argv)
+    apply_cache_ttl_args(args)
+    apply_llm_args(args)
+    if apply_cache_backend_args(args):
+        return
+    if args.rules:
+        HEURISTIC_RULES = load_heuristic_rules(args.rules)
+    if args.rejudge:
+        run_rejudge(args)
+        return
+    if not args.intended_use:
+        print("--intended-use is required (A, B, C or all).")
+        sys.exit(2)
 
     urls = []
     if args.works_cited:
@@ -2348,6 +5731,13 @@ def main(argv: Optional[List[str]] = None) -> None:
     if args.urls:
         urls.extend([u.strip() for u in args.urls.split(",") if u.strip().startswith("http")])
 
+    if args.rescore:
+        if args.intended_use == "ALL":
+            print("--rescore compares one intended use at a time (A, B or C).")
+            sys.exit(2)
+        run_rescore(args, urls)
+        return
+
     if not urls:
         print("No URLs found. Provide --works-cited and/or --urls.")
         sys.exit(2)
@@ -2365,10 +5755,17 @@ def main(argv: Optional[List[str]] = None) -> None:
         max_aux_pages=args.max_aux_pages,
         use_llm=not args.no_llm,
         llm_model=args.llm_model,
+        concurrency=args.concurrency,
+        publisher_max_age_s=args.publisher_max_age_s,
+        domain_verdict_max_age_s=args.domain_verdict_max_age_s,
+        llm_review_mode=args.llm_review,
+        llm_batch=args.llm_batch,
     )
 
     # Write outputs
-    md = render_report_md(results)
+    LLM_BUDGET.write()
+    budget = LLM_BUDGET.to_dict()
+    md = render_report_md(results, budget, llm_batch=args.llm_batch)
     with open(args.out_md, "w", encoding="utf-8") as f:
         f.write(md)
 
@@ -2382,7 +5779,28 @@ def main(argv: Optional[List[str]] = None) -> None:
     # Summary
     print("\n=== Summary ===")
     for r in results:
-        print(f"  {r.domain}: {r.use_permission.value}")
+        print(f"  {r.domain}: {format_permissions(r)}")
+    usage = total_llm_usage(results)
+    if usage.calls:
+        print(f"\nLLM ({args.llm_review}): {format_llm_usage(usage, len(results))}")
+    if args.llm_batch:
+        print("\nLLM requests went out as message batches; per-source LLM usage reads 0 calls, "
+              "batch spend is below")
+    if budget["stages"]:
+        print(f"LLM spend: {LLM_BUDGET.summary()}"
+              + (f"; {budget['total']['refused']} request(s) refused over budget" if budget["exhausted"] else ""))
+        for name, stage in budget["stages"].items():
+            print(f"  {name}: {stage['calls']} call(s), ${stage['cost_usd']:.4f}")
+    if not args.no_cache:
+        enforce_cache_limit(args.cache_dir)
+        enforce_llm_cache_limit()
+        print(f"\n{CACHE_STATS.summary()}")
+    if LLM_STATS.counts["hits"] or LLM_STATS.counts["misses"]:
+        print(LLM_STATS.summary())
+    if EXTRACTION_STATS.counts["pages"]:
+        print(EXTRACTION_STATS.summary())
+    if DOMAIN_VERDICT_STATS.counts["reused"] or DOMAIN_VERDICT_STATS.counts["asked"]:
+        print(DOMAIN_VERDICT_STATS.summary())
 
 
 if __name__ == "__main__":
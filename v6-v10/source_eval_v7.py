@@ -32,24 +32,47 @@ import os
 import re
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
-import requests
-
 # Reuse v6 fetch layer
 from source_eval_v6 import (
+    CACHE_STATS,
+    EXTRACTION_STATS,
+    CACHE_TTLS,
+    DEFAULT_CACHE_DIR,
+    DomainThrottle,
     FetchedDoc,
+    HAS_HTTPX,
     fetch_doc,
+    fetch_docs_async,
+    make_session,
+    thread_session,
+    read_artifact,
+    write_artifact,
     sanitize_url,
     registrable_domain,
     extract_urls,
     clean_text,
     utc_now_iso,
     ensure_dir,
-    HEADERS,
     USER_AGENT,
+    add_cache_backend_args,
+    add_cache_ttl_args,
+    add_llm_args,
+    apply_cache_backend_args,
+    apply_llm_args,
+    enforce_cache_limit,
+    enforce_llm_cache_limit,
+    apply_cache_ttl_args,
+    llm_call,
+    run_llm_batched,
+    LLMDeferred,
+    LLMBudgetExceeded,
+    LLM_BUDGET,
+    LLM_STATS,
 )
 
 # Optional imports
@@ -76,12 +99,15 @@ log = logging.getLogger(__name__)
 
 DEFAULT_TIMEOUT_S = 25
 DEFAULT_SLEEP_S = 0.5
-DEFAULT_CACHE_DIR = ".cache_narrative"
-DEFAULT_CACHE_MAX_AGE = 7 * 24 * 3600  # 7 days
+DEFAULT_CONCURRENCY = 1
+DEFAULT_ASYNC_CONCURRENCY = 32  # Async fetches are cheap; bounded by a semaphore
+FETCH_BACKENDS = ("auto", "async", "sync")
+DEFAULT_CACHE_MAX_AGE = CACHE_TTLS["ok"]  # 7 days
 
 # LLM models
 CLAIM_EXTRACTION_MODEL = "claude-haiku-4-5-20251001"     # Fast, cheap — per-article extraction
 NARRATIVE_CLUSTERING_MODEL = "claude-sonnet-4-20250514"  # Quality — cross-article clustering
+DEFAULT_LLM_CONCURRENCY = 4  # Parallel claim extractions; --llm-rpm / --llm-itpm set the pace
 
 # Max chars of article text to send to LLM for claim extraction
 MAX_ARTICLE_CHARS = 8000
@@ -329,6 +355,7 @@ class NarrativeMap:
     topics: Dict[str, List[NarrativeCluster]] = field(default_factory=dict)
     source_articles: List[SourceArticle] = field(default_factory=list)
     generated_at: str = ""
+    llm_usage: Dict[str, Any] = field(default_factory=dict)  # LLMBudget.to_dict(): spend per stage
 
 
 # =============================================================================
@@ -341,7 +368,18 @@ def get_anthropic_client() -> Optional[Anthropic]:
     key = os.environ.get("ANTHROPIC_API_KEY")
     if not key:
         return None
-    return Anthropic(api_key=key)
+    return Anthropic(api_key=key, max_retries=0)  # llm_call paces and retries
+
+
+def parse_json_array(raw: str) -> List[Any]:
+    """The JSON array in a model reply; raises ValueError when there is none."""
+    match = re.search(r'\[.*\]', raw.strip(), re.DOTALL)
+    if not match:
+        raise ValueError("no JSON array in reply")
+    value = json.loads(match.group())
+    if not isinstance(value, list):
+        raise ValueError("reply is not a JSON array")
+    return value
 
 
 def llm_extract_claims(
@@ -387,18 +425,9 @@ Do NOT editorialize or add analytical conclusions.
 JSON array:"""
 
     try:
-        resp = client.messages.create(
-            model=CLAIM_EXTRACTION_MODEL,
-            max_tokens=2000,
-            messages=[{"role": "user", "content": prompt}],
-        )
-        raw = resp.content[0].text.strip()
-        # Extract JSON array from response
-        match = re.search(r'\[.*\]', raw, re.DOTALL)
-        if match:
-            claims = json.loads(match.group())
-            return claims if isinstance(claims, list) else []
-        return []
+        return llm_call(client, prompt, CLAIM_EXTRACTION_MODEL, 2000, parse_json_array, stage="claim_extraction")
+    except (LLMDeferred, LLMBudgetExceeded):
+        return []  # --llm-batch collection pass, or over --max-llm-tokens / --max-llm-cost
     except Exception as e:
         err_str = str(e)
         log.warning(f"  Claim extraction failed for {article.domain}: {e}")
@@ -462,16 +491,8 @@ Return ONLY a JSON array of cluster objects.
 JSON array:"""
 
     try:
-        resp = client.messages.create(
-            model=NARRATIVE_CLUSTERING_MODEL,
-            max_tokens=4000,
-            messages=[{"role": "user", "content": prompt}],
-        )
-        raw = resp.content[0].text.strip()
-        match = re.search(r'\[.*\]', raw, re.DOTALL)
-        if match:
-            clusters = json.loads(match.group())
-            return clusters if isinstance(clusters, list) else []
+        return llm_call(client, prompt, NARRATIVE_CLUSTERING_MODEL, 4000, parse_json_array, stage="clustering")
+    except (LLMDeferred, LLMBudgetExceeded):
         return []
     except Exception as e:
         log.error(f"  Narrative clustering failed: {e}")
@@ -482,6 +503,33 @@ JSON array:"""
 # Pipeline
 # =============================================================================
 
+def _article_from_doc(url: str, doc: FetchedDoc) -> SourceArticle:
+    """Classify a fetched document and wrap it as a SourceArticle."""
+    domain = doc.domain or registrable_domain(url)
+
+    # Classify source tier
+    tier, tier_note = classify_source_tier(domain, url)
+
+    return SourceArticle(
+        url=url,
+        domain=domain,
+        title=doc.title or "",
+        author=doc.author or "",
+        published=doc.published or "",
+        text=doc.text or "",
+        text_length=len(doc.text or ""),
+        tier=tier,
+        tier_note=tier_note,
+        fetch_status=doc.fetch_status or "unknown",
+        fetch_warnings=doc.warnings,
+    )
+
+
+def _log_article(article: SourceArticle) -> None:
+    status = "OK" if article.fetch_status == "ok" else article.fetch_status
+    log.info(f"    -> {status} | {TIER_LABELS.get(article.tier, article.tier)} | {article.text_length} chars")
+
+
 def fetch_all_articles(
     urls: List[str],
     cache_dir: str = DEFAULT_CACHE_DIR,
@@ -489,59 +537,97 @@ def fetch_all_articles(
     timeout_s: int = DEFAULT_TIMEOUT_S,
     cache_max_age_s: int = DEFAULT_CACHE_MAX_AGE,
     no_cache: bool = False,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    backend: str = "sync",
 ) -> List[SourceArticle]:
-    """Step 1: Fetch all URLs and classify their source tiers."""
-
-    session = requests.Session()
-    session.headers.update(HEADERS)
-    articles = []
-
-    for i, url in enumerate(urls):
-        url = sanitize_url(url)
-        log.info(f"[{i+1}/{len(urls)}] Fetching: {url[:80]}...")
-
-        doc = fetch_doc(session, url, cache_dir, sleep_s, timeout_s, cache_max_age_s, no_cache)
-        domain = doc.domain or registrable_domain(url)
-
-        # Classify source tier
-        tier, tier_note = classify_source_tier(domain, url)
-
-        article = SourceArticle(
-            url=url,
-            domain=domain,
-            title=doc.title or "",
-            author=doc.author or "",
-            published=doc.published or "",
-            text=doc.text or "",
-            text_length=len(doc.text or ""),
-            tier=tier,
-            tier_note=tier_note,
-            fetch_status=doc.fetch_status or "unknown",
-            fetch_warnings=doc.warnings,
-        )
-        articles.append(article)
+    """Step 1: Fetch all URLs and classify their source tiers.
 
-        status = "OK" if doc.fetch_status == "ok" else doc.fetch_status
-        log.info(f"    -> {status} | {TIER_LABELS.get(tier, tier)} | {len(doc.text or '')} chars")
+    With `concurrency` > 1, fetches run in a worker pool and `sleep_s` is
+    enforced per registrable domain rather than after every request.
+    `backend="async"` uses the httpx event-loop path (shared connection pool);
+    the blocking `fetch_doc` path remains the fallback when httpx is missing.
+    "auto" picks async only for concurrent runs, so the default stays sequential.
+    """
+    urls = [sanitize_url(u) for u in urls]
+
+    if backend == "auto":
+        backend = "async" if HAS_HTTPX and concurrency > 1 else "sync"
+    if backend == "async" and not HAS_HTTPX:
+        log.warning("httpx not installed — falling back to synchronous fetching")
+        backend = "sync"
+
+    if backend == "async":
+        workers = concurrency if concurrency > 1 else DEFAULT_ASYNC_CONCURRENCY
+        log.info(f"Fetching asynchronously ({workers} in flight, per-domain spacing: {sleep_s}s)")
+        docs = fetch_docs_async(urls, cache_dir, sleep_s, timeout_s, cache_max_age_s, no_cache, workers)
+        articles = []
+        for i, (url, doc) in enumerate(zip(urls, docs)):
+            log.info(f"[{i+1}/{len(urls)}] {url[:80]}")
+            article = _article_from_doc(url, doc)
+            _log_article(article)
+            articles.append(article)
+        return articles
+
+    if concurrency <= 1:
+        session = make_session()
+        articles = []
+        for i, url in enumerate(urls):
+            log.info(f"[{i+1}/{len(urls)}] Fetching: {url[:80]}...")
+            doc = fetch_doc(session, url, cache_dir, sleep_s, timeout_s, cache_max_age_s, no_cache)
+            article = _article_from_doc(url, doc)
+            _log_article(article)
+            articles.append(article)
+        return articles
+
+    log.info(f"Fetching with {concurrency} workers (per-domain spacing: {sleep_s}s)")
+    throttle = DomainThrottle(sleep_s)
+
+    def fetch_one(url: str) -> SourceArticle:
+        doc = fetch_doc(
+            thread_session(), url, cache_dir, sleep_s, timeout_s, cache_max_age_s, no_cache,
+            throttle=throttle,
+        )
+        article = _article_from_doc(url, doc)
+        log.info(f"  Fetched: {url[:80]}")
+        _log_article(article)
+        return article
 
-    return articles
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        return list(pool.map(fetch_one, urls))
 
 
 def extract_all_claims(
     client: Anthropic,
     articles: List[SourceArticle],
+    cache_dir: str = "",
+    llm_concurrency: int = DEFAULT_LLM_CONCURRENCY,
 ) -> List[Claim]:
-    """Step 3: Extract atomic claims from all fetched articles."""
+    """Step 3: Extract atomic claims from all fetched articles.
+
+    With a `cache_dir`, raw claims are stored as "v7-claims" artifacts keyed by
+    article URL and text, so unchanged articles are not re-sent to the LLM.
+    Up to `llm_concurrency` extractions run at once, paced by the shared LLM
+    rate limiter; claims keep article order.
+    """
     all_claims = []
 
     fetchable = [a for a in articles if a.text and len(a.text) >= 100]
     log.info(f"\nExtracting claims from {len(fetchable)} articles...")
 
-    for i, article in enumerate(fetchable):
-        log.info(f"  [{i+1}/{len(fetchable)}] {article.domain}: {article.title[:60]}...")
+    def claims_for(article: SourceArticle) -> List[Dict[str, Any]]:
+        key = f"{CLAIM_EXTRACTION_MODEL}:{article.url}:{hashlib.sha256(article.text.encode('utf-8')).hexdigest()}"
+        raw_claims = read_artifact(cache_dir, "v7", "claims", key) if cache_dir else None
+        if raw_claims is None:
+            raw_claims = llm_extract_claims(client, article)
+            if cache_dir and raw_claims:
+                write_artifact(cache_dir, "v7", "claims", key, raw_claims)
+        return raw_claims
 
-        raw_claims = llm_extract_claims(client, article)
+    with ThreadPoolExecutor(max_workers=max(1, llm_concurrency)) as pool:
+        extracted = list(pool.map(claims_for, fetchable))
 
+    for i, (article, raw_claims) in enumerate(zip(fetchable, extracted)):
+        log.info(f"  [{i+1}/{len(fetchable)}] {article.domain}: {article.title[:60]}...")
         for rc in raw_claims:
             if not isinstance(rc, dict) or "claim" not in rc:
                 continue
@@ -705,6 +791,7 @@ def narrative_map_to_dict(nm: NarrativeMap) -> Dict[str, Any]:
         "generated_at": nm.generated_at,
         "topics": topics_out,
         "sources": sources_out,
+        "llm_usage": nm.llm_usage,
     }
 
 
@@ -715,6 +802,11 @@ def render_narrative_md(nm: NarrativeMap) -> str:
     lines.append(f"\n*Generated: {nm.generated_at}*")
     lines.append(f"\n**Sources:** {nm.total_sources} total | {nm.sources_fetched} fetched | {nm.sources_failed} failed")
     lines.append(f"**Topics:** {len(nm.topics)} | **Clusters:** {sum(len(v) for v in nm.topics.values())}")
+    if nm.llm_usage.get("stages"):
+        total = nm.llm_usage["total"]
+        stages = ", ".join(f"{name} ${s['cost_usd']:.4f}" for name, s in nm.llm_usage["stages"].items())
+        lines.append(f"**LLM spend:** {total['tokens']} tokens, ${total['cost_usd']:.4f} ({stages})"
+                     + (" — budget reached, some steps skipped" if nm.llm_usage["exhausted"] else ""))
 
     # Source tier summary
     tier_counts = {}
@@ -772,19 +864,32 @@ def run_narrative_pipeline(
     no_cache: bool = False,
     out_json: str = "",
     out_md: str = "",
+    concurrency: int = DEFAULT_CONCURRENCY,
+    fetch_backend: str = "auto",
+    llm_concurrency: int = DEFAULT_LLM_CONCURRENCY,
+    llm_batch: bool = False,
 ) -> NarrativeMap:
-    """Run the full narrative clustering pipeline."""
+    """Run the full narrative clustering pipeline.
+
+    With `llm_batch`, claim extraction goes out as one message batch and
+    clustering as a second (see run_llm_batched).
+    """
 
     # Step 1: Fetch all articles
     log.info(f"Fetching {len(urls)} source(s)...\n")
     articles = fetch_all_articles(
         urls, cache_dir, sleep_s, timeout_s,
-        DEFAULT_CACHE_MAX_AGE, no_cache,
+        DEFAULT_CACHE_MAX_AGE, no_cache, concurrency, fetch_backend,
     )
 
     fetched = [a for a in articles if a.text and len(a.text) >= 100]
     failed = [a for a in articles if not a.text or len(a.text) < 100]
     log.info(f"\nFetch complete: {len(fetched)} succeeded, {len(failed)} failed")
+    if not no_cache:
+        enforce_cache_limit(cache_dir)
+        log.info(CACHE_STATS.summary())
+    if EXTRACTION_STATS.counts["pages"]:
+        log.info(EXTRACTION_STATS.summary())
 
     if failed:
         for a in failed:
@@ -806,9 +911,13 @@ def run_narrative_pipeline(
         _write_outputs(nm, out_json, out_md)
         return nm
 
+    def batched(step):
+        return run_llm_batched(client, step) if llm_batch else step()
+
     # Step 3: Extract claims
     try:
-        all_claims = extract_all_claims(client, articles)
+        all_claims = batched(lambda: extract_all_claims(
+            client, articles, "" if no_cache else cache_dir, llm_concurrency))
     except RuntimeError as e:
         log.error(str(e))
         # Write partial output with error flag
@@ -829,7 +938,15 @@ def run_narrative_pipeline(
         return nm
 
     # Step 4-5: Cluster and build narrative map
-    nm = cluster_claims(client, all_claims, articles, country)
+    nm = batched(lambda: cluster_claims(client, all_claims, articles, country))
+    if not no_cache:
+        enforce_llm_cache_limit()
+    if LLM_STATS.counts["hits"] or LLM_STATS.counts["misses"]:
+        log.info(LLM_STATS.summary())
+    LLM_BUDGET.write()
+    nm.llm_usage = LLM_BUDGET.to_dict()
+    if nm.llm_usage["stages"]:
+        log.info(f"LLM spend: {LLM_BUDGET.summary()}")
 
     # Write outputs
     _write_outputs(nm, out_json, out_md)
@@ -857,19 +974,36 @@ def _write_outputs(nm: NarrativeMap, out_json: str, out_md: str):
 
 def parse_args(argv=None):
     p = argparse.ArgumentParser(description="Source Evaluator v7 — Narrative Clustering")
-    p.add_argument("--works-cited", required=True, help="Path to file with URLs (one per line or works-cited format)")
+    p.add_argument("--works-cited", default="", help="Path to file with URLs (one per line or works-cited format)")
     p.add_argument("--country", default="", help="Country/region name for context")
     p.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR)
     p.add_argument("--out-json", default="", help="Output JSON path")
     p.add_argument("--out-md", default="", help="Output Markdown path")
     p.add_argument("--sleep-s", type=float, default=DEFAULT_SLEEP_S)
     p.add_argument("--timeout-s", type=int, default=DEFAULT_TIMEOUT_S)
+    p.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY,
+                   help="Parallel fetch workers; --sleep-s then applies per domain (default: 1)")
+    p.add_argument("--fetch-backend", choices=FETCH_BACKENDS, default="auto",
+                   help="async = httpx connection pool, sync = blocking fetch_doc, "
+                        "auto = async when --concurrency > 1 and httpx is installed")
+    p.add_argument("--llm-concurrency", type=int, default=DEFAULT_LLM_CONCURRENCY,
+                   help=f"Parallel claim extraction requests (default: {DEFAULT_LLM_CONCURRENCY})")
     p.add_argument("--no-cache", action="store_true")
+    add_cache_ttl_args(p)
+    add_cache_backend_args(p)
+    add_llm_args(p)
     return p.parse_args(argv)
 
 
 def main(argv=None):
     args = parse_args(argv)
+    apply_cache_ttl_args(args)
+    apply_llm_args(args)
+    if apply_cache_backend_args(args):
+        return
+    if not args.works_cited:
+        log.error("--works-cited is required.")
+        sys.exit(2)
 
     # Read URLs
     with open(args.works_cited, "r", encoding="utf-8") as f:
@@ -894,6 +1028,10 @@ def main(argv=None):
         no_cache=args.no_cache,
         out_json=args.out_json,
         out_md=args.out_md,
+        concurrency=args.concurrency,
+        fetch_backend=args.fetch_backend,
+        llm_concurrency=args.llm_concurrency,
+        llm_batch=args.llm_batch,
     )
 
 
@@ -0,0 +1,6 @@
+import os
+import sys
+
+# The evaluators are scripts, not a package: import them from v6-v10/
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -0,0 +1,186 @@
+"""Local stand-in for the Anthropic Messages API, for tests.
+
+LLMStub serves POST /v1/messages on 127.0.0.1. Queue scripted failures
+with `fail()`; once the script is exhausted every request succeeds with a
+short text answer. Each request's arrival time and body are kept in
+`requests` so tests can check pacing and retries.
+
+It also serves the message batches endpoints (create, retrieve, results).
+A batch reports "in_progress" for its first `batch_polls` retrievals, then
+"ended"; `fail_batch()` makes a request's entry come back errored or
+expired. Created batches are kept in `batches`.
+
+    with LLMStub() as stub:
+        stub.fail(429, retry_after=0.5)
+        client = stub.client()
+"""
+
+import itertools
+import json
+import re
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from anthropic import Anthropic
+
+ERROR_TYPES = {429: "rate_limit_error", 529: "overloaded_error", 500: "api_error"}
+
+
+class LLMStub:
+    def __init__(self, input_tokens: Optional[int] = None, answer: str = '{"ok": true}', batch_polls: int = 1):
+        self.input_tokens = input_tokens  # Reported usage; None = prompt length / 4
+        self.answer = answer
+        self.batch_polls = batch_polls
+        self.requests: List[Tuple[float, Dict[str, Any]]] = []
+        self.batches: Dict[str, Dict[str, Any]] = {}
+        self._script: Deque[Dict[str, Any]] = deque()
+        self._batch_failures: Dict[str, str] = {}
+        self._batch_ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def client(self) -> Anthropic:
+        """A client configured like get_anthropic_client (llm_create owns retries)."""
+        return Anthropic(api_key="test", base_url=self.url, max_retries=0)
+
+    def fail(self, status: int, retry_after: Optional[float] = None, times: int = 1) -> None:
+        """Answer the next `times` requests with an error `status`."""
+        with self._lock:
+            self._script.extend({"status": status, "retry_after": retry_after} for _ in range(times))
+
+    def stall(self, seconds: float, times: int = 1) -> None:
+        """Delay the next `times` answers by `seconds` (client timeouts)."""
+        with self._lock:
+            self._script.extend({"stall": seconds} for _ in range(times))
+
+    def fail_batch(self, custom_id: str, result: str = "errored") -> None:
+        """Make `custom_id`'s entry in the next batch holding it "errored" or "expired"."""
+        with self._lock:
+            self._batch_failures[custom_id] = result
+
+    def times(self) -> List[float]:
+        return [t for t, _ in self.requests]
+
+    def __enter__(self) -> "LLMStub":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _next(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        with self._lock:
+            self.requests.append((time.monotonic(), body))
+            return self._script.popleft() if self._script else {}
+
+    def _message(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        prompt = body["messages"][0]["content"]
+        n_in = self.input_tokens if self.input_tokens is not None else len(prompt) // 4
+        return {
+            "id": "msg_stub", "type": "message", "role": "assistant", "model": body["model"],
+            "content": [{"type": "text", "text": self.answer}],
+            "stop_reason": "end_turn", "stop_sequence": None,
+            "usage": {"input_tokens": n_in, "output_tokens": len(self.answer) // 4},
+        }
+
+    def _create_batch(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        with self._lock:
+            batch_id = f"msgbatch_stub{next(self._batch_ids)}"
+            results = {r["custom_id"]: self._batch_failures.pop(r["custom_id"], "succeeded") for r in body["requests"]}
+            self.batches[batch_id] = {"requests": body["requests"], "results": results, "polls": self.batch_polls}
+        return self._batch(batch_id, poll=False)
+
+    def _batch(self, batch_id: str, poll: bool = True) -> Dict[str, Any]:
+        with self._lock:
+            batch = self.batches[batch_id]
+            ended = batch["polls"] <= 0
+            if poll:
+                batch["polls"] -= 1
+            counts = {"processing": 0, "succeeded": 0, "errored": 0, "canceled": 0, "expired": 0}
+            if ended:
+                for result in batch["results"].values():
+                    counts[result] += 1
+            else:
+                counts["processing"] = len(batch["requests"])
+        return {
+            "id": batch_id, "type": "message_batch", "processing_status": "ended" if ended else "in_progress",
+            "request_counts": counts, "created_at": "2026-01-01T00:00:00Z", "expires_at": "2026-01-02T00:00:00Z",
+            "ended_at": "2026-01-01T00:01:00Z" if ended else None, "archived_at": None, "cancel_initiated_at": None,
+            "results_url": f"{self.url}/v1/messages/batches/{batch_id}/results" if ended else None,
+        }
+
+    def _batch_results(self, batch_id: str) -> bytes:
+        batch = self.batches[batch_id]
+        lines = []
+        for req in batch["requests"]:
+            kind = batch["results"][req["custom_id"]]
+            if kind == "succeeded":
+                result = {"type": "succeeded", "message": self._message(req["params"])}
+            elif kind == "errored":
+                result = {"type": "errored", "error": {"type": "error",
+                                                       "error": {"type": "api_error", "message": "stub"}}}
+            else:
+                result = {"type": kind}
+            lines.append(json.dumps({"custom_id": req["custom_id"], "result": result}))
+        return ("\n".join(lines) + "\n").encode()
+
+    def _handler(self) -> type:
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args: Any) -> None:
+                pass
+
+            def send_json(self, obj: Any, status: int = 200, headers: Optional[Dict[str, str]] = None) -> None:
+                data = obj if isinstance(obj, bytes) else json.dumps(obj).encode()
+                try:
+                    self.send_response(status)
+                    self.send_header("content-type", "application/json")
+                    self.send_header("content-length", str(len(data)))
+                    for name, value in (headers or {}).items():
+                        self.send_header(name, value)
+                    self.end_headers()
+                    self.wfile.write(data)
+                except (BrokenPipeError, ConnectionResetError):
+                    pass  # Client gave up (timeout test)
+
+            def not_found(self) -> None:
+                self.send_json({"type": "error", "error": {"type": "not_found_error", "message": self.path}}, 404)
+
+            def do_GET(self) -> None:
+                m = re.fullmatch(r"/v1/messages/batches/(\w+)(/results)?", self.path.split("?")[0])
+                if not m or m.group(1) not in stub.batches:
+                    return self.not_found()
+                if m.group(2):
+                    return self.send_json(stub._batch_results(m.group(1)))
+                self.send_json(stub._batch(m.group(1)))
+
+            def do_POST(self) -> None:
+                body = json.loads(self.rfile.read(int(self.headers["content-length"])) or b"{}")
+                path = self.path.split("?")[0].rstrip("/")
+                if path == "/v1/messages/batches":
+                    return self.send_json(stub._create_batch(body))
+                if path != "/v1/messages":
+                    return self.not_found()
+                step = stub._next(body)
+                if "stall" in step:
+                    time.sleep(step["stall"])
+                status = step.get("status")
+                if status:
+                    headers = {}
+                    if step.get("retry_after") is not None:
+                        headers["retry-after"] = str(step["retry_after"])
+                    error = {"type": ERROR_TYPES.get(status, "api_error"), "message": "stub"}
+                    return self.send_json({"type": "error", "error": error}, status, headers)
+                self.send_json(stub._message(body))
+
+        return Handler
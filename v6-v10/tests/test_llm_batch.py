@@ -0,0 +1,129 @@
+"""submit_llm_batch / run_llm_batched against the local message batches stub."""
+
+import pytest
+
+pytest.importorskip("anthropic")
+
+import source_eval_v6 as v6
+from llm_stub import LLMStub
+
+MODEL = v6.DEFAULT_LLM_MODEL
+
+
+@pytest.fixture(autouse=True)
+def batch_env(monkeypatch, tmp_path):
+    monkeypatch.setattr(v6, "LLM_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(v6, "LLM_BATCH_POLL_S", 0.01)
+    monkeypatch.setattr(v6, "LLM_STATS", v6.LLMStats())
+    monkeypatch.setattr(v6, "LLM_BUDGET", v6.LLMBudget())
+    monkeypatch.setattr(v6, "LLM_LIMITER", v6.LLMRateLimiter())
+
+
+def requests_for(prompts):
+    collector = v6.LLMBatchCollector(set())
+    for prompt in prompts:
+        collector.defer(v6.llm_cache_key(MODEL, prompt, 50), prompt, MODEL, 50, stage="test")
+    return [collector.requests[key] for key in sorted(collector.requests)], collector.stages
+
+
+def ask(client, prompt):
+    """An llm_call site: a deferred request falls back to None."""
+    try:
+        return v6.llm_call(client, prompt, MODEL, 50, v6.parse_json_reply, stage="test")
+    except v6.LLMDeferred:
+        return None
+
+
+def test_batch_answers_land_in_the_llm_cache():
+    prompts = ["a", "b", "c"]
+    with LLMStub(batch_polls=2) as stub:
+        client = stub.client()
+        reqs, stages = requests_for(prompts)
+        assert v6.submit_llm_batch(client, reqs, stages) == 3
+        assert [ask(client, p) for p in prompts] == [{"ok": True}] * 3
+    assert not stub.requests  # Answered from the cache, no direct calls
+    assert len(stub.batches) == 1
+    assert v6.LLM_STATS.counts["batched"] == 3
+    assert v6.LLM_BUDGET.to_dict()["stages"]["test"]["calls"] == 3
+
+
+def test_interrupted_batch_is_resumed_from_its_checkpoint(monkeypatch):
+    reqs, stages = requests_for(["a", "b"])
+    with LLMStub(batch_polls=5) as stub:
+        client = stub.client()
+        with monkeypatch.context() as m:
+            def interrupt(seconds):
+                raise KeyboardInterrupt
+            m.setattr(v6.time, "sleep", interrupt)
+            with pytest.raises(KeyboardInterrupt):
+                v6.submit_llm_batch(client, reqs, stages)
+        assert len(stub.batches) == 1
+
+        assert v6.submit_llm_batch(client, reqs, stages) == 2
+        assert len(stub.batches) == 1  # Picked up, not paid for twice
+
+        # Once ended, the checkpoint no longer applies to the same request set
+        v6.submit_llm_batch(client, reqs, stages)
+        assert len(stub.batches) == 2
+
+
+def test_chunks_respect_request_and_byte_limits(monkeypatch):
+    reqs, _ = requests_for([f"prompt {i}" for i in range(5)])
+    monkeypatch.setattr(v6, "LLM_BATCH_MAX_REQUESTS", 2)
+    assert [len(c) for c in v6._llm_batch_chunks(reqs)] == [2, 2, 1]
+
+    monkeypatch.setattr(v6, "LLM_BATCH_MAX_REQUESTS", 100)
+    monkeypatch.setattr(v6, "LLM_BATCH_MAX_BYTES", 1)  # Every request alone, none dropped
+    assert [len(c) for c in v6._llm_batch_chunks(reqs)] == [1] * 5
+
+
+def test_run_llm_batched_splits_a_round_into_chunks(monkeypatch):
+    monkeypatch.setattr(v6, "LLM_BATCH_MAX_REQUESTS", 2)
+    prompts = [f"prompt {i}" for i in range(5)]
+    with LLMStub() as stub:
+        client = stub.client()
+        result = v6.run_llm_batched(client, lambda: [ask(client, p) for p in prompts])
+    assert result == [{"ok": True}] * 5
+    assert sorted(len(b["requests"]) for b in stub.batches.values()) == [1, 2, 2]
+    assert not stub.requests
+
+
+def test_follow_up_requests_go_out_in_a_later_round():
+    with LLMStub() as stub:
+        client = stub.client()
+
+        def run_pass():
+            first = ask(client, "first")
+            return first, ask(client, f"follow up on {first}") if first else None
+
+        result = v6.run_llm_batched(client, run_pass)
+    assert result == ({"ok": True}, {"ok": True})
+    assert len(stub.batches) == 2
+
+
+def test_errored_and_expired_entries_fall_back_and_are_not_resubmitted():
+    prompts = ["ok", "errored", "expired"]
+    reqs, _ = requests_for(prompts)
+    ids = {p: v6.llm_cache_key(MODEL, p, 50) for p in prompts}
+    with LLMStub() as stub:
+        client = stub.client()
+        stub.fail_batch(ids["errored"], "errored")
+        stub.fail_batch(ids["expired"], "expired")
+        result = v6.run_llm_batched(client, lambda: [ask(client, p) for p in prompts])
+        assert result == [{"ok": True}, None, None]
+        assert len(stub.batches) == 1
+        assert v6.LLM_STATS.counts["batched"] == 1
+        assert v6.LLM_STATS.counts["batch_failed"] == 2
+
+        # The next run asks only for what is still missing
+        result = v6.run_llm_batched(client, lambda: [ask(client, p) for p in prompts])
+    assert result == [{"ok": True}] * 3
+    assert len(stub.batches) == 2
+    assert len(stub.batches["msgbatch_stub2"]["requests"]) == 2
+    assert not stub.requests
+
+
+def test_run_llm_batched_needs_the_llm_cache(monkeypatch):
+    monkeypatch.setattr(v6, "LLM_CACHE_DIR", "")
+    with pytest.raises(ValueError):
+        v6.run_llm_batched(None, lambda: None)
@@ -0,0 +1,108 @@
+"""llm_create / LLMRateLimiter against the local Messages stub."""
+
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("anthropic")
+
+import source_eval_v6 as v6
+from llm_stub import LLMStub
+
+MODEL = v6.DEFAULT_LLM_MODEL
+
+
+@pytest.fixture(autouse=True)
+def fresh_limiter(monkeypatch):
+    monkeypatch.setattr(v6, "LLM_LIMITER", v6.LLMRateLimiter())
+    monkeypatch.setattr(v6, "LLM_STATS", v6.LLMStats())
+    monkeypatch.setattr(v6, "LLM_RPM", 0)
+    monkeypatch.setattr(v6, "LLM_ITPM", 0)
+    monkeypatch.setattr(v6, "LLM_MAX_RETRIES", 3)
+    monkeypatch.setattr(v6, "LLM_BACKOFF_BASE_S", 0.01)  # retry-after dominates
+    monkeypatch.setattr(v6, "LLM_TIMEOUT_S", 5.0)
+
+
+def test_retries_429_and_529_after_retry_after():
+    with LLMStub() as stub:
+        stub.fail(429, retry_after=0.3)
+        stub.fail(529, retry_after=0.2)
+        response = v6.llm_create(stub.client(), "prompt", MODEL, 50)
+    t = stub.times()
+    assert response.content[0].text == '{"ok": true}'
+    assert len(t) == 3
+    assert t[1] - t[0] >= 0.3
+    assert t[2] - t[1] >= 0.2
+    assert v6.LLM_STATS.counts["retries"] == 2
+    assert v6.LLM_STATS.counts["rate_limited"] == 2
+
+
+def test_gives_up_after_max_retries():
+    with LLMStub() as stub:
+        stub.fail(429, retry_after=0, times=4)
+        with pytest.raises(Exception) as err:
+            v6.llm_create(stub.client(), "prompt", MODEL, 50)
+    assert getattr(err.value, "status_code", None) == 429
+    assert len(stub.requests) == v6.LLM_MAX_RETRIES + 1
+
+
+def test_client_errors_are_not_retried():
+    with LLMStub() as stub:
+        stub.fail(400)
+        with pytest.raises(Exception):
+            v6.llm_create(stub.client(), "prompt", MODEL, 50)
+    assert len(stub.requests) == 1
+
+
+def test_timeout_is_retried(monkeypatch):
+    monkeypatch.setattr(v6, "LLM_TIMEOUT_S", 0.3)
+    with LLMStub() as stub:
+        stub.stall(1.0)
+        response = v6.llm_create(stub.client(), "prompt", MODEL, 50)
+    assert response.content[0].text == '{"ok": true}'
+    assert len(stub.requests) == 2
+    assert v6.LLM_STATS.counts["retries"] == 1
+    assert v6.LLM_STATS.counts["rate_limited"] == 0
+
+
+def test_rate_limit_pauses_every_caller():
+    """A 429 seen by one thread holds back requests other threads start during the pause."""
+    with LLMStub() as stub:
+        stub.fail(429, retry_after=0.6)
+        client = stub.client()
+        first = threading.Thread(target=v6.llm_create, args=(client, "first", MODEL, 50))
+        first.start()
+        while not stub.requests:
+            time.sleep(0.01)
+        time.sleep(0.1)  # The 429 is back and the model is paused
+        v6.llm_create(client, "second", MODEL, 50)
+        first.join()
+    t0 = stub.times()[0]
+    later = [(t, body["messages"][0]["content"]) for t, body in stub.requests[1:]]
+    assert sorted(p for _, p in later) == ["first", "second"]
+    assert all(t - t0 >= 0.6 for t, _ in later)
+
+
+def test_requests_per_minute_spacing(monkeypatch):
+    monkeypatch.setattr(v6, "LLM_RPM", 600)  # One request every 0.1s, no burst
+    with LLMStub() as stub:
+        client = stub.client()
+        for i in range(4):
+            v6.llm_create(client, f"p{i}", MODEL, 50)
+    t = stub.times()
+    assert all(b - a >= 0.09 for a, b in zip(t, t[1:]))
+
+
+def test_input_token_bucket_settles_on_reported_usage(monkeypatch):
+    monkeypatch.setattr(v6, "LLM_ITPM", 60_000)  # 1000 input tokens/s
+    prompt = "x" * 396  # Estimated at 100 tokens
+    with LLMStub(input_tokens=1000) as stub:
+        start = time.monotonic()
+        v6.llm_create(stub.client(), prompt, MODEL, 50)
+    bucket = v6.LLM_LIMITER._buckets[(MODEL, "input_tokens")]
+    # Charged the reported 1000 tokens (1s of budget), not the 100 estimated
+    assert bucket.next_free - start == pytest.approx(1.0, abs=0.2)
+
+    v6.LLM_LIMITER.settle(MODEL, 1000, 500)
+    assert bucket.next_free - start == pytest.approx(0.5, abs=0.2)